@@ -5,4 +5,5 @@ from .client import *
 from .gateway import *
 from .models import *
 from .rest import *
+from .telemetry import *
 from .typings import *
@@ -1,20 +1,45 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import logging
 import signal
+from concurrent.futures import Executor
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TypeVar
 
-import aiohttp
 import attr
 
-from .gateway import Collector, Event, Gateway, Listener
-from .models import IntentsBuilder, MessageBuilder, Snowflake
-from .rest import RESTClient
-from .utils import ensure_loop
+from .gateway import (
+    Collector,
+    DispatchStats,
+    Event,
+    Gateway,
+    InteractionScheduler,
+    Listener,
+)
+from .models import (
+    AllowedMentions,
+    Broadcast,
+    IntentsBuilder,
+    MessageBuilder,
+    Snowflake,
+)
+from .models.cacheable import CacheableMeta
+from .rest import HTTPOptions, Priority, ResponseCache, RESTClient, Route
+from .telemetry import (
+    Counter,
+    Gauge,
+    Histogram,
+    Metric,
+    MetricsServer,
+    Registry,
+    Tracer,
+)
+from .utils import dumps, ensure_loop
 
 if TYPE_CHECKING:
-    from .models import User
+    from .models import ActionRow, EmbedBuilder, File, User
 
     Callback = Callable[..., Any]
     Check = Callable[..., bool]
@@ -22,6 +47,7 @@ if TYPE_CHECKING:
     T = TypeVar("T")
 
 __all__ = ("GatewayClient",)
+_log = logging.getLogger(__name__)
 
 
 @attr.s(slots=True)
@@ -45,6 +71,28 @@ class GatewayClient:
     intents: :class:`int`
         The intents to identify with when connecting to the gateway.
 
+    tracer: :class:`.Tracer`
+        The tracer used to trace dispatches and requests. Disabled by default.
+
+    api: :class:`str`
+        The base url of the RESTful API. Defaults to :attr:`.Route.BASE`.
+
+    http: :class:`.HTTPOptions`
+        The connection pool and timeout options of the RESTClient.
+
+    cache: None | :class:`.ResponseCache`
+        The cache of GET responses used by the RESTClient. Disabled by default.
+
+    executor: None | :class:`concurrent.futures.Executor`
+        The executor blocking helpers are ran in, see :meth:`run_blocking`.
+        Defaults to the loop's default executor.
+
+    defer_after: None | :class:`float`
+        The seconds interaction handlers have to respond before the interaction
+        is deferred, see :class:`.InteractionScheduler`. None disables deferring.
+        Handlers which may respond with a modal have to do so within this time,
+        deferred interactions can't be responded to with a modal.
+
     Attributes
     ----------
     loop: :class:`asyncio.AbstractEventLoop`
@@ -61,22 +109,107 @@ class GatewayClient:
 
     dispatcher: :class:`.Dispatcher`
         The dispatch manager for the client.
+
+    stats: :class:`.DispatchStats`
+        The statistics of the events and listeners dispatched by the client.
+
+    metrics: :class:`.Registry`
+        The metrics registry of the client. See :meth:`serve_metrics`.
+
+    tracer: :class:`.Tracer`
+        The tracer used to trace dispatches and requests.
+
+    interactions: :class:`.InteractionScheduler`
+        The scheduler of component callbacks and deferred responses.
     """
 
     token: str = attr.field(repr=False)
     intents: IntentsBuilder = attr.field(kw_only=True, default=IntentsBuilder.default())
     no_chunk: bool = attr.field(kw_only=True, default=False, repr=True)
     loop: asyncio.AbstractEventLoop = attr.field(kw_only=True, default=None, repr=False)
+    tracer: Tracer = attr.field(kw_only=True, factory=Tracer, repr=False)
+    api: str = attr.field(kw_only=True, default=Route.BASE, repr=False)
+    http: HTTPOptions = attr.field(kw_only=True, factory=HTTPOptions, repr=False)
+    cache: None | ResponseCache = attr.field(kw_only=True, default=None, repr=False)
+    executor: None | Executor = attr.field(kw_only=True, default=None, repr=False)
+    defer_after: None | float = attr.field(kw_only=True, default=2.0, repr=False)
 
     rest: RESTClient = attr.field(init=False, repr=False)
     gateway: Gateway = attr.field(init=False, repr=False)
     closed: bool = attr.field(init=False, default=False, repr=True)
+    stats: DispatchStats = attr.field(init=False, factory=DispatchStats, repr=False)
+    metrics: Registry = attr.field(init=False, factory=Registry, repr=False)
+    interactions: InteractionScheduler = attr.field(init=False, repr=False)
 
     user: None | User = attr.field(init=False, default=None, repr=False)
 
     def __attrs_post_init__(self) -> None:
-        self.rest = RESTClient(self.token, self)
+        self.rest = RESTClient(
+            self.token, self, base=self.api, http=self.http, cache=self.cache
+        )
         self.gateway = Gateway(self)
+        self.interactions = InteractionScheduler(self, self.defer_after)
+        self.metrics.collector(self._collect_metrics)
+
+    def _collect_metrics(self) -> Iterator[Metric[Any]]:
+        latency = Gauge("rin_gateway_latency_seconds", "Latency of gateway heartbeats.")
+        latency.set(self.gateway.latency)
+
+        size = Gauge("rin_cache_size", "Items in a model cache.", ("cache",))
+        hits = Counter("rin_cache_hits_total", "Model cache lookups hit.", ("cache",))
+        misses = Counter(
+            "rin_cache_misses_total", "Model cache lookups missed.", ("cache",)
+        )
+
+        for name, cache in CacheableMeta.caches.items():
+            size.set(len(cache.root), cache=name)
+            hits.inc(cache.hits, cache=name)
+            misses.inc(cache.misses, cache=name)
+
+        labels = ("event", "listener")
+        calls = Counter("rin_listener_calls_total", "Listener calls started.", labels)
+        errors = Counter("rin_listener_errors_total", "Listener calls raised.", labels)
+        in_flight = Gauge("rin_listener_in_flight", "Listener calls running.", labels)
+        seconds = Histogram("rin_listener_latency_seconds", "Listener latency.", labels)
+
+        for (event, listener), stats in self.stats.listeners.items():
+            calls.inc(stats.calls, event=event, listener=listener)
+            errors.inc(stats.errors, event=event, listener=listener)
+            in_flight.set(stats.in_flight, event=event, listener=listener)
+            seconds.values[(event, listener)] = stats.latency
+
+        yield from (latency, size, hits, misses, calls, errors, in_flight, seconds)
+
+    async def run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs a blocking function in the client's :attr:`executor`.
+
+        Used for CPU-bound helpers, like MIME detection and base64 encoding,
+        so they don't block the loop.
+
+        .. code:: python
+
+            uri = await client.run_blocking(rin.utils.data_uri, image)
+
+        Parameters
+        ----------
+        func: Callable[..., T]
+            The function to run.
+
+        args: Any
+            The arguments to pass to the function.
+
+        kwargs: Any
+            The keyword arguments to pass to the function.
+
+        Returns
+        -------
+        T
+            The return of the function.
+        """
+        loop = self.loop or asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
 
     async def start(self) -> None:
         """Starts the connection.
@@ -113,9 +246,8 @@ class GatewayClient:
             The reason to close the client with.
         """
         self.closed = True
-        session: aiohttp.ClientSession = self.rest.session
 
-        await session.close()
+        await self.rest.close()
         await self.gateway.close()
 
     def sender(self, snowflake: Snowflake | int) -> MessageBuilder:
@@ -133,6 +265,81 @@ class GatewayClient:
         """
         return MessageBuilder(self, snowflake)
 
+    def broadcast(
+        self,
+        channels: Iterable[Snowflake | int],
+        content: None | str = None,
+        *,
+        tts: bool = False,
+        embeds: list[EmbedBuilder] = [],
+        files: list[File] = [],
+        rows: list[ActionRow] = [],
+        mentions: AllowedMentions = AllowedMentions(),
+        concurrency: int = 10,
+        priority: Priority = Priority.LOW,
+        completed: Iterable[int] = (),
+    ) -> Broadcast:
+        """Creates a :class:`.Broadcast` of a message to many channels.
+
+        The message is serialized once. Nothing is sent until the broadcast is
+        iterated, or ran with :meth:`.Broadcast.run`.
+
+        .. code:: python
+
+            async for result in client.broadcast(channels, "Hello!", concurrency=20):
+                ...
+
+        Parameters
+        ----------
+        channels: Iterable[:class:`.Snowflake` | :class:`int`]
+            The snowflakes of the channels to send to.
+
+        content: None | :class:`str`
+            The content to give the message.
+
+        tts: :class:`bool`
+            If the message should be sent with text-to-speech.
+
+        embeds: :class:`list`
+            A list of :class:`.EmbedBuilder` instances to send with the message.
+
+        files: :class:`list`
+            A list of :class:`.File` instances to send with the message.
+
+        rows: :class:`list`
+            A list of :class:`.ActionRow` instances to send with the message.
+
+        mentions: :class:`.AllowedMentions`
+            The allowed mentions of the message.
+
+        concurrency: :class:`int`
+            The max amount of requests running at once.
+
+        priority: :class:`.Priority`
+            The priority of the requests.
+
+        completed: Iterable[:class:`int`]
+            Channels already sent to, used to resume an earlier broadcast.
+
+        Returns
+        -------
+        :class:`.Broadcast`
+            The created broadcast.
+        """
+        payload = MessageBuilder.payload(
+            content, tts, embeds, rows, None, mentions, len(files)
+        )
+
+        return Broadcast(
+            self,
+            channels,  # type: ignore
+            dumps(payload),
+            files=files,
+            concurrency=concurrency,
+            priority=priority,
+            completed=completed,  # type: ignore
+        )
+
     def unserialize(self, data: dict[Any, Any], *, cls: type[T]) -> T:
         """Un-serializes a serialized object. Used for persistent objects.
 
@@ -181,6 +388,66 @@ class GatewayClient:
         """
         return event.dispatch(*payload, client=self)
 
+    def snapshot(self) -> dict[str, Any]:
+        """Creates a snapshot of the client's dispatch statistics.
+
+        Each event and listener has its call count, error count, in-flight
+        count and a latency histogram, in seconds.
+
+        Returns
+        -------
+        :class:`dict`
+            The snapshot of the statistics. See :meth:`.DispatchStats.snapshot`.
+        """
+        return self.stats.snapshot()
+
+    async def serve_metrics(
+        self, host: str = "127.0.0.1", port: int = 9090
+    ) -> MetricsServer:
+        """Serves the client's metrics in the Prometheus text format.
+
+        Parameters
+        ----------
+        host: :class:`str`
+            The host to bind to.
+
+        port: :class:`int`
+            The port to bind to. ``0`` binds to a random free port.
+
+        Returns
+        -------
+        :class:`.MetricsServer`
+            The started server, the metrics are served at :attr:`.MetricsServer.url`.
+        """
+        server = MetricsServer(self.metrics, host, port)
+        await server.start()
+
+        return server
+
+    async def on_error(
+        self, event: Event[Any], listener: Listener | Collector, error: Exception
+    ) -> None:
+        """Called when a listener raises an exception.
+
+        By default the exception is logged. Override this in a subclass
+        to handle errors differently.
+
+        Parameters
+        ----------
+        event: :class:`.Event`
+            The event being dispatched.
+
+        listener: :class:`.Listener` | :class:`.Collector`
+            The listener which raised the exception.
+
+        error: :class:`Exception`
+            The exception raised.
+        """
+        _log.error(
+            f"IGNORING EXCEPTION IN LISTENER {listener.callback!r} FOR {event}",
+            exc_info=error,
+        )
+
     def collect(
         self,
         event: Event[Any],
@@ -1,3 +1,6 @@
 from .event import *
 from .handler import *
 from .parser import *
+from .recorder import *
+from .scheduler import *
+from .stats import *
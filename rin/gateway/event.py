@@ -4,7 +4,7 @@ import asyncio
 import functools
 import inspect
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Generic, Literal, TypeVar
 
 import attr
 
@@ -104,9 +104,8 @@ class Collector:
     async def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return await self.callback(*args, **kwargs)
 
-    async def dispatch(self, *args: Any, **kwargs: Any) -> None | asyncio.Task[Any]:
+    async def dispatch(self, *args: Any, **kwargs: Any) -> Any:
         self.recent_dispatch = datetime.utcnow()
-        loop = asyncio.get_running_loop()
         client = kwargs.get("client")
 
         if self.queue.qsize() == 0:
@@ -127,9 +126,9 @@ class Collector:
             payload = list(zip(*items))
 
             if client is not None:
-                return loop.create_task(self(client, *payload))
+                return await self(client, *payload)
 
-            return loop.create_task(self(*payload))
+            return await self(*payload)
 
 
 @attr.s(slots=True)
@@ -167,7 +166,9 @@ class Event(Generic[T]):
             if listener.in_class:
                 partial = functools.partial(listener, client)
 
-            tasks.append(client.loop.create_task(partial(*payload)))
+            tasks.append(
+                client.loop.create_task(self.invoke(client, listener, partial(*payload)))
+            )
 
             if listener.once is True:
                 self.listeners.pop(index)
@@ -185,12 +186,49 @@ class Event(Generic[T]):
                 continue
 
             cls = client if collector.in_class else None
-            tasks.append(
-                client.loop.create_task(collector.dispatch(*payload, client=cls))
-            )
+            coro = collector.dispatch(*payload, client=cls)
+
+            tasks.append(client.loop.create_task(self.invoke(client, collector, coro)))
 
         return tasks
 
+    async def invoke(
+        self,
+        client: GatewayClient,
+        listener: Listener | Collector,
+        coro: Coroutine[Any, Any, Any],
+    ) -> Any:
+        """Runs a listener's call, recording it into the client's statistics.
+
+        Exceptions raised by the call are routed to :meth:`.GatewayClient.on_error`
+        instead of being left on the task.
+
+        Parameters
+        ----------
+        client: :class:`.GatewayClient`
+            The client dispatching the event.
+
+        listener: :class:`.Listener` | :class:`.Collector`
+            The listener being called.
+
+        coro: Coroutine[Any, Any, Any]
+            The call of the listener.
+
+        Returns
+        -------
+        Any
+            The return of the listener. None if an exception was raised.
+        """
+        name = getattr(listener.callback, "__qualname__", repr(listener.callback))
+
+        try:
+            with client.tracer.span("listener", event=self.name, listener=name):
+                return await client.stats.measure(self.name, name, coro)
+        except Exception as error:
+            await client.on_error(self, listener, error)
+
+        return None
+
     def subscribe(self, func: Callback, **kwargs: Any) -> Listener | Collector:
         """Subscribes a callback to an :class:`.Event`
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import json
 import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple, cast
@@ -10,9 +11,11 @@ import aiohttp
 import attr
 
 from ..rest import Route
-from .event import Events
+from ..telemetry import Counter
+from .event import Event, Events
 from .parser import Parser
 from .ratelimiter import Ratelimiter
+from .recorder import Recorder
 
 if TYPE_CHECKING:
     from ..client import GatewayClient
@@ -44,6 +47,7 @@ class OPCode(enum.IntFlag):
 
 class WSMessage(NamedTuple):
     type: aiohttp.WSMsgType
+    data: str
     json: Callable[..., dict[Any, Any]]
 
 
@@ -68,12 +72,20 @@ class Gateway:
 
     sock: aiohttp.ClientWebSocketResponse = attr.field(init=False, repr=False)
     callbacks: dict[OPCode, Callable[..., Any]] = attr.field(init=False, repr=False)
+    events: Counter = attr.field(init=False, repr=False)
+    recorder: None | Recorder = attr.field(init=False, default=None, repr=False)
 
     def __attrs_post_init__(self) -> None:
         self.parser = Parser(self.client)
         self.intents = self.client.intents
         self.loop = self.client.loop
 
+        self.events = self.client.metrics.counter(
+            "rin_gateway_events_total",
+            "Dispatches received from the gateway.",
+            ("event",),
+        )
+
         self.callbacks = {
             OPCode.DISPATCH: self.dispatch,
             OPCode.RESUME: self.send_resume,
@@ -105,6 +117,11 @@ class Gateway:
         if not self.sock.closed:
             await self.sock.close()
 
+        # Reconnects go through start, the recorder is only closed along with the client.
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
     async def read(self) -> None:
         async for message in self.sock:
             message = cast(WSMessage, message)
@@ -112,35 +129,54 @@ class Gateway:
             if message.type is not aiohttp.WSMsgType.TEXT:
                 continue
 
-            data = message.json()
+            await self.receive(message.data)
+
+    async def receive(self, raw: str) -> Any:
+        tracer = self.client.tracer
+        ret = None
+
+        with tracer.span("gateway.frame") as span:
+            with tracer.span("gateway.decode"):
+                data = json.loads(raw)
+
             code = data["op"]
+            span.set("op", code)
+
+            if self.recorder is not None:
+                self.recorder.write(code, raw)
 
             if sequence := data.get("s"):
                 self.sequence = sequence
 
             if callback := self.callbacks.get(OPCode(code)):
-                await callback(data)
+                ret = await callback(data)
 
-            if code == OPCode.HEARTBEAT_ACK:
-                if self.last_heartbeat is not None:
-                    self.latency = (datetime.now() - self.last_heartbeat).total_seconds()
+        if code == OPCode.HEARTBEAT_ACK:
+            if self.last_heartbeat is not None:
+                self.latency = (datetime.now() - self.last_heartbeat).total_seconds()
 
-                _log.debug("GATEWAY ACK'D HEARTBEAT.")
+            _log.debug("GATEWAY ACK'D HEARTBEAT.")
+
+        return ret
 
     async def dispatch(self, data: dict[Any, Any]) -> asyncio.Task[Any]:
         event = getattr(Events, data["t"])
         _log.debug(f"DISPATCHING {event}")
 
+        self.events.inc(event=data["t"])
+
         if event is Events.READY:
             self.session = data["d"]["session_id"]
 
-        parser = getattr(self.parser, f"parse_{event.name.lower()}", None)
         self.client.dispatch(Events.WILDCARD, event, data["d"])
+        return self.loop.create_task(self.parse(event, data["d"]))
 
-        if parser is not None:
-            return self.loop.create_task(parser(data["d"]))
+    async def parse(self, event: Event[Any], data: dict[Any, Any]) -> None:
+        with self.client.tracer.span("gateway.dispatch", event=event.name):
+            if parser := getattr(self.parser, f"parse_{event.name.lower()}", None):
+                return await parser(data)
 
-        return self.loop.create_task(self.parser.no_parse(event, data["d"]))
+            return await self.parser.no_parse(event, data)
 
     async def send_resume(self, _: dict[Any, Any]) -> None:
         _log.debug("GATEWAY SENT RESUME.")
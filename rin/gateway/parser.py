@@ -64,24 +64,29 @@ class Parser:
         """Parses the `INTERACTION_CREATE` event.
         Dispatches a :class:`.Interaction` object
 
+        Component callbacks are ran as tasks by the client's
+        :class:`.InteractionScheduler`, so they don't hold up the dispatch.
+
         Parameters
         ----------
         data: :class:`dict`
             The data from the event.
         """
         interaction = Interaction(self.client, data)
+        scheduler = self.client.interactions
+        scheduler.track(interaction)
 
         if interaction.type is InteractionType.COMPONENT:
             custom_id = interaction.actual_data["custom_id"]
 
             if component := ComponentCache.cache.get(custom_id):
-                await component.callback(interaction, component)
+                scheduler.run(component, component.callback(interaction, component))
 
         elif interaction.type is InteractionType.MODAL_SUBMIT:
             text = interaction.actual_data["components"][0]["components"][0]
 
             if component := ComponentCache.cache.get(text["custom_id"]):
-                await component.callback(interaction, text["value"])
+                scheduler.run(component, component.callback(interaction, text["value"]))
 
         self.client.dispatch(Events.INTERACTION_CREATE, interaction)
 
@@ -123,11 +128,11 @@ class Parser:
         data: :class:`dict`
             The data from the event.
         """
-        members = [Member(self.client, member_data) for member_data in data["members"]]
+        members = [
+            Member(self.client, {**member_data, "guild_id": data["guild_id"]})
+            for member_data in data["members"]
+        ]
         if guild := Guild.cache.get(int(data["guild_id"])):
             guild.members = members
 
-            for member in members:
-                member.guild = guild
-
         self.client.dispatch(Events.GUILD_MEMBERS_CHUNK, members)
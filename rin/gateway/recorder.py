@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Any, Iterator
+
+import attr
+
+if TYPE_CHECKING:
+    from ..client import GatewayClient
+
+__all__ = ("Recorder", "Replayer")
+
+
+@attr.s(slots=True)
+class Recorder:
+    """Records raw gateway frames into a gzip compressed file.
+
+    The file is opened in append mode, recording into an existing file adds
+    to it. Each frame is written as a line of ``timestamp``, ``op`` and the
+    raw frame, separated by tabs.
+
+    Frames are buffered and compressed in batches on a thread of the recorder,
+    so recording doesn't block the loop. Recording carries on across reconnects,
+    the recorder is closed along with the gateway by :meth:`.GatewayClient.close`.
+
+    .. code:: python
+
+        client.gateway.recorder = rin.Recorder("traffic.gz")
+
+    Parameters
+    ----------
+    path: :class:`str` | :class:`os.PathLike`
+        The path of the recording.
+
+    batch: :class:`int`
+        The amount of frames buffered before they're written.
+
+    Attributes
+    ----------
+    frames: :class:`int`
+        The amount of frames recorded, including the buffered ones.
+
+    buffer: list[:class:`str`]
+        The frames not written yet.
+    """
+
+    path: str | os.PathLike[str] = attr.field()
+    batch: int = attr.field(default=64, kw_only=True)
+
+    file: IO[bytes] = attr.field(init=False, repr=False)
+    frames: int = attr.field(init=False, default=0)
+    buffer: list[str] = attr.field(init=False, factory=list, repr=False)
+    executor: ThreadPoolExecutor = attr.field(
+        init=False,
+        factory=lambda: ThreadPoolExecutor(1, thread_name_prefix="rin-recorder"),
+        repr=False,
+    )
+
+    def __attrs_post_init__(self) -> None:
+        self.file = gzip.open(self.path, "ab")
+
+    def write(self, op: int, raw: str) -> None:
+        """Writes a frame.
+
+        Parameters
+        ----------
+        op: :class:`int`
+            The opcode of the frame.
+
+        raw: :class:`str`
+            The raw JSON of the frame.
+        """
+        # Newlines can only appear as whitespace between JSON tokens.
+        self.buffer.append(f"{time.time():.6f}\t{op}\t{raw.replace(chr(10), ' ')}\n")
+        self.frames += 1
+
+        if len(self.buffer) >= self.batch:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hands the buffered frames to the recorder's thread to be written."""
+        if not self.buffer:
+            return
+
+        data = "".join(self.buffer).encode("utf-8")
+        self.buffer.clear()
+
+        # A single thread keeps the batches in order.
+        self.executor.submit(self.file.write, data)
+
+    def close(self) -> None:
+        """Flushes and closes the recording, waiting for the pending writes."""
+        self.flush()
+        self.executor.shutdown()
+        self.file.close()
+
+    def __enter__(self) -> Recorder:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+@attr.s(slots=True)
+class Replayer:
+    """Replays a recording into a client without a network connection.
+
+    Frames are handed to :meth:`.Gateway.receive`, so they go through the same
+    decoding, parsing and dispatching as live traffic.
+
+    .. note::
+
+        Guild chunking is disabled on the client while replaying,
+        since there is no connection to request members with.
+
+    .. code:: python
+
+        replayer = rin.Replayer(client, "traffic.gz", speed=None)
+        frames = await replayer.run()
+
+    Parameters
+    ----------
+    client: :class:`.GatewayClient`
+        The client to replay into.
+
+    path: :class:`str` | :class:`os.PathLike`
+        The path of the recording.
+
+    speed: None | :class:`float`
+        The speed to replay at, ``1.0`` being the original speed.
+        None replays as fast as possible.
+
+    dispatch_only: :class:`bool`
+        If only dispatch frames should be replayed. Other frames, like
+        ``RECONNECT``, would require a connection.
+    """
+
+    client: GatewayClient = attr.field(repr=False)
+    path: str | os.PathLike[str] = attr.field()
+    speed: None | float = attr.field(default=1.0, kw_only=True)
+    dispatch_only: bool = attr.field(default=True, kw_only=True)
+
+    def frames(self) -> Iterator[tuple[float, int, str]]:
+        """Yields the frames of the recording.
+
+        Returns
+        -------
+        Iterator[tuple[:class:`float`, :class:`int`, :class:`str`]]
+            The timestamp, opcode and raw JSON of each frame.
+        """
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            for line in file:
+                timestamp, op, raw = line.rstrip("\n").split("\t", 2)
+                yield float(timestamp), int(op), raw
+
+    async def run(self) -> int:
+        """Replays the recording, waiting for every dispatch to be handled.
+
+        Besides parsing, this waits for the tasks started while replaying, like
+        listeners and component callbacks. Listeners which never return keep the
+        replay from finishing.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of frames replayed.
+        """
+        client = self.client
+        loop = asyncio.get_running_loop()
+
+        if client.loop is None:
+            client.loop = loop
+
+        client.gateway.loop = client.loop
+        no_chunk, client.no_chunk = client.no_chunk, True
+
+        try:
+            return await self.replay(loop)
+        finally:
+            client.no_chunk = no_chunk
+
+    async def replay(self, loop: asyncio.AbstractEventLoop) -> int:
+        client = self.client
+        before = asyncio.all_tasks()
+
+        pending: set[asyncio.Task[Any]] = set()
+        started: None | tuple[float, float] = None
+        count = 0
+
+        for timestamp, op, raw in self.frames():
+            if self.dispatch_only and op != 0:
+                continue
+
+            if self.speed is not None:
+                if started is None:
+                    started = (timestamp, loop.time())
+
+                delay = (timestamp - started[0]) / self.speed - (loop.time() - started[1])
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            task = await client.gateway.receive(raw)
+            count += 1
+
+            if isinstance(task, asyncio.Task):
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending)
+
+        # Listeners and component callbacks run in tasks of their own.
+        while spawned := asyncio.all_tasks() - before:
+            await asyncio.wait(spawned)
+
+        return count
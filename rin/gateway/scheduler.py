@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar, Coroutine
+
+import attr
+
+from ..models import InteractionType
+from .event import Events
+
+if TYPE_CHECKING:
+    from ..client import GatewayClient
+    from ..models import Interaction
+    from ..telemetry import Histogram
+
+__all__ = ("InteractionScheduler",)
+_log = logging.getLogger(__name__)
+
+
+@attr.s(slots=True)
+class InteractionScheduler:
+    """Runs component callbacks and acknowledges interactions handled too slowly.
+
+    Discord drops interactions which aren't responded to within 3 seconds.
+    Every command, component and modal submit interaction received is given a budget,
+    if it hasn't been responded to once the budget passes it's deferred with
+    :meth:`.Interaction.defer`. Later calls of :meth:`.Interaction.send` then
+    respond to the deferred interaction. Autocomplete interactions can't be deferred.
+
+    .. warning::
+        A deferred interaction can't be responded to with a modal anymore.
+        Handlers which may respond with :meth:`.Interaction.modal` have to do so
+        within the budget, or the client has to be created with ``defer_after=None``.
+
+    .. code:: python
+
+        client = rin.GatewayClient(token, defer_after=1.5)
+
+    Parameters
+    ----------
+    client: :class:`.GatewayClient`
+        The client the interactions are received by.
+
+    budget: None | :class:`float`
+        The seconds a handler has to respond before the interaction
+        is deferred. None disables deferring.
+
+    Attributes
+    ----------
+    tasks: set[:class:`asyncio.Task`]
+        The running component callbacks and deferrals.
+
+    deferred: :class:`int`
+        The amount of interactions deferred by the scheduler.
+
+    latency: :class:`.Histogram`
+        The time taken to acknowledge interactions, in seconds.
+        Registered as ``rin_interaction_ack_seconds``.
+    """
+
+    DEFERRABLE: ClassVar[frozenset[InteractionType]] = frozenset(
+        {
+            InteractionType.COMMAND,
+            InteractionType.COMPONENT,
+            InteractionType.MODAL_SUBMIT,
+        }
+    )
+
+    client: GatewayClient = attr.field(repr=False)
+    budget: None | float = attr.field(default=2.0)
+
+    tasks: set[asyncio.Task[Any]] = attr.field(init=False, factory=set, repr=False)
+    deferred: int = attr.field(init=False, default=0)
+    latency: Histogram = attr.field(init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.latency = self.client.metrics.histogram(
+            "rin_interaction_ack_seconds",
+            "Time taken to acknowledge interactions.",
+            ("type", "deferred"),
+        )
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self.client.loop or asyncio.get_running_loop()
+
+    def track(self, interaction: Interaction) -> None:
+        """Starts the budget of an interaction.
+
+        Parameters
+        ----------
+        interaction: :class:`.Interaction`
+            The received interaction.
+        """
+        interaction.received_at = self.loop.time()
+
+        if self.budget is not None and interaction.type in self.DEFERRABLE:
+            self.loop.call_later(self.budget, self.expire, interaction)
+
+    def expire(self, interaction: Interaction) -> None:
+        """Defers an interaction if it hasn't been responded to yet.
+
+        Parameters
+        ----------
+        interaction: :class:`.Interaction`
+            The interaction whose budget passed.
+        """
+        if interaction.responded is False:
+            self.spawn(self.defer(interaction))
+
+    async def defer(self, interaction: Interaction) -> None:
+        try:
+            if await interaction.defer():
+                self.deferred += 1
+        except Exception:
+            _log.exception(f"FAILED TO DEFER INTERACTION {interaction.snowflake}")
+
+    def run(self, component: Any, coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+        """Runs a component's callback as a task.
+
+        The callback is recorded into the client's statistics, exceptions
+        are routed to :meth:`.GatewayClient.on_error`.
+
+        Parameters
+        ----------
+        component: Any
+            The component whose callback is being ran.
+
+        coro: Coroutine[Any, Any, Any]
+            The call of the callback.
+
+        Returns
+        -------
+        :class:`asyncio.Task`
+            The created task.
+        """
+        return self.spawn(Events.INTERACTION_CREATE.invoke(self.client, component, coro))
+
+    def spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+        task = self.loop.create_task(coro)
+
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+        return task
+
+    def acknowledged(self, interaction: Interaction, deferred: bool) -> None:
+        """Records the time taken to acknowledge an interaction.
+
+        Parameters
+        ----------
+        interaction: :class:`.Interaction`
+            The acknowledged interaction.
+
+        deferred: :class:`bool`
+            If the interaction was acknowledged with a deferred response.
+        """
+        if interaction.received_at is None:
+            return None
+
+        elapsed = self.loop.time() - interaction.received_at
+        self.latency.observe(
+            elapsed, type=interaction.type.name, deferred=str(deferred).lower()
+        )
+
+    async def wait(self) -> None:
+        """Waits for every running callback and deferral to finish."""
+        while self.tasks:
+            await asyncio.gather(*self.tasks)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, TypeVar
+
+import attr
+
+from ..utils import Histogram
+
+__all__ = ("CallStats", "DispatchStats")
+T = TypeVar("T")
+
+
+@attr.s(slots=True)
+class CallStats:
+    """Statistics of calls made to an event or a listener.
+
+    Attributes
+    ----------
+    calls: :class:`int`
+        The amount of calls started.
+
+    errors: :class:`int`
+        The amount of calls which raised an exception.
+
+    in_flight: :class:`int`
+        The amount of calls currently running.
+
+    latency: :class:`.Histogram`
+        The latency of finished calls, in seconds.
+    """
+
+    calls: int = attr.field(init=False, default=0)
+    errors: int = attr.field(init=False, default=0)
+    in_flight: int = attr.field(init=False, default=0)
+    latency: Histogram = attr.field(init=False, factory=Histogram)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Turns the statistics into a dict.
+
+        Returns
+        -------
+        :class:`dict`
+            The dict representing the statistics.
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "latency": self.latency.to_dict(),
+        }
+
+
+@attr.s(slots=True)
+class DispatchStats:
+    """Per-event and per-listener statistics of a client's dispatches.
+
+    Attributes
+    ----------
+    events: dict[:class:`str`, :class:`.CallStats`]
+        The statistics of each event, keyed by the event's name.
+
+    listeners: dict[tuple[:class:`str`, :class:`str`], :class:`.CallStats`]
+        The statistics of each listener, keyed by the event's name
+        and the listener's qualified name.
+    """
+
+    events: dict[str, CallStats] = attr.field(init=False, factory=dict)
+    listeners: dict[tuple[str, str], CallStats] = attr.field(init=False, factory=dict)
+
+    def event(self, event: str) -> CallStats:
+        """Gets the statistics of an event, creating them if needed.
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event.
+
+        Returns
+        -------
+        :class:`.CallStats`
+            The statistics of the event.
+        """
+        if (stats := self.events.get(event)) is None:
+            stats = self.events[event] = CallStats()
+
+        return stats
+
+    def listener(self, event: str, name: str) -> CallStats:
+        """Gets the statistics of a listener, creating them if needed.
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event the listener is subscribed to.
+
+        name: :class:`str`
+            The qualified name of the listener's callback.
+
+        Returns
+        -------
+        :class:`.CallStats`
+            The statistics of the listener.
+        """
+        if (stats := self.listeners.get((event, name))) is None:
+            stats = self.listeners[(event, name)] = CallStats()
+
+        return stats
+
+    async def measure(self, event: str, name: str, awaitable: Awaitable[T]) -> T:
+        """Awaits a listener call while recording it.
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event being dispatched.
+
+        name: :class:`str`
+            The qualified name of the listener being called.
+
+        awaitable: Awaitable[T]
+            The call to await.
+
+        Returns
+        -------
+        T
+            The return of the call.
+        """
+        records = (self.event(event), self.listener(event, name))
+
+        for record in records:
+            record.calls += 1
+            record.in_flight += 1
+
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        except Exception:
+            for record in records:
+                record.errors += 1
+
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+
+            for record in records:
+                record.in_flight -= 1
+                record.latency.observe(elapsed)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Creates a snapshot of the current statistics.
+
+        Returns
+        -------
+        :class:`dict`
+            A dict with ``events`` and ``listeners`` keys. Listeners are
+            nested under the name of their event.
+        """
+        listeners: dict[str, dict[str, Any]] = {}
+
+        for (event, name), stats in self.listeners.items():
+            listeners.setdefault(event, {})[name] = stats.to_dict()
+
+        return {
+            "events": {name: stats.to_dict() for name, stats in self.events.items()},
+            "listeners": listeners,
+        }
@@ -3,6 +3,7 @@ from .base import *
 from .builders import *
 from .cacheable import *
 from .channels import *
+from .columnar import *
 from .guild import *
 from .interactions import *
 from .message import *
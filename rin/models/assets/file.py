@@ -1,50 +1,244 @@
 from __future__ import annotations
 
 import io
+import mmap
 import os
-from typing import BinaryIO
+import threading
+from collections import OrderedDict
+from typing import IO, Any, BinaryIO, ClassVar, Union
 
 import attr
 
-__all__ = ("File",)
+__all__ = ("File", "AttachmentCache")
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class _Borrowed(io.IOBase):
+    # aiohttp closes the file objects it uploads, the wrapped stream
+    # belongs to the caller and has to survive for retries. Each upload
+    # keeps its own position, reads seek under the file's lock so
+    # concurrent uploads of the same stream don't move each other's.
+
+    def __init__(self, stream: IO[bytes], lock: threading.Lock, position: int) -> None:
+        self.stream = stream
+        self.lock = lock
+        self.position = position
+
+    @property
+    def name(self) -> Any:
+        return getattr(self.stream, "name", None)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        with self.lock:
+            self.stream.seek(self.position)
+            data = self.stream.read(size)
+
+        self.position += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+
+        elif whence == io.SEEK_END:
+            with self.lock:
+                offset += self.stream.seek(0, io.SEEK_END)
+
+        self.position = offset
+        return offset
+
+    def tell(self) -> int:
+        return self.position
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    def close(self) -> None:
+        pass
 
 
 @attr.s(slots=True)
 class File:
     """A helper class for files.
 
+    Files on disk are opened for each upload and streamed from a thread,
+    so they are never read into memory. Streams are read from the position
+    they were given at for each upload, so retried requests send the whole file.
+    Uploads of the same stream keep their own position and read under
+    :attr:`lock`, so the file can be sent by concurrent requests.
+
+    Buffers, like :class:`bytes` or a :class:`mmap.mmap`, are uploaded through a
+    read-only :class:`memoryview` without being copied. The same buffer can be
+    attached to many messages at once. See :meth:`cached` for reusing files on disk.
+
+    .. code:: python
+
+        await channel.send(files=[rin.File.cached("banner.png")])
+
     Parameters
     ----------
-    fp: :class:`str` | :class:`os.PathLike` | :class:`bytes`
-        The file path of the class, or source.
+    fp: :class:`str` | :class:`os.PathLike` | :class:`typing.BinaryIO` | :class:`bytes`
+        The file path of the class, or source. Buffers include :class:`bytes`,
+        :class:`bytearray`, :class:`memoryview` and :class:`mmap.mmap`.
+        Streams which can't seek are read into memory.
 
     name: None | :class:`str`
         The name of the file.
 
     Attributes
     ----------
-    fp: :class:`str` | :class:`os.PathLike` | :class:`bytes`
+    fp: :class:`str` | :class:`os.PathLike` | :class:`typing.BinaryIO` | :class:`bytes`
         The file path of the class, or source.
 
     name: None | :class:`str`
         The name of the file.
 
-    source: :class:`bytes`
-        The source of the file.
+    source: None | :class:`typing.BinaryIO`
+        The stream of the file, None for files on disk and buffers.
+
+    buffer: None | :class:`memoryview`
+        The read-only view of a buffer source.
+
+    size: :class:`int`
+        The size of the file in bytes.
+
+    offset: :class:`int`
+        The position the stream is rewound to before each upload.
+
+    lock: :class:`threading.Lock`
+        The lock held while reading the stream, uploads are read from threads.
     """
 
-    fp: str | os.PathLike[str] | BinaryIO = attr.field(repr=False)
+    MAX_SIZE: ClassVar[int] = 25 * 1024 * 1024
+    attachments: ClassVar[AttachmentCache]
+
+    fp: str | os.PathLike[str] | BinaryIO | Buffer = attr.field(repr=False)
     name: None | str = attr.field(default=None, repr=True)
-    source: io.BufferedReader | BinaryIO = attr.field(init=False, repr=False)
+
+    source: None | BinaryIO = attr.field(init=False, default=None, repr=False)
+    buffer: None | memoryview = attr.field(init=False, default=None, repr=False)
+    size: int = attr.field(init=False, default=0)
+    offset: int = attr.field(init=False, default=0, repr=False)
+    lock: threading.Lock = attr.field(init=False, factory=threading.Lock, repr=False)
 
     def __attrs_post_init__(self) -> None:
         if isinstance(self.fp, (str, os.PathLike)):
-            self.source = open(self.fp, "rb")
+            self.size = os.stat(self.fp).st_size
+            self.name = self.name or os.path.basename(self.fp)
+            return None
+
+        if isinstance(self.fp, (bytes, bytearray, memoryview, mmap.mmap)):
+            view = self.fp if isinstance(self.fp, memoryview) else memoryview(self.fp)
+            if not (view.readonly and view.format == "B" and view.ndim == 1):
+                view = view.cast("B").toreadonly()
+
+            self.buffer = view
+            self.size = self.buffer.nbytes
+            return None
+
+        if not callable(getattr(self.fp, "read", None)):
+            raise TypeError(
+                f"Expected a path, buffer or binary stream, got {type(self.fp)!r}"
+            )
+
+        self.source = self.fp
+
+        if not self.source.seekable():
+            self.source = io.BytesIO(self.source.read())
+
+        self.offset = self.source.tell()
+        self.size = self.source.seek(0, io.SEEK_END) - self.offset
+        self.source.seek(self.offset)
+
+        name = getattr(self.fp, "name", None)
+        self.name = self.name or (
+            os.path.basename(name) if isinstance(name, str) else None
+        )
+
+    @classmethod
+    def cached(cls, path: str | os.PathLike[str], name: None | str = None) -> File:
+        """Creates a file from the memory-mapped contents of a file on disk.
+
+        The mapping is kept in :attr:`attachments`, so files reused often
+        are only mapped once and never re-read.
+
+        Parameters
+        ----------
+        path: :class:`str` | :class:`os.PathLike`
+            The path of the file.
 
-        elif isinstance(self.fp, BinaryIO):
-            self.source = self.fp
+        name: None | :class:`str`
+            The name of the file. Defaults to the name of the path.
 
-        self.name = self.name or getattr(self.source, "name", None)
+        Returns
+        -------
+        :class:`.File`
+            The created file.
+        """
+        return cls(File.attachments.get(path), name or os.path.basename(path))
+
+    def open(self) -> IO[bytes] | memoryview:
+        """Opens the file for an upload. Used for every attempt of a request.
+
+        Returns
+        -------
+        :class:`typing.IO` | :class:`memoryview`
+            A new handle of the file on disk, a handle of the stream reading from
+            its offset, or the view of the buffer. Closing the stream returned does
+            not close :attr:`source`.
+        """
+        if self.buffer is not None:
+            return self.buffer
+
+        if self.source is None:
+            return open(self.fp, "rb")  # type: ignore
+
+        return _Borrowed(self.source, self.lock, self.offset)  # type: ignore
+
+    def validate(self, limit: None | int = None) -> None:
+        """Ensures the file can be uploaded.
+
+        Parameters
+        ----------
+        limit: None | :class:`int`
+            The max size of the file in bytes. Defaults to :attr:`MAX_SIZE`.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The file is too big.
+        """
+        limit = File.MAX_SIZE if limit is None else limit
+
+        if self.size > limit:
+            raise ValueError(f"{self.name} is {self.size} bytes, the limit is {limit}.")
+
+    def field(self, index: int) -> dict[str, Any]:
+        """Creates the form field of the file.
+
+        Parameters
+        ----------
+        index: :class:`int`
+            The index of the file in the message.
+
+        Returns
+        -------
+        :class:`dict`
+            The form field. The value is a callable opening the file for each attempt.
+        """
+        return {
+            "content_type": "application/octet-stream",
+            "name": f"file-{index}" if index else "file",
+            "value": self.open,
+            "filename": self.name or f"file-{index}",
+        }
 
     def read(self, size: None | int) -> bytes:
         """Reads the bytes of the file.
@@ -59,8 +253,103 @@ class File:
         :class:`bytes`
             The read bytes.
         """
-        return self.source.read(size or -1)
+        if self.buffer is not None:
+            return self.buffer[:size].tobytes()
+
+        if self.source is None:
+            with open(self.fp, "rb") as file:  # type: ignore
+                return file.read(size or -1)
+
+        with self.lock:
+            return self.source.read(size or -1)
 
     def close(self) -> None:
         """Closes the file."""
-        return self.source.close()
+        if self.source is not None:
+            self.source.close()
+
+
+@attr.s(slots=True)
+class AttachmentCache:
+    """A cache of memory-mapped files, shared by every :meth:`.File.cached` call.
+
+    Files are mapped read-only and kept until they change on disk, or until the
+    least recently used ones are dropped to stay under ``max_bytes``.
+
+    Parameters
+    ----------
+    max_bytes: :class:`int`
+        The max total size of the mapped files.
+
+    Attributes
+    ----------
+    entries: :class:`collections.OrderedDict`
+        The views of the mapped files, least recently used first.
+
+    size: :class:`int`
+        The total size of the mapped files, in bytes.
+    """
+
+    max_bytes: int = attr.field(default=64 * 1024 * 1024)
+
+    entries: OrderedDict[str, tuple[float, memoryview]] = attr.field(
+        init=False, factory=OrderedDict, repr=False
+    )
+    size: int = attr.field(init=False, default=0)
+
+    def get(self, path: str | os.PathLike[str]) -> memoryview:
+        """Gets the view of a file, mapping it if needed.
+
+        Parameters
+        ----------
+        path: :class:`str` | :class:`os.PathLike`
+            The path of the file.
+
+        Returns
+        -------
+        :class:`memoryview`
+            The read-only view of the file.
+        """
+        key = os.path.realpath(path)
+        stat = os.stat(key)
+
+        if (entry := self.entries.get(key)) is not None and entry[0] == stat.st_mtime:
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        self.pop(key)
+
+        if stat.st_size == 0:
+            view = memoryview(b"")
+        else:
+            with open(key, "rb") as file:
+                view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+        self.entries[key] = (stat.st_mtime, view)
+        self.size += view.nbytes
+
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            self.pop(next(iter(self.entries)))
+
+        return view
+
+    def pop(self, path: str | os.PathLike[str]) -> None:
+        """Drops a file from the cache.
+
+        The mapping is closed once no uploads use it anymore.
+
+        Parameters
+        ----------
+        path: :class:`str` | :class:`os.PathLike`
+            The path of the file.
+        """
+        if (entry := self.entries.pop(os.path.realpath(path), None)) is not None:
+            self.size -= entry[1].nbytes
+
+    def clear(self) -> None:
+        """Drops every file from the cache."""
+        self.entries.clear()
+        self.size = 0
+
+
+File.attachments = AttachmentCache()
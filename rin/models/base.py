@@ -81,7 +81,7 @@ class BaseModel:
         """
         for attribute in attr.fields(self.__class__):
 
-            if attribute.name in {"client", "data"}:
+            if attribute.name in {"client", "data"} or "key" not in attribute.metadata:
                 continue
 
             data = self.data.get(attribute.metadata["key"] or attribute.name)
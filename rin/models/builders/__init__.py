@@ -2,3 +2,6 @@ from .ansi import *
 from .embed import *
 from .intents import *
 from .message import *
+
+# Imported last, the message models need the builders above.
+from .broadcast import *
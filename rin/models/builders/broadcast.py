@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+import attr
+
+from ...rest import Priority, Route
+from ..assets import File
+from ..message import Message
+from ..snowflake import Snowflake
+
+if TYPE_CHECKING:
+    from ...client import GatewayClient
+
+__all__ = ("Broadcast", "BroadcastResult")
+
+
+@attr.s(slots=True)
+class BroadcastResult:
+    """The result of sending a broadcast to a channel.
+
+    Attributes
+    ----------
+    channel_id: :class:`int`
+        The snowflake of the channel.
+
+    message: None | :class:`.Message`
+        The message sent, None if sending failed.
+
+    error: None | :class:`Exception`
+        The exception raised while sending, if any.
+    """
+
+    channel_id: int = attr.field()
+    message: None | Message = attr.field(default=None)
+    error: None | Exception = attr.field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        """If the message was sent."""
+        return self.error is None
+
+
+@attr.s(slots=True)
+class Broadcast:
+    """Sends the same message to many channels.
+
+    The payload is serialized once and shared by every request. Channels are
+    sent to by ``concurrency`` workers, each request going through the ratelimits
+    of its channel's bucket and the global ratelimit, at a low priority so other
+    requests aren't held up.
+
+    Results are yielded as channels finish, in no particular order. Channels sent to
+    are kept in :attr:`completed`, iterating the broadcast again only sends to
+    the remaining channels, so a broadcast which failed partway can be resumed.
+
+    .. code:: python
+
+        broadcast = client.broadcast(channels, "Hello!")
+
+        async for result in broadcast:
+            if not result.ok:
+                print(result.channel_id, result.error)
+
+    Parameters
+    ----------
+    client: :class:`.GatewayClient`
+        The client to send with.
+
+    channels: Iterable[:class:`.Snowflake` | :class:`int`]
+        The snowflakes of the channels to send to.
+
+    payload: :class:`bytes`
+        The encoded JSON payload of the message, see :meth:`.MessageBuilder.payload`.
+
+    files: list[:class:`.File`]
+        The files to send with the message. Streams can't be used, since every
+        upload would read from the same stream at once.
+
+    concurrency: :class:`int`
+        The max amount of requests running at once.
+
+    priority: :class:`.Priority`
+        The priority of the requests. Defaults to :attr:`.Priority.LOW`.
+
+    completed: Iterable[:class:`int`]
+        Channels already sent to, E.g the :attr:`completed` of an earlier broadcast.
+
+    Attributes
+    ----------
+    completed: set[:class:`int`]
+        The snowflakes of the channels sent to.
+    """
+
+    client: GatewayClient = attr.field(repr=False)
+    channels: list[int] = attr.field(converter=lambda c: [int(s) for s in c])
+    payload: bytes = attr.field(repr=False)
+    files: list[File] = attr.field(factory=list, kw_only=True, repr=False)
+    concurrency: int = attr.field(default=10, kw_only=True)
+    priority: Priority = attr.field(default=Priority.LOW, kw_only=True)
+    completed: set[int] = attr.field(
+        factory=set, kw_only=True, converter=lambda c: {int(s) for s in c}
+    )
+
+    def __attrs_post_init__(self) -> None:
+        if self.concurrency < 1:
+            raise ValueError("Concurrency must be at least 1.")
+
+        for file in self.files:
+            if file.source is not None:
+                raise ValueError(f"{file.name} is a stream, use a path or buffer.")
+
+            file.validate()
+
+    @property
+    def pending(self) -> list[int]:
+        """The snowflakes of the channels left to send to."""
+        return [channel for channel in self.channels if channel not in self.completed]
+
+    def __aiter__(self) -> AsyncIterator[BroadcastResult]:
+        return self.results()
+
+    async def results(self) -> AsyncIterator[BroadcastResult]:
+        """Sends to the pending channels, yielding the result of each.
+
+        Leaving the iterator early cancels the requests still running.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.BroadcastResult`]
+            The results of the channels, as they finish.
+        """
+        pending = deque(dict.fromkeys(self.pending))
+        total = len(pending)
+
+        queue: asyncio.Queue[BroadcastResult] = asyncio.Queue()
+        loop = self.client.loop or asyncio.get_running_loop()
+
+        workers = [
+            loop.create_task(self.worker(pending, queue))
+            for _ in range(min(self.concurrency, total))
+        ]
+
+        try:
+            for _ in range(total):
+                yield await queue.get()
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def run(self) -> list[BroadcastResult]:
+        """Sends to the pending channels.
+
+        Returns
+        -------
+        list[:class:`.BroadcastResult`]
+            The results of the channels.
+        """
+        return [result async for result in self.results()]
+
+    async def worker(
+        self, pending: deque[int], queue: asyncio.Queue[BroadcastResult]
+    ) -> None:
+        while pending:
+            await queue.put(await self.send(pending.popleft()))
+
+    async def send(self, channel: Snowflake | int) -> BroadcastResult:
+        """Sends the message to a channel.
+
+        Parameters
+        ----------
+        channel: :class:`.Snowflake` | :class:`int`
+            The snowflake of the channel.
+
+        Returns
+        -------
+        :class:`.BroadcastResult`
+            The result of the channel. Exceptions are returned, not raised.
+        """
+        form: list[dict[str, Any]] = [
+            file.field(index) for index, file in enumerate(self.files)
+        ]
+
+        try:
+            data = await self.client.rest.request(
+                "POST",
+                Route("channels/{channel_id}/messages", channel_id=channel),
+                json=self.payload,
+                form=form,
+                priority=self.priority,
+            )
+        except Exception as error:
+            return BroadcastResult(int(channel), error=error)
+
+        self.completed.add(int(channel))
+        return BroadcastResult(int(channel), Message(self.client, data))
@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
+from ...utils import Serialized
+
 
 @runtime_checkable
 class _EmbedItem(Protocol):
@@ -76,6 +78,7 @@ class EmbedBuilder:
     def __init__(self, **kwargs: Any) -> None:
         self.data = kwargs
         self.__dict__.update(kwargs)
+        self.serialized = Serialized()
 
     @classmethod
     def from_dict(cls: type[EmbedBuilder], data: dict[Any, Any]) -> EmbedBuilder:
@@ -93,36 +96,55 @@ class EmbedBuilder:
         """
         return cls(**data)
 
+    def update(self, **data: Any) -> None:
+        """Updates the data of the embed. Used by the setters of the embed.
+
+        Parameters
+        ----------
+        data: Any
+            The data to update the embed with.
+        """
+        self.data.update(data)
+        self.serialized.clear()
+
     def to_dict(self) -> dict[Any, Any]:
         """Creates a dict representing the embed.
 
+        The dict is memoized until the embed is changed through its setters.
+        Changes made to :attr:`data` directly have to go through :meth:`update`.
+
         Returns
         ------
         :class:`dict`
             The dict representing the embed.
         """
+        if self.serialized.payload is not None:
+            return self.serialized.payload
+
         payload = self.data.copy()
 
         for name, item in payload.items():
-            if isinstance(item, _EmbedItem):
+            if isinstance(item, EmbedItem) or isinstance(item, _EmbedItem):
                 payload[name] = {**item.data}
 
-                continue
-
-            elif isinstance(item, list):
-                if not all(isinstance(obj, _EmbedItem) for obj in item):
+            elif isinstance(item, list) and item:
+                if not all(isinstance(obj, (EmbedItem, _EmbedItem)) for obj in item):
                     continue
 
-                data: list[dict[Any, Any]] = []
-                item: list[EmbedField]
-                for field in item:
-                    field: EmbedField
+                payload[name] = [{**field.data} for field in item]
 
-                    data.append({**field.data})
+        self.serialized.payload = payload
+        return payload
 
-                payload[name] = data
+    def to_json(self) -> bytes:
+        """Creates the JSON representing the embed, memoized like :meth:`to_dict`.
 
-        return payload
+        Returns
+        -------
+        :class:`bytes`
+            The JSON representing the embed.
+        """
+        return self.serialized.encode(self.to_dict())
 
     @property
     def title(self) -> None | str:
@@ -148,7 +170,7 @@ class EmbedBuilder:
         if len(title) > 256:
             raise ValueError("Title cannot have more than 256 characters")
 
-        self.data["title"] = title
+        self.update(title=title)
 
     @property
     def description(self) -> None | str:
@@ -174,7 +196,7 @@ class EmbedBuilder:
         if len(description) > 4096:
             raise ValueError("Description cannot have more than 4096 characters")
 
-        self.data["description"] = description
+        self.update(description=description)
 
     @property
     def url(self) -> None | str:
@@ -190,7 +212,7 @@ class EmbedBuilder:
         url: :class:`str`
             The url to set
         """
-        self.data["url"] = url
+        self.update(url=url)
 
     @property
     def timestamp(self) -> None | datetime:
@@ -206,7 +228,7 @@ class EmbedBuilder:
         timestamp: :class:`datetime.datetime`
             The datetime to use as the timestamp
         """
-        self.data["timestamp"] = timestamp
+        self.update(timestamp=timestamp)
 
     @property
     def color(self) -> None | int:
@@ -222,7 +244,7 @@ class EmbedBuilder:
         color: :class:`int`
             The color to set
         """
-        self.data["color"] = color
+        self.update(color=color)
 
     @property
     def footer(self) -> None | EmbedFooter:
@@ -240,7 +262,7 @@ class EmbedBuilder:
         icon_url: None | :class:`str`
             The icon url of the footer
         """
-        self.data["footer"] = EmbedItem(text=text, icon_url=icon_url)
+        self.update(footer=EmbedItem(text=text, icon_url=icon_url))
 
     @property
     def image(self) -> None | EmbedImage:
@@ -263,7 +285,7 @@ class EmbedBuilder:
         width: None | :class:`int`
             The width of the image.
         """
-        self.data["image"] = EmbedItem(url=url, height=height, width=width)
+        self.update(image=EmbedItem(url=url, height=height, width=width))
 
     @property
     def thumbnail(self) -> None | EmbedThumbnail:
@@ -286,7 +308,7 @@ class EmbedBuilder:
         width: None | :class:`int`
             The width of the thumbnail.
         """
-        self.data["thumbnail"] = EmbedItem(url=url, height=height, width=width)
+        self.update(thumbnail=EmbedItem(url=url, height=height, width=width))
 
     @property
     def video(self) -> None | EmbedVideo:
@@ -309,7 +331,7 @@ class EmbedBuilder:
         width: None | :class:`int`
             The width of the video.
         """
-        self.data["thumbnail"] = EmbedItem(url=url, height=height, width=width)
+        self.update(thumbnail=EmbedItem(url=url, height=height, width=width))
 
     @property
     def provider(self) -> None | EmbedProvider:
@@ -327,7 +349,7 @@ class EmbedBuilder:
         url: None | :class:`str`
             The url of the provider.
         """
-        self.data["provider"] = EmbedItem(name=name, url=url)
+        self.update(provider=EmbedItem(name=name, url=url))
 
     @property
     def author(self) -> None | EmbedAuthor:
@@ -350,7 +372,7 @@ class EmbedBuilder:
         icon_url: None | :class:`str`
             The icon url of the author.
         """
-        self.data["author"] = EmbedItem(name=name, url=url, icon_url=icon_url)
+        self.update(author=EmbedItem(name=name, url=url, icon_url=icon_url))
 
     @property
     def fields(self) -> None | list[EmbedField]:
@@ -374,3 +396,4 @@ class EmbedBuilder:
         self.data.setdefault("fields", []).append(
             EmbedItem(name=name, value=value, inline=inline)
         )
+        self.serialized.clear()
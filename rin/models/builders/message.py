@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 import attr
 
-from ...rest import Route
+from ...rest import Priority, Route
 from ..assets import File
 from ..message import ActionRow, AllowedMentions, Message
 from ..snowflake import Snowflake
@@ -47,6 +47,49 @@ class MessageBuilder:
         """
         self.snowflake = snowflake
 
+    @staticmethod
+    def payload(
+        content: None | str = None,
+        tts: bool = False,
+        embeds: list[EmbedBuilder] = [],
+        rows: list[ActionRow] = [],
+        reply: None | Message = None,
+        mentions: AllowedMentions = AllowedMentions(),
+        files: int = 0,
+    ) -> dict[str, Any]:
+        """Creates the JSON payload of a message. See :meth:`send` for the parameters.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The message has no content, embeds or files, or has too many embeds.
+
+        Returns
+        -------
+        :class:`dict`
+            The payload of the message.
+        """
+        if content is None and len(embeds) == 0 and files == 0:
+            raise ValueError(
+                "Message must have at least `content`, `embeds` or `files`."
+            ) from None
+
+        elif len(embeds) > 10:
+            raise ValueError("Only 10 embeds can be sent per message.") from None
+
+        payload: dict[str, Any] = {
+            "content": content,
+            "tts": tts,
+            "embeds": [e.to_dict() for e in embeds],
+            "components": [r.to_dict() for r in rows],
+            "allowed_mentions": mentions.to_dict(),
+        }
+
+        if reply is not None:
+            payload["message_reference"] = reply.reference()
+
+        return payload
+
     async def send(
         self,
         content: None | str = None,
@@ -56,6 +99,7 @@ class MessageBuilder:
         rows: list[ActionRow] = [],
         reply: None | Message = None,
         mentions: AllowedMentions = AllowedMentions(),
+        priority: Priority = Priority.NORMAL,
     ) -> Message:
         """Sends a message into the channel corresponding to the passed in :class:`.Snowflake`.
 
@@ -79,47 +123,29 @@ class MessageBuilder:
         mentions: :class:`.AllowedMentions`
             The allowed mentions of the message.
 
+        priority: :class:`.Priority`
+            The priority of the request, see :meth:`.RESTClient.request`.
+
         Returns
         -------
         :class:`.Message`
             An instance of the newly sent message.
         """
+        payload = MessageBuilder.payload(
+            content, tts, embeds, rows, reply, mentions, len(files)
+        )
 
-        if content is None and len(embeds) == 0 and len(files) == 0:
-            raise ValueError(
-                "Message must have at least `content`, `embeds` or `files`."
-            ) from None
-
-        elif len(embeds) > 10:
-            raise ValueError("Only 10 embeds can be sent per message.") from None
-
-        payload: dict[str, Any] = {
-            "content": content,
-            "tts": tts,
-            "embeds": [e.to_dict() for e in embeds],
-            "components": [r.to_dict() for r in rows],
-            "allowed_mentions": mentions.to_dict(),
-        }
-
-        if reply is not None:
-            payload["message_reference"] = reply.reference()
-
-        form: list[dict[Any, Any]] = []
-        for index, file in enumerate(files):
-            file_data = {
-                "content_type": "application/octect-stream",
-                "name": f"file-{index}" if index else "file",
-                "value": file.source,
-                "filename": file.name,
-            }
+        for file in files:
+            file.validate()
 
-            form.append(file_data)
+        form = [file.field(index) for index, file in enumerate(files)]
 
         data = await self.client.rest.request(
             "POST",
-            Route(f"channels/{self.snowflake}/messages", channel_id=self.snowflake),
+            Route("channels/{channel_id}/messages", channel_id=self.snowflake),
             json=payload,
             form=form,
+            priority=priority,
         )
 
         return Message(self.client, data)
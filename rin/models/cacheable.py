@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, Iterator, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Iterable, Iterator, TypeVar
 
 import attr
 
@@ -40,22 +40,31 @@ class Cache(Generic[T]):
 
     len: :class:`int`
         The current amount of items in the cache.
+
+    hits: :class:`int`
+        The amount of lookups through :meth:`get` which found a value.
+
+    misses: :class:`int`
+        The amount of lookups through :meth:`get` which found nothing.
     """
 
     max: None | int = attr.field()
     len: int = attr.field(default=0)
 
     root: dict[str | int, T] = attr.field(init=False)
+    hits: int = attr.field(init=False, default=0)
+    misses: int = attr.field(init=False, default=0)
 
     def __attrs_post_init__(self) -> None:
         self.root: dict[str | int, T] = {}
 
     def __setitem__(self, key: str | int, value: T) -> T:
+        if key not in self.root:
+            self.len += 1
+
         self.root[key] = value
-        self.len += 1
 
         if self.max and self.len > self.max:
-            self.len -= 1
             self.pop()
 
         return value
@@ -104,7 +113,14 @@ class Cache(Generic[T]):
         None | :class:`typing.Any`
             The value retrieved from the key.
         """
-        return self.root.get(key)
+        value = self.root.get(key)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
 
     def pop(self, key: None | str | int = None) -> T:
         """Pops an item from the internal dict.
@@ -121,14 +137,37 @@ class Cache(Generic[T]):
         :class:`typing.Any`
             The value from the popped key.
         """
-        if key is not None:
-            return self.root.pop(key)
+        value = self.root.pop(next(iter(self.root)) if key is None else key)
+        self.len -= 1
+
+        return value
+
+    def evict(self, keys: Iterable[str | int]) -> int:
+        """Pops many keys at once. Keys which aren't cached are ignored.
+
+        Parameters
+        ----------
+        keys: Iterable[:class:`str` | :class:`int`]
+            The keys to pop.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of keys popped.
+        """
+        count = 0
+
+        for key in keys:
+            if key in self.root:
+                self.pop(key)
+                count += 1
 
-        return self.root.pop(list(self.root.keys())[0])
+        return count
 
 
 class CacheableMeta(type):
     __cache__: Cache[Any]
+    caches: ClassVar[dict[str, Cache[Any]]] = {}
 
     def __new__(
         cls,
@@ -137,7 +176,7 @@ class CacheableMeta(type):
         attrs: dict[Any, Any],
         max: None | int = None,
     ) -> CacheableMeta:
-        attrs["__cache__"] = Cache[Any](max)
+        attrs["__cache__"] = CacheableMeta.caches[name] = Cache[Any](max)
         return super().__new__(cls, name, bases, attrs)
 
     @property
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 import attr
 
+from ...rest import Route
 from ..base import BaseModel
 from ..cacheable import Cacheable
 from ..snowflake import Snowflake
@@ -12,9 +15,13 @@ from .types import ChannelType
 
 if TYPE_CHECKING:
     from ...client import GatewayClient
+    from ..message import History, Message
 
 __all__ = ("TextChannel",)
 
+# Bulk deletes only accept messages younger than 14 days, with a minute to spare.
+BULK_DELETE_AGE = 14 * 24 * 60 * 60 - 60
+
 
 @attr.s(slots=True)
 class TextChannel(BaseModel, Cacheable):
@@ -56,7 +63,7 @@ class TextChannel(BaseModel, Cacheable):
         The last known time at when a message was pinned in the channel.
     """
 
-    snowflake: Snowflake = BaseModel.field(None, Snowflake, repr=True)
+    snowflake: Snowflake = BaseModel.field("id", Snowflake, repr=True)
 
     name: str = BaseModel.field(None, str, repr=True)
     topic: None | str = BaseModel.field(None, str)
@@ -82,3 +89,205 @@ class TextChannel(BaseModel, Cacheable):
     def last_pin(self, _: GatewayClient, data: None | str) -> None | datetime:
         if data is not None:
             return datetime.fromisoformat(data)
+
+    def history(
+        self,
+        limit: None | int = 100,
+        *,
+        before: None | Snowflake | int | datetime = None,
+        after: None | Snowflake | int | datetime = None,
+        raw: bool = False,
+        cache: bool = False,
+        prefetch: bool = True,
+    ) -> History:
+        """Creates an async iterator over the messages of the channel.
+
+        .. code:: python
+
+            async for message in channel.history(limit=None, after=snowflake):
+                ...
+
+        Parameters
+        ----------
+        limit: None | :class:`int`
+            The max amount of messages to yield. None yields the whole history.
+
+        before: None | :class:`.Snowflake` | :class:`int` | :class:`datetime.datetime`
+            Only yield messages sent before this snowflake or time.
+
+        after: None | :class:`.Snowflake` | :class:`int` | :class:`datetime.datetime`
+            Only yield messages sent after this snowflake or time, oldest first.
+
+        raw: :class:`bool`
+            If the raw dicts of the messages should be yielded, skipping model construction.
+
+        cache: :class:`bool`
+            If the messages should be put into :attr:`.Message.cache`.
+
+        prefetch: :class:`bool`
+            If the next page should be fetched while the current one is consumed.
+
+        Returns
+        -------
+        :class:`.History`
+            The iterator over the messages.
+        """
+        # Imported here, the message models import the channel models.
+        from ..message import History
+
+        return History(
+            self.client,
+            self.snowflake,
+            limit=limit,
+            before=before,
+            after=after,
+            raw=raw,
+            cache=cache,
+            prefetch=prefetch,
+        )
+
+    async def delete_messages(
+        self, snowflakes: list[Snowflake | int], reason: None | str = None
+    ) -> None:
+        """Deletes up to 100 messages with a single request.
+
+        Messages older than 14 days can't be bulk deleted, see :meth:`purge`.
+
+        Parameters
+        ----------
+        snowflakes: list[:class:`.Snowflake` | :class:`int`]
+            The snowflakes of the messages.
+
+        reason: None | :class:`str`
+            The reason to delete the messages with.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            More than 100 messages were given.
+
+        :exc:`.HTTPException`
+            Something went wrong.
+        """
+        if len(snowflakes) > 100:
+            raise ValueError("Only 100 messages can be bulk deleted at once.") from None
+
+        if len(snowflakes) == 1:
+            route = Route(
+                "channels/{channel_id}/messages/{message_id}",
+                channel_id=self.snowflake,
+                message_id=snowflakes[0],
+            )
+            await self.client.rest.request("DELETE", route, reason=reason)
+
+        elif snowflakes:
+            route = Route(
+                "channels/{channel_id}/messages/bulk-delete", channel_id=self.snowflake
+            )
+            await self.client.rest.request(
+                "POST",
+                route,
+                json={"messages": [str(s) for s in snowflakes]},
+                reason=reason,
+            )
+
+    async def purge(
+        self,
+        limit: None | int = 100,
+        *,
+        check: None | Callable[[Message], bool] = None,
+        before: None | Snowflake | int | datetime = None,
+        after: None | Snowflake | int | datetime = None,
+        reason: None | str = None,
+        concurrency: int = 4,
+    ) -> list[Snowflake]:
+        """Deletes messages of the channel.
+
+        The history of the channel is streamed, messages younger than 14 days
+        are bulk deleted in batches of 100 while older ones are deleted one by one.
+        Deletes start while the history is still being read, with up to ``concurrency``
+        requests running at once. Deleted messages are then evicted from
+        :attr:`.Message.cache` in one pass.
+
+        .. code:: python
+
+            deleted = await channel.purge(limit=500, check=lambda m: m.user.bot)
+
+        Parameters
+        ----------
+        limit: None | :class:`int`
+            The amount of messages to look through. None looks through the whole history.
+
+        check: None | Callable[[:class:`.Message`], :class:`bool`]
+            The check a message has to pass to be deleted. Messages are
+            only constructed when a check is given.
+
+        before: None | :class:`.Snowflake` | :class:`int` | :class:`datetime.datetime`
+            Only delete messages sent before this snowflake or time.
+
+        after: None | :class:`.Snowflake` | :class:`int` | :class:`datetime.datetime`
+            Only delete messages sent after this snowflake or time.
+
+        reason: None | :class:`str`
+            The reason to delete the messages with.
+
+        concurrency: :class:`int`
+            The max amount of delete requests running at once.
+
+        Raises
+        ------
+        :exc:`.HTTPException`
+            Something went wrong. Messages deleted up to then are still evicted.
+
+        Returns
+        -------
+        list[:class:`.Snowflake`]
+            The snowflakes of the deleted messages.
+        """
+        from ..message import Message
+
+        threshold = Snowflake.from_timestamp(time.time() - BULK_DELETE_AGE)
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks: list[asyncio.Task[None]] = []
+        deleted: list[Snowflake] = []
+        batch: list[Snowflake] = []
+
+        async def delete(snowflakes: list[Snowflake]) -> None:
+            async with semaphore:
+                await self.delete_messages(snowflakes, reason)
+                deleted.extend(snowflakes)
+
+        def schedule(snowflakes: list[Snowflake]) -> None:
+            tasks.append(asyncio.ensure_future(delete(snowflakes)))
+
+        history: Any = self.history(limit, before=before, after=after, raw=check is None)
+
+        try:
+            async for item in history:
+                if check is not None and not check(item):
+                    continue
+
+                snowflake = Snowflake(item["id"] if check is None else item.snowflake)
+
+                if snowflake < threshold:
+                    schedule([snowflake])
+                    continue
+
+                batch.append(snowflake)
+
+                if len(batch) == 100:
+                    schedule(batch)
+                    batch = []
+
+            if batch:
+                schedule(batch)
+
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            Message.cache.evict(deleted)
+
+        return deleted
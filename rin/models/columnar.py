@@ -0,0 +1,488 @@
+from __future__ import annotations
+
+import math
+import weakref
+from array import array
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Iterator
+
+import attr
+
+from .cacheable import Cache, Cacheable, CacheableMeta
+from .user import User
+
+if TYPE_CHECKING:
+    from ..client import GatewayClient
+    from .base import BaseModel
+
+__all__ = ("Column", "ColumnarCache")
+
+MISSING = object()
+
+
+@attr.s(slots=True)
+class Column:
+    """A column of a :class:`.ColumnarCache`, storing one key of the models' data.
+
+    Parameters
+    ----------
+    key: :class:`str`
+        The key of the data stored in the column.
+
+    typecode: None | :class:`str`
+        The :mod:`array` typecode of the column.
+        None stores the values in a list, E.g for strings.
+
+    encode: Callable[[Any], Any]
+        Converts a value of the data into the value stored. Never given None.
+
+    decode: Callable[[Any], Any]
+        Converts a stored value back into the value of the data.
+
+    null: Any
+        The stored value meaning the key was missing or None.
+
+    width: None | :class:`int`
+        The size in bytes of the values, storing them in a :class:`bytearray`
+        instead. The typecode is ignored.
+    """
+
+    key: str = attr.field()
+    typecode: None | str = attr.field(default=None)
+    encode: Callable[[Any], Any] = attr.field(default=lambda value: value, repr=False)
+    decode: Callable[[Any], Any] = attr.field(default=lambda value: value, repr=False)
+    null: Any = attr.field(default=None)
+    width: None | int = attr.field(default=None, kw_only=True)
+
+    def create(self) -> Any:
+        """Creates an empty column."""
+        if self.width is not None:
+            return bytearray()
+
+        return [] if self.typecode is None else array(self.typecode)
+
+    def append(self, storage: Any) -> None:
+        """Adds a null row to the storage of the column."""
+        if self.width is not None:
+            storage.extend(self.null)
+        else:
+            storage.append(self.null)
+
+    def read(self, storage: Any, row: int) -> Any:
+        """Reads the stored value of a row."""
+        if self.width is not None:
+            return bytes(storage[row * self.width : (row + 1) * self.width])
+
+        return storage[row]
+
+    def write(self, storage: Any, row: int, value: Any) -> None:
+        """Writes the data value of a row, None meaning null."""
+        value = self.null if value is None else self.encode(value)
+
+        if self.width is not None:
+            storage[row * self.width : (row + 1) * self.width] = value
+        else:
+            storage[row] = value
+
+    @classmethod
+    def snowflake(cls, key: str) -> Column:
+        """A column of snowflakes, which are strings in the data."""
+        return cls(key, "Q", int, str, 0)
+
+    @classmethod
+    def integer(cls, key: str, typecode: str = "q") -> Column:
+        """A column of signed integers, E.g ``"b"`` for small ones."""
+        return cls(key, typecode, null=-(2 ** (array(typecode).itemsize * 8 - 1)))
+
+    @classmethod
+    def discriminator(cls, key: str) -> Column:
+        """A column of discriminators, which are zero padded strings in the data."""
+        return cls(key, "h", encode_discriminator, decode_discriminator, -1)
+
+    @classmethod
+    def hash(cls, key: str) -> Column:
+        """A column of image hashes, E.g avatars, stored as their 16 bytes.
+
+        The first byte is 1, or 2 for the ``a_`` prefix of animated images.
+        """
+        return cls(key, None, encode_hash, decode_hash, bytes(17), width=17)
+
+    @classmethod
+    def boolean(cls, key: str) -> Column:
+        """A column of booleans."""
+        return cls(key, "b", int, bool, -1)
+
+    @classmethod
+    def time(cls, key: str) -> Column:
+        """A column of ISO 8601 times, stored as timestamps."""
+        return cls(key, "d", to_timestamp, from_timestamp, math.nan)
+
+    @classmethod
+    def snowflakes(cls, key: str) -> Column:
+        """A column of lists of snowflakes, E.g the roles of members."""
+        return cls(
+            key,
+            None,
+            lambda ids: array("Q", map(int, ids)),
+            lambda ids: [str(id) for id in ids],
+        )
+
+    @classmethod
+    def model(cls, key: str, model: type[Cacheable]) -> Column:
+        """A column of nested models, E.g the user of members.
+
+        Only the snowflake is stored, the data is taken from the model's cache.
+        """
+
+        def decode(id: int) -> dict[str, Any]:
+            cache = model.cache
+
+            if isinstance(cache, ColumnarCache):
+                data = cache.row(id)
+            else:
+                data = getattr(cache.root.get(id), "data", None)
+
+            return data or {"id": str(id)}
+
+        return cls(key, "Q", lambda data: int(data["id"]), decode, 0)
+
+
+def encode_discriminator(discriminator: str) -> int:
+    # Users migrated to unique usernames have a discriminator of "0", not "0000".
+    return -2 if discriminator == "0" else int(discriminator)
+
+
+def decode_discriminator(value: int) -> str:
+    return "0" if value == -2 else f"{value:04}"
+
+
+def encode_hash(hash: str) -> bytes:
+    animated = hash.startswith("a_")
+    return bytes([2 if animated else 1]) + bytes.fromhex(hash.removeprefix("a_"))
+
+
+def decode_hash(value: bytes) -> str:
+    return ("a_" if value[0] == 2 else "") + value[1:].hex()
+
+
+def to_timestamp(time: str) -> float:
+    return datetime.fromisoformat(time).timestamp()
+
+
+def from_timestamp(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+@attr.s(slots=True)
+class ColumnarCache(Cache[Any]):
+    """A compact cache storing the data of models in columns, instead of the models.
+
+    Each column holds one key of the data for every cached model, in a typed
+    :class:`array.array` where possible, with one row per model. Only the keys
+    of the columns are kept, so an entry costs a few dozen bytes instead of the
+    kilobytes of a model and its data. This is meant for bots in very large guilds.
+
+    Models are created from their row when looked up. Created models are kept
+    while they're referenced elsewhere, so lookups return the same object until then.
+
+    .. code:: python
+
+        rin.ColumnarCache.install(rin.User)
+        rin.ColumnarCache.install(rin.Member)
+
+    .. note::
+        Keys of the data without a column are dropped, and changes made to a model
+        after it was cached are lost once it is no longer referenced.
+
+    Parameters
+    ----------
+    max: None | :class:`int`
+        The max amount of rows before dropping the first inserted one.
+
+    model: type[:class:`.BaseModel`]
+        The model being cached, created from the rows.
+
+    columns: list[:class:`.Column`]
+        The columns to store.
+
+    Attributes
+    ----------
+    COLUMNS: dict[:class:`str`, list[:class:`.Column`]]
+        The default columns of :meth:`install`, keyed by model name.
+
+    root: dict[:class:`int`, :class:`int`]
+        The row of each key.
+
+    data: dict[:class:`str`, :class:`list` | :class:`array.array`]
+        The columns, keyed by the key of the data they store.
+
+    free: list[:class:`int`]
+        The rows of popped keys, reused by the next keys.
+
+    live: :class:`weakref.WeakValueDictionary`
+        The models created from the rows which are still referenced.
+
+    client: None | :class:`.GatewayClient`
+        The client given to created models, from the first model cached.
+    """
+
+    COLUMNS: ClassVar[dict[str, list[Column]]] = {
+        "User": [
+            Column.snowflake("id"),
+            Column("username"),
+            Column.discriminator("discriminator"),
+            Column.hash("avatar"),
+            Column.hash("banner"),
+            Column.integer("accent_color", "i"),
+            Column.boolean("bot"),
+            Column.boolean("system"),
+            Column.integer("public_flags"),
+            Column.integer("premium_type", "b"),
+        ],
+        "Member": [
+            Column.model("user", User),
+            Column.snowflake("guild_id"),
+            Column("nick"),
+            Column.hash("avatar"),
+            Column.snowflakes("roles"),
+            Column.time("joined_at"),
+            Column.time("premium_since"),
+            Column.time("communication_disabled_until"),
+            Column.boolean("deaf"),
+            Column.boolean("mute"),
+            Column.boolean("pending"),
+        ],
+    }
+
+    model: type[BaseModel] = attr.field(kw_only=True)
+    columns: list[Column] = attr.field(kw_only=True)
+
+    data: dict[str, Any] = attr.field(init=False, repr=False)
+    free: list[int] = attr.field(init=False, factory=list, repr=False)
+    rows: int = attr.field(init=False, default=0, repr=False)
+    live: weakref.WeakValueDictionary[str | int, Any] = attr.field(
+        init=False, factory=weakref.WeakValueDictionary, repr=False
+    )
+    client: None | GatewayClient = attr.field(init=False, default=None, repr=False)
+    restoring: Any = attr.field(init=False, default=None, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        super().__attrs_post_init__()
+        self.data = {column.key: column.create() for column in self.columns}
+
+    @classmethod
+    def install(
+        cls,
+        model: type[BaseModel],
+        columns: None | list[Column] = None,
+        max: None | int = None,
+    ) -> ColumnarCache:
+        """Replaces the cache of a model with a columnar cache, keeping what was cached.
+
+        Parameters
+        ----------
+        model: type[:class:`.BaseModel`]
+            The cache-able model, E.g :class:`.User` or :class:`.Member`.
+
+        columns: None | list[:class:`.Column`]
+            The columns to store. Defaults to the columns of :attr:`COLUMNS`.
+
+        max: None | :class:`int`
+            The max amount of rows.
+
+        Returns
+        -------
+        :class:`.ColumnarCache`
+            The installed cache.
+        """
+        name = model.__name__
+        if columns is None:
+            columns = ColumnarCache.COLUMNS[name]
+
+        cache = cls(max, model=model, columns=columns)
+        previous: Cache[Any] = CacheableMeta.caches[name]
+
+        for key, value in previous.root.items():
+            cache.set(key, value)
+
+        model.__cache__ = CacheableMeta.caches[name] = cache  # type: ignore
+        return cache
+
+    def __setitem__(self, key: str | int, value: Any) -> Any:
+        if value.data is self.restoring:
+            self.live[key] = value
+            return value
+
+        if self.client is None:
+            self.client = value.client
+
+        row = self.root.get(key)
+
+        if row is None:
+            row = self.allocate()
+            self.root[key] = row
+            self.len += 1
+
+        for column in self.columns:
+            column.write(self.data[column.key], row, value.data.get(column.key))
+
+        self.live[key] = value
+
+        if self.max and self.len > self.max:
+            self.drop(next(iter(self.root)))
+
+        return value
+
+    def __getitem__(self, key: str | int) -> Any:
+        value = self.load(key)
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def allocate(self) -> int:
+        """Gets a free row, growing the columns if there is none."""
+        if self.free:
+            return self.free.pop()
+
+        for column in self.columns:
+            column.append(self.data[column.key])
+
+        self.rows += 1
+        return self.rows - 1
+
+    def row(self, key: str | int) -> None | dict[str, Any]:
+        """Gets the data stored for a key, without creating a model.
+
+        Parameters
+        ----------
+        key: :class:`str` | :class:`int`
+            The key to get the data of.
+
+        Returns
+        -------
+        None | :class:`dict`
+            The data of the key, None if it isn't cached.
+        """
+        row = self.root.get(key)
+        if row is None:
+            return None
+
+        data: dict[str, Any] = {}
+
+        for column in self.columns:
+            value = column.read(self.data[column.key], row)
+
+            # NaN, the null of floats, isn't equal to itself.
+            if value == column.null or value != value:
+                continue
+
+            data[column.key] = column.decode(value)
+
+        return data
+
+    def load(self, key: str | int) -> Any:
+        value = self.live.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        data = self.row(key)
+        if data is None:
+            return None
+
+        self.restoring = data
+
+        try:
+            value = self.model(self.client, data)  # type: ignore
+        finally:
+            self.restoring = None
+
+        self.live[key] = value
+        return value
+
+    def iterator(self) -> Iterator[Any]:
+        """An iterator creating the models of the cache.
+
+        Returns
+        -------
+        :class:`typing.Iterator`
+            An iterator of the models.
+        """
+        for key in list(self.root):
+            yield self.load(key)
+
+    def get(self, key: str | int) -> Any:
+        """Retrieves the model of a key, creating it from its row if needed.
+
+        Parameters
+        ----------
+        key: :class:`str` | :class:`int`
+            The key to retrieve from.
+
+        Returns
+        -------
+        None | :class:`.BaseModel`
+            The model of the key.
+        """
+        value = self.load(key)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    def pop(self, key: None | str | int = None) -> Any:
+        """Pops a key, freeing its row.
+
+        If no key is passed, the first inserted key will be popped.
+
+        Parameters
+        ----------
+        key: None | :class:`str` | :class:`int`
+            The key to pop.
+
+        Returns
+        -------
+        :class:`.BaseModel`
+            The model of the popped key.
+        """
+        key = next(iter(self.root)) if key is None else key
+        value = self.load(key)
+        self.drop(key)
+
+        return value
+
+    def evict(self, keys: Iterable[str | int]) -> int:
+        """Pops many keys at once, without creating their models.
+
+        Parameters
+        ----------
+        keys: Iterable[:class:`str` | :class:`int`]
+            The keys to pop.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of keys popped.
+        """
+        count = 0
+
+        for key in keys:
+            if key in self.root:
+                self.drop(key)
+                count += 1
+
+        return count
+
+    def drop(self, key: str | int) -> None:
+        """Frees the row of a key, without creating its model."""
+        row = self.root.pop(key)
+
+        for column in self.columns:
+            column.write(self.data[column.key], row, None)
+
+        self.free.append(row)
+        self.live.pop(key, None)
+        self.len -= 1
@@ -7,6 +7,7 @@ import attr
 
 from ..base import BaseModel
 from ..cacheable import Cacheable
+from ..snowflake import Snowflake
 from ..user import User
 
 from .role import Role
@@ -26,11 +27,19 @@ class Member(BaseModel, Cacheable):
     deaf: bool = BaseModel.field(None, bool)
     mute: bool = BaseModel.field(None, bool)
     pending: bool = BaseModel.field(None, bool)
+    guild_id: None | Snowflake = BaseModel.field(None, Snowflake)
 
     def __attrs_post_init__(self) -> None:
         self.guild: Guild
         super().__attrs_post_init__()
 
+        if self.guild_id is not None:
+            # Imported here, the guild models import the member model.
+            from .guild import Guild  # noqa: F811
+
+            if guild := Guild.cache.get(self.guild_id):
+                self.guild = guild
+
         if self.user is not None:  # NONE WHEN IN MESSAGE_CREATE
             Member.cache.set(self.user.snowflake, self)
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 import attr
 
-from ...rest import Route
+from ...rest import Priority, Route
 from ..assets import File
 from ..base import BaseModel
 from ..builders import EmbedBuilder
@@ -61,6 +62,18 @@ class Interaction(BaseModel):
 
     guild_locale: None | :class:`str`
         The locale of the guild where the interaction was invoked.
+
+    responded: :class:`bool`
+        If the interaction was responded to, including deferred responses.
+
+    deferred: :class:`bool`
+        If the interaction was deferred and the response hasn't been sent yet.
+
+    ephemeral: :class:`bool`
+        If the loading state of the deferred response is ephemeral.
+
+    received_at: None | :class:`float`
+        When the interaction was received, in the loop's time.
     """
 
     snowflake: Snowflake = BaseModel.field("id", Snowflake)
@@ -80,18 +93,104 @@ class Interaction(BaseModel):
     locale: None | str = BaseModel.field(None, str)
     guild_locale: None | str = BaseModel.field(None, str)
 
+    responded: bool = attr.field(init=False, default=False)
+    deferred: bool = attr.field(init=False, default=False)
+    ephemeral: bool = attr.field(init=False, default=False)
+    received_at: None | float = attr.field(init=False, default=None, repr=False)
+    lock: asyncio.Lock = attr.field(init=False, factory=asyncio.Lock, repr=False)
+
     @BaseModel.property("type", InteractionType)
     def type(self, _: GatewayClient, data: int) -> InteractionType:
         return InteractionType(data)
 
-    async def modal(self, modal: Modal) -> None:
-        inter = {"type": InteractionResponse.MODAL, "data": modal.to_dict()}
-        await self.client.rest.request(
-            "POST",
-            Route(f"interactions/{self.snowflake}/{self.token}/callback"),
-            json=inter,
+    @property
+    def callback(self) -> Route:
+        """The route of the interaction's callback."""
+        return Route(
+            "interactions/{interaction_id}/{interaction_token}/callback",
+            interaction_id=self.snowflake,
+            interaction_token=self.token,
         )
 
+    def acknowledged(self, deferred: bool) -> None:
+        """Marks the interaction as responded to, recording the time it took."""
+        self.responded = True
+        self.deferred = deferred
+        self.client.interactions.acknowledged(self, deferred)
+
+    async def modal(self, modal: Modal, priority: Priority = Priority.HIGH) -> None:
+        """Responds to the interaction with a modal.
+
+        Parameters
+        ----------
+        modal: :class:`.Modal`
+            The modal to respond with.
+
+        priority: :class:`.Priority`
+            The priority of the request, see :meth:`.RESTClient.request`.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The interaction was already responded to, E.g deferred by the
+            :class:`.InteractionScheduler` once its budget passed.
+        """
+        inter = {"type": InteractionResponse.MODAL, "data": modal.to_dict()}
+
+        async with self.lock:
+            if self.responded is True:
+                raise ValueError(
+                    "The interaction was already responded to or deferred, "
+                    "modals have to be sent as the first response."
+                )
+
+            await self.client.rest.request(
+                "POST", self.callback, json=inter, priority=priority
+            )
+            self.acknowledged(False)
+
+    async def defer(
+        self, ephemeral: bool = False, priority: Priority = Priority.HIGH
+    ) -> bool:
+        """Acknowledges the interaction, responding to it later.
+
+        Components are deferred without a loading state, the message they're
+        attached to can be edited later. Other interactions show a loading state,
+        which is replaced by the next :meth:`send`.
+
+        Parameters
+        ----------
+        ephemeral: :class:`bool`
+            If the response should be ephemeral. Not used for components.
+
+        priority: :class:`.Priority`
+            The priority of the request, see :meth:`.RESTClient.request`.
+
+        Returns
+        -------
+        :class:`bool`
+            If the interaction was deferred. False if it was already responded to.
+        """
+        if self.type is InteractionType.COMPONENT:
+            inter: dict[str, Any] = {"type": InteractionResponse.DERFER_UPDATE}
+        else:
+            inter = {"type": InteractionResponse.DEFER_MESSAGE}
+
+            if ephemeral is not False:
+                inter["data"] = {"flags": 64}
+
+        async with self.lock:
+            if self.responded is True:
+                return False
+
+            await self.client.rest.request(
+                "POST", self.callback, json=inter, priority=priority
+            )
+            self.ephemeral = "data" in inter
+            self.acknowledged(True)
+
+        return True
+
     async def send(
         self,
         content: None | str = None,
@@ -102,9 +201,14 @@ class Interaction(BaseModel):
         reply: None | Message = None,
         ephemeral: bool = False,
         mentions: AllowedMentions = AllowedMentions(),
+        priority: Priority = Priority.HIGH,
     ) -> Message:
         """Sends a message to respond to an interaction.
 
+        Once the interaction was responded to, a followup message is sent instead.
+        The loading state of a deferred command is replaced by the message,
+        unless it doesn't match ``ephemeral``, in which case it's deleted.
+
         Parameters
         ----------
         content: None | :class:`str`
@@ -128,13 +232,17 @@ class Interaction(BaseModel):
         mentions: :class:`.AllowedMentions`
             The allowed mentions of the message.
 
+        priority: :class:`.Priority`
+            The priority of the requests, see :meth:`.RESTClient.request`.
+            Defaults to :attr:`.Priority.HIGH`, since interactions have to be
+            responded to within 3 seconds.
+
         Returns
         -------
         :class:`.Message`
-            An instance of the newly sent message.
+            An instance of the newly sent message. It's returned with the callback's
+            response, falling back to fetching it with :meth:`original`.
         """
-        org = Route(f"/webhooks/{self.application_id}/{self.token}/messages/@original")
-
         if content is None and len(embeds) == 0 and len(files) == 0:
             raise ValueError(
                 "Message must have at least `content`, `embeds` or `files`."
@@ -157,25 +265,98 @@ class Interaction(BaseModel):
         if ephemeral is not False:
             payload["flags"] = 64
 
-        inter = {"type": InteractionResponse.MESSAGE, "data": payload}
+        for file in files:
+            file.validate()
+
+        form = [file.field(index) for index, file in enumerate(files)]
+
+        async with self.lock:
+            if self.responded is True:
+                return await self.followup(payload, form, priority)
+
+            inter = {"type": InteractionResponse.MESSAGE, "data": payload}
+            data = await self.client.rest.request(
+                "POST",
+                self.callback,
+                json=inter,
+                form=form,
+                params={"with_response": "true"},
+                priority=priority,
+            )
+            self.acknowledged(False)
+
+        if isinstance(data, dict):
+            resource: dict[str, Any] = data.get("resource") or {}  # type: ignore
+
+            if (message := resource.get("message")) is not None:
+                return Message(self.client, message)
+
+        return await self.original(priority)
+
+    async def followup(
+        self, payload: dict[str, Any], form: list[dict[str, Any]], priority: Priority
+    ) -> Message:
+        original = Route(
+            "webhooks/{webhook_id}/{webhook_token}/messages/@original",
+            webhook_id=self.application_id,
+            webhook_token=self.token,
+        )
+
+        # Deferred components have no loading state, their @original is the
+        # message holding the components, which mustn't be overwritten.
+        loading = self.deferred is True and self.type is not InteractionType.COMPONENT
 
-        form: list[dict[Any, Any]] = []
-        for index, file in enumerate(files):
-            file_data = {
-                "content_type": "application/octect-stream",
-                "name": f"file-{index}" if index else "file",
-                "value": file.source,
-                "filename": file.name,
-            }
+        if loading and bool(payload.get("flags", 0) & 64) is self.ephemeral:
+            data = await self.client.rest.request(
+                "PATCH", original, json=payload, form=form, priority=priority
+            )
+            self.deferred = False
 
-            form.append(file_data)
+            return Message(self.client, data)
 
-        await self.client.rest.request(
+        if loading:
+            await self.client.rest.request("DELETE", original, priority=priority)
+
+        self.deferred = False
+
+        data = await self.client.rest.request(
             "POST",
-            Route(f"interactions/{self.snowflake}/{self.token}/callback"),
-            json=inter,
+            Route(
+                "webhooks/{webhook_id}/{webhook_token}",
+                webhook_id=self.application_id,
+                webhook_token=self.token,
+            ),
+            json=payload,
             form=form,
+            params={"wait": "true"},
+            priority=priority,
+        )
+
+        return Message(self.client, data)
+
+    async def original(self, priority: Priority = Priority.HIGH) -> Message:
+        """Fetches the original response of the interaction.
+
+        Parameters
+        ----------
+        priority: :class:`.Priority`
+            The priority of the request, see :meth:`.RESTClient.request`.
+
+        Raises
+        ------
+        :exc:`.HTTPException`
+            Something went wrong.
+
+        Returns
+        -------
+        :class:`.Message`
+            The message the interaction was responded with.
+        """
+        route = Route(
+            "webhooks/{webhook_id}/{webhook_token}/messages/@original",
+            webhook_id=self.application_id,
+            webhook_token=self.token,
         )
 
-        data = await self.client.rest.request("GET", org)
+        data = await self.client.rest.request("GET", route, priority=priority)
         return Message(self.client, data)
@@ -1,4 +1,5 @@
 from .components import *
+from .history import *
 from .mentions import *
 from .message import *
 from .types import *
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 import attr
 from typing_extensions import Self
 
+from ....utils import Serialized
 from .types import ComponentType
 
 if TYPE_CHECKING:
@@ -87,6 +88,9 @@ class ActionRow(metaclass=ActionRowMeta):
 
     type: ComponentType = attr.field(init=False, default=ComponentType.ACTIONROW)
     components: list[Component] = attr.field(init=False)
+    serialized: Serialized = attr.field(
+        init=False, factory=Serialized, repr=False, eq=False
+    )
 
     def __attrs_post_init__(self) -> None:
         self.components = []
@@ -102,15 +106,36 @@ class ActionRow(metaclass=ActionRowMeta):
         """
         self.components.extend(components)
 
-    def to_dict(self) -> dict[str, int | list[dict[Any, Any]]]:
+    def to_dict(self) -> dict[str, Any]:
         """Turns the Action row into a use-able dict.
 
+        The dict is memoized while the dicts of its components stay the same,
+        components memoizing their own dict are serialized only once.
+
         Returns
         -------
         :class:`dict`
             The dictionary representation of the action row.
         """
-        return {
-            "type": int(self.type),
-            "components": [c.to_dict() for c in self.components],
-        }
+        components = [c.to_dict() for c in self.components]
+        payload = self.serialized.payload
+
+        if (
+            payload is None
+            or len(payload["components"]) != len(components)
+            or any(a is not b for a, b in zip(payload["components"], components))
+        ):
+            payload = {"type": int(self.type), "components": components}
+            self.serialized.payload = payload
+
+        return payload
+
+    def to_json(self) -> bytes:
+        """Turns the Action row into JSON, memoized like :meth:`to_dict`.
+
+        Returns
+        -------
+        :class:`bytes`
+            The JSON representation of the action row.
+        """
+        return self.serialized.encode(self.to_dict())
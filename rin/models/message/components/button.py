@@ -6,6 +6,7 @@ from uuid import uuid4
 import attr
 from typing_extensions import Self
 
+from ....utils import Serialized
 from ...guild import PartialEmoji
 from .cache import ComponentCache
 from .types import ButtonStyle, ComponentType
@@ -39,23 +40,38 @@ class Button:
 
     disabled: :class:`bool`
         If the button is disabled.
+
+    timeout: None | :class:`float`
+        The seconds the button is registered for, see :meth:`.ComponentRegistry.register`.
     """
 
     label: str = attr.field()
     style: ButtonStyle = attr.field(default=ButtonStyle.PRIMARY)
-    custom_id: str = attr.field(default=uuid4().hex)
+    custom_id: str = attr.field(factory=lambda: uuid4().hex)
 
     url: None | str = attr.field(default=None)
     emoji: None | PartialEmoji = attr.field(default=None)
     disabled: bool = attr.field(default=False)
+    timeout: None | float = attr.field(default=None, kw_only=True)
 
     type: ComponentType = attr.field(init=False, default=ComponentType.BUTTON)
+    serialized: Serialized = attr.field(
+        init=False, factory=Serialized, repr=False, eq=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+
+        serialized = getattr(self, "serialized", None)
+
+        if name != "serialized" and serialized is not None:
+            serialized.clear()
 
     def __attrs_post_init__(self) -> None:
         if self.url is not None and self.type is not ButtonStyle.LINK:
             raise TypeError("Can only use URL when using `ButtonStyle.LINK`") from None
 
-        ComponentCache.cache.set(self.custom_id, self)
+        ComponentCache.cache.register(self, timeout=self.timeout)
 
     def set_callback(self, func: Callable[..., Coroutine[Any, Any, Any]]) -> Self:
         setattr(self, "callback", func)
@@ -64,8 +80,20 @@ class Button:
     async def callback(self, interaction: Interaction, component: Self) -> Any:
         return NotImplemented
 
-    def to_dict(self) -> dict[str, str | int | bool | dict[Any, Any]]:
-        payload: dict[str, str | int | bool | dict[Any, Any]] = {
+    def to_dict(self) -> dict[str, Any]:
+        """Turns the button into a use-able dict.
+
+        The dict is memoized until an attribute of the button is set.
+
+        Returns
+        -------
+        :class:`dict`
+            The dictionary representation of the button.
+        """
+        if self.serialized.payload is not None:
+            return self.serialized.payload
+
+        payload: dict[str, Any] = {
             "style": int(self.style),
             "type": int(self.type),
             "label": self.label,
@@ -83,8 +111,19 @@ class Button:
                 "animated": self.emoji.animated,
             }
 
+        self.serialized.payload = payload
         return payload
 
+    def to_json(self) -> bytes:
+        """Turns the button into JSON, memoized like :meth:`to_dict`.
+
+        Returns
+        -------
+        :class:`bytes`
+            The JSON representation of the button.
+        """
+        return self.serialized.encode(self.to_dict())
+
 
 def button(
     label: str,
@@ -93,6 +132,7 @@ def button(
     emoji: None | PartialEmoji = None,
     url: None | str = None,
     disabled: bool = False,
+    timeout: None | float = None,
 ) -> Callable[..., Button]:
     """Creates a button component.
     Sets the wrapped function as the button's callback.
@@ -115,11 +155,14 @@ def button(
 
     disabled: :class:`bool`
         If the button is disabled.
+
+    timeout: None | :class:`float`
+        The seconds the button is registered for.
     """
 
     def inner(func: Callable[..., Coroutine[Any, Any, Any]]) -> Button:
         return Button(
-            label, style, custom_id or uuid4().hex, url, emoji, disabled
+            label, style, custom_id or uuid4().hex, url, emoji, disabled, timeout=timeout
         ).set_callback(func)
 
     return inner
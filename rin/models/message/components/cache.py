@@ -1,16 +1,287 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import heapq
+import itertools
+import re
+import time
+from typing import TYPE_CHECKING, Iterator, Union
 
-from ...cacheable import Cache, Cacheable
+import attr
+
+from ...cacheable import Cache, Cacheable, CacheableMeta
 
 if TYPE_CHECKING:
     from .actionrow import Component
 
-__all__ = ("ComponentCache",)
+__all__ = ("ComponentCache", "ComponentRegistry")
+
+Pattern = Union[str, re.Pattern[str]]
+
+
+@attr.s(slots=True)
+class ComponentRegistry(Cache["Component"]):
+    """The registry of components, looked up by the custom ID of interactions.
+
+    Components are kept until unregistered, or until their timeout passes if they're
+    registered with one. Expired components are dropped whenever one is registered.
+    Passing ``max`` bounds the registry, dropping the least recently used component
+    once reached, including persistent ones, so it's only bounded if asked to.
+
+    Routes handle every custom ID matching a prefix or a regex, E.g ``vote:<poll_id>``.
+    Components whose custom ID is handled by a route aren't stored, so persistent
+    views only need one entry, instead of one per message.
+
+    .. code:: python
+
+        @rin.button("Vote", rin.ButtonStyle.PRIMARY, custom_id="vote:")
+        async def vote(interaction: rin.Interaction, _: rin.Button) -> None:
+            poll = interaction.actual_data["custom_id"].removeprefix("vote:")
+
+        rin.ComponentCache.cache.route("vote:", vote)
+
+    Parameters
+    ----------
+    max: None | :class:`int`
+        The max amount of components before dropping the least recently used one.
+        None, the default of :attr:`.ComponentCache.cache`, keeps every component.
+
+    timeout: None | :class:`float`
+        The default seconds components are kept for. None keeps them until dropped.
+
+    Attributes
+    ----------
+    expires: :class:`dict`
+        When each component expires, in :func:`time.monotonic` seconds.
+
+    deadlines: :class:`list`
+        A heap of the expiries, so expired components are found without a full scan.
+
+    routes: :class:`dict`
+        The components handling custom IDs matching a prefix or a regex.
+    """
+
+    timeout: None | float = attr.field(default=None, kw_only=True)
+
+    expires: dict[str | int, float] = attr.field(init=False, factory=dict, repr=False)
+    deadlines: list[tuple[float, int, str | int]] = attr.field(
+        init=False, factory=list, repr=False
+    )
+    counter: Iterator[int] = attr.field(init=False, factory=itertools.count, repr=False)
+    routes: dict[Pattern, Component] = attr.field(init=False, factory=dict, repr=False)
+
+    def __setitem__(self, key: str | int, value: Component) -> Component:
+        return self.register(value, key=key)
+
+    def register(
+        self,
+        component: Component,
+        *,
+        key: None | str | int = None,
+        timeout: None | float = None,
+    ) -> Component:
+        """Registers a component. Components are registered when created.
+
+        Parameters
+        ----------
+        component: :class:`.Component`
+            The component to register.
+
+        key: None | :class:`str` | :class:`int`
+            The key to register under. Defaults to the custom ID of the component.
+
+        timeout: None | :class:`float`
+            The seconds to keep the component for. Defaults to :attr:`timeout`.
+
+        Returns
+        -------
+        :class:`.Component`
+            The registered component.
+        """
+        key = component.custom_id if key is None else key
+
+        if isinstance(key, str) and self.match(key) is not None:
+            return component
+
+        self.root.pop(key, None)
+        self.expires.pop(key, None)
+        self.root[key] = component
+
+        if (timeout := self.timeout if timeout is None else timeout) is not None:
+            self.expires[key] = expires = time.monotonic() + timeout
+            heapq.heappush(self.deadlines, (expires, next(self.counter), key))
+
+        self.sweep()
+
+        if self.max:
+            while len(self.root) > self.max:
+                self.pop()
+
+        self.len = len(self.root)
+        return component
+
+    def unregister(self, component: Component | str | int) -> None | Component:
+        """Unregisters a component.
+
+        Parameters
+        ----------
+        component: :class:`.Component` | :class:`str` | :class:`int`
+            The component, or the key it's registered under.
+
+        Returns
+        -------
+        None | :class:`.Component`
+            The unregistered component, if it was registered.
+        """
+        key = getattr(component, "custom_id", component)
+
+        if key not in self.root:
+            return None
+
+        return self.pop(key)
+
+    def route(self, pattern: Pattern, component: Component) -> Component:
+        """Routes custom IDs to a component.
+
+        Parameters
+        ----------
+        pattern: :class:`str` | :class:`re.Pattern`
+            The prefix of the custom IDs, or a regex fully matching them.
+
+        component: :class:`.Component`
+            The component handling the custom IDs.
+
+        Returns
+        -------
+        :class:`.Component`
+            The component given.
+        """
+        self.routes[pattern] = component
+        self.unregister(component)
+
+        return component
+
+    def unroute(self, pattern: Pattern) -> None | Component:
+        """Removes a route.
+
+        Parameters
+        ----------
+        pattern: :class:`str` | :class:`re.Pattern`
+            The pattern of the route.
+
+        Returns
+        -------
+        None | :class:`.Component`
+            The component of the route, if there was one.
+        """
+        return self.routes.pop(pattern, None)
+
+    def match(self, custom_id: str) -> None | Component:
+        """Finds the route of a custom ID.
+
+        Parameters
+        ----------
+        custom_id: :class:`str`
+            The custom ID.
+
+        Returns
+        -------
+        None | :class:`.Component`
+            The component of the first matching route.
+        """
+        for pattern, component in self.routes.items():
+            if isinstance(pattern, str):
+                if custom_id.startswith(pattern):
+                    return component
+
+            elif pattern.fullmatch(custom_id) is not None:
+                return component
+
+        return None
+
+    def get(self, key: str | int) -> None | Component:
+        """Retrieves the component of a custom ID, falling back to the routes.
+
+        Parameters
+        ----------
+        key: :class:`str` | :class:`int`
+            The custom ID.
+
+        Returns
+        -------
+        None | :class:`.Component`
+            The component found, None if there was none or it expired.
+        """
+        expires = self.expires.get(key)
+
+        if expires is not None and expires <= time.monotonic():
+            self.pop(key)
+
+        if (value := self.root.pop(key, None)) is not None:
+            self.root[key] = value
+
+        elif isinstance(key, str):
+            value = self.match(key)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    def pop(self, key: None | str | int = None) -> Component:
+        """Pops a component, the least recently used one if no key is passed.
+
+        Parameters
+        ----------
+        key: None | :class:`str` | :class:`int`
+            The key to pop.
+
+        Returns
+        -------
+        :class:`.Component`
+            The popped component.
+        """
+        key = next(iter(self.root)) if key is None else key
+        value = self.root.pop(key)
+
+        self.expires.pop(key, None)
+        self.len = len(self.root)
+
+        return value
+
+    def sweep(self) -> int:
+        """Drops every expired component.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of components dropped.
+        """
+        now = time.monotonic()
+        dropped = 0
+
+        # The deadlines of re-registered or popped components are skipped.
+        while self.deadlines and self.deadlines[0][0] <= now:
+            expires, _, key = heapq.heappop(self.deadlines)
+
+            if self.expires.get(key) == expires:
+                self.pop(key)
+                dropped += 1
+
+        return dropped
+
+    def iterator(self) -> Iterator[Component]:
+        self.sweep()
+        yield from self.root.values()
 
 
 class ComponentCache(Cacheable):
-    """A components cache."""
+    """A components cache. The cache is a :class:`.ComponentRegistry`."""
+
+    cache: ComponentRegistry
+
 
-    cache: Cache[Component]
+ComponentCache.__cache__ = CacheableMeta.caches["ComponentCache"] = ComponentRegistry(
+    None
+)
@@ -47,7 +47,7 @@ class Modal(metaclass=ModalMeta):
     __components__: list[TextInput] = attr.field(init=False)
 
     title: str = attr.field()
-    custom_id: str = attr.field(default=uuid4().hex)
+    custom_id: str = attr.field(factory=lambda: uuid4().hex)
     components: list[TextInput] = attr.field(init=False)
 
     def __attrs_post_init__(self) -> None:
@@ -44,11 +44,14 @@ class TextInput:
 
     value: None | :class:`str`
         The pre-filled value of the text input.
+
+    timeout: None | :class:`float`
+        The seconds the text input is registered for, see :meth:`.ComponentRegistry.register`.
     """
 
     label: str = attr.field()
     style: TextInputStyle = attr.field()
-    custom_id: str = attr.field(default=uuid4().hex)
+    custom_id: str = attr.field(factory=lambda: uuid4().hex)
 
     min_length: int = attr.field(default=0)
     max_length: int = attr.field(default=4000)
@@ -56,11 +59,12 @@ class TextInput:
     required: bool = attr.field(default=True)
     placeholder: None | str = attr.field(default=None)
     value: None | str = attr.field(default=None)
+    timeout: None | float = attr.field(default=None, kw_only=True)
 
     type: ComponentType = attr.field(init=False, default=ComponentType.TEXTINPUT)
 
     def __attrs_post_init__(self) -> None:
-        ComponentCache.cache.set(self.custom_id, cast(Component, self))
+        ComponentCache.cache.register(cast(Component, self), timeout=self.timeout)
 
     def set_callback(self, func: Callable[..., Coroutine[Any, Any, Any]]) -> TextInput:
         setattr(self, "callback", func)
@@ -92,12 +96,13 @@ class TextInput:
 def text(
     label: str,
     style: TextInputStyle,
-    custom_id: str = uuid4().hex,
+    custom_id: None | str = None,
     min_length: int = 0,
     max_length: int = 4000,
     required: bool = True,
     placeholder: None | str = None,
     value: None | str = None,
+    timeout: None | float = None,
 ) -> Callable[..., TextInput]:
     """Creates a TextInput component.
     Sets the wrapped function as the text input's callback.
@@ -110,7 +115,7 @@ def text(
     style: :class:`.TextInputStyle`
         The style of the text input.
 
-    custom_id: :class:`str`
+    custom_id: None | :class:`str`
         The custom ID of the text input.
 
     min_length: :class:`int`
@@ -127,18 +132,22 @@ def text(
 
     value: None | :class:`str`
         The pre-filled value of the text input.
+
+    timeout: None | :class:`float`
+        The seconds the text input is registered for.
     """
 
     def inner(func: Callable[..., Coroutine[Any, Any, Any]]) -> TextInput:
         return TextInput(
             label=label,
             style=style,
-            custom_id=custom_id,
+            custom_id=custom_id or uuid4().hex,
             min_length=min_length,
             max_length=max_length,
             required=required,
             placeholder=placeholder,
             value=value,
+            timeout=timeout,
         ).set_callback(func)
 
     return inner
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+import attr
+
+from ...rest import Route
+from ..snowflake import Snowflake
+from .message import Message
+
+if TYPE_CHECKING:
+    from ...client import GatewayClient
+
+__all__ = ("History",)
+
+Page = list[dict[str, Any]]
+
+
+@attr.s(slots=True)
+class History:
+    """An async iterator over the messages of a channel.
+
+    Messages are fetched in pages of up to 100. While the messages of a page
+    are being consumed, the next page is already being fetched.
+
+    Messages are yielded newest first, or oldest first when ``after`` is given.
+
+    .. code:: python
+
+        async for message in channel.history(limit=500):
+            ...
+
+    Parameters
+    ----------
+    client: :class:`.GatewayClient`
+        The client to fetch with.
+
+    channel_id: :class:`.Snowflake` | :class:`int`
+        The snowflake of the channel.
+
+    limit: None | :class:`int`
+        The max amount of messages to yield. None yields the whole history.
+
+    before: None | :class:`.Snowflake` | :class:`int` | :class:`datetime.datetime`
+        Only yield messages sent before this snowflake or time.
+
+    after: None | :class:`.Snowflake` | :class:`int` | :class:`datetime.datetime`
+        Only yield messages sent after this snowflake or time.
+
+    raw: :class:`bool`
+        If the raw dicts of the messages should be yielded, skipping model construction.
+
+    cache: :class:`bool`
+        If the messages should be put into :attr:`.Message.cache`.
+
+    prefetch: :class:`bool`
+        If the next page should be fetched while the current one is consumed.
+    """
+
+    PAGE: int = 100
+
+    client: GatewayClient = attr.field(repr=False)
+    channel_id: Snowflake | int = attr.field()
+    limit: None | int = attr.field(default=100, kw_only=True)
+    before: None | Snowflake = attr.field(
+        default=None, kw_only=True, converter=Snowflake.coerce
+    )
+    after: None | Snowflake = attr.field(
+        default=None, kw_only=True, converter=Snowflake.coerce
+    )
+    raw: bool = attr.field(default=False, kw_only=True)
+    cache: bool = attr.field(default=False, kw_only=True)
+    prefetch: bool = attr.field(default=True, kw_only=True)
+
+    def __attrs_post_init__(self) -> None:
+        if self.before is not None and self.after is not None:
+            raise ValueError("Only one of `before` and `after` can be used.")
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.messages()
+
+    async def fetch(self, limit: int, cursor: None | Snowflake | int) -> Page:
+        """Fetches a page of messages.
+
+        Parameters
+        ----------
+        limit: :class:`int`
+            The amount of messages to fetch, up to 100.
+
+        cursor: None | :class:`.Snowflake` | :class:`int`
+            The snowflake to fetch before, or after if :attr:`after` was given.
+
+        Returns
+        -------
+        list[:class:`dict`]
+            The raw messages of the page, in the order they're yielded.
+        """
+        params = {"limit": str(limit)}
+
+        if cursor is not None:
+            params["after" if self.after is not None else "before"] = str(int(cursor))
+
+        page: Page = await self.client.rest.request(  # type: ignore
+            "GET",
+            Route("channels/{channel_id}/messages", channel_id=self.channel_id),
+            params=params,
+        )
+
+        return page[::-1] if self.after is not None else page
+
+    async def messages(self) -> AsyncIterator[Any]:
+        """Yields the messages of the channel.
+
+        Returns
+        -------
+        AsyncIterator[:class:`.Message` | :class:`dict`]
+            The messages, or their raw dicts if :attr:`raw` is True.
+        """
+        loop = self.client.loop or asyncio.get_running_loop()
+
+        remaining = self.limit
+        cursor = self.after if self.after is not None else self.before
+
+        def request() -> asyncio.Task[Page]:
+            size = self.PAGE if remaining is None else min(remaining, self.PAGE)
+            return loop.create_task(self.fetch(size, cursor))
+
+        task: None | asyncio.Task[Page] = request() if remaining != 0 else None
+
+        try:
+            while task is not None:
+                page = await task
+
+                if remaining is not None:
+                    page = page[:remaining]
+                    remaining -= len(page)
+
+                more = len(page) == self.PAGE and remaining != 0
+                if more:
+                    cursor = page[-1]["id"]
+
+                task = request() if more and self.prefetch else None
+
+                for data in page:
+                    yield (
+                        data
+                        if self.raw
+                        else Message(self.client, data, cached=self.cache)
+                    )
+
+                if more and task is None:
+                    task = request()
+        finally:
+            if task is not None:
+                task.cancel()
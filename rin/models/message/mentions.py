@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from typing import Any
+
 import attr
 
+from ...utils import Serialized
+
 __all__ = ("AllowedMentions",)
 
 
@@ -31,6 +35,17 @@ class AllowedMentions:
     users: bool | list[int] = attr.field(default=True)
     replied_user: bool = attr.field(default=True)
 
+    serialized: Serialized = attr.field(
+        init=False, factory=Serialized, repr=False, eq=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        serialized = getattr(self, "serialized", None)
+
+        if name != "serialized" and serialized is not None:
+            serialized.clear()
+
     @classmethod
     def none(cls: type[AllowedMentions]) -> AllowedMentions:
         """Creates a :class:`.AllowedMentions` instance that has no
@@ -43,15 +58,21 @@ class AllowedMentions:
         """
         return cls(everyone=False, roles=False, users=False, replied_user=False)
 
-    def to_dict(self) -> dict[str, bool | list[int] | list[str]]:
+    def to_dict(self) -> dict[str, Any]:
         """Turns the AllowedMentions instance into a usable dict.
 
+        The dict is memoized until an attribute is set. Lists of roles
+        or users mutated in place have to be set again.
+
         Returns
         -------
         :class:`dict`
             The created dict from the AllowedMentions instance.
         """
-        payload: dict[str, bool | list[int] | list[str]] = {
+        if self.serialized.payload is not None:
+            return self.serialized.payload
+
+        payload: dict[str, Any] = {
             "everyone": self.everyone,
             "replied_user": self.replied_user,
         }
@@ -71,4 +92,16 @@ class AllowedMentions:
                 payload["users"] = self.users
 
         payload["parse"] = parse
+        self.serialized.payload = payload
+
         return payload
+
+    def to_json(self) -> bytes:
+        """Turns the AllowedMentions instance into JSON, memoized like :meth:`to_dict`.
+
+        Returns
+        -------
+        :class:`bytes`
+            The JSON representation of the AllowedMentions instance.
+        """
+        return self.serialized.encode(self.to_dict())
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 import attr
 
@@ -111,6 +113,9 @@ class Message(BaseModel, Cacheable, max=1000):
     editted_at: :class:`datetime.datetime`
         The time when the message was editted. None if the message hasn't
         been editted.
+
+    cached: :class:`bool`
+        If the message is put into :attr:`.Message.cache`. Defaults to True.
     """
 
     snowflake: Snowflake = BaseModel.field("id", Snowflake)
@@ -145,10 +150,14 @@ class Message(BaseModel, Cacheable, max=1000):
     application: None | dict[Any, Any] = BaseModel.field(None, dict[str, Any])
     message_reference: None | Message = BaseModel.field(None, dict[str, Any])
 
+    cached: bool = attr.field(default=True, kw_only=True, repr=False)
+
     def __attrs_post_init__(self) -> None:
         super().__attrs_post_init__()
         self.type = MessageType(self.data["type"])
-        Message.cache.set(self.snowflake, self)
+
+        if self.cached is True:
+            Message.cache.set(self.snowflake, self)
 
     @BaseModel.property("embeds", list[EmbedBuilder])
     def embeds(self, _: GatewayClient, data: list[dict[Any, Any]]) -> list[EmbedBuilder]:
@@ -223,8 +232,9 @@ class Message(BaseModel, Cacheable, max=1000):
             Something went wrong.
         """
         route = Route(
-            f"/channels/{self.channel_id}/messages/{self.snowflake}",
+            "channels/{channel_id}/messages/{message_id}",
             channel_id=self.channel_id,
+            message_id=self.snowflake,
         )
 
         Message.cache.pop(self.snowflake)
@@ -244,8 +254,10 @@ class Message(BaseModel, Cacheable, max=1000):
             Something went wrong.
         """
         route = Route(
-            f"channels/{self.channel_id}/messages/{self.snowflake}/reactions/{reaction}/@me",
+            "channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me",
             channel_id=self.channel_id,
+            message_id=self.snowflake,
+            emoji=Message.quote(reaction),
         )
 
         await self.client.rest.request("PUT", route)
@@ -274,11 +286,110 @@ class Message(BaseModel, Cacheable, max=1000):
             path = path.snowflake
 
         route = Route(
-            f"/channels/{self.channel_id}/messages/{self.snowflake}/reactions/{reaction}/{path}"
+            "channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user_id}",
+            channel_id=self.channel_id,
+            message_id=self.snowflake,
+            emoji=Message.quote(reaction),
+            user_id=path,
         )
 
         await self.client.rest.request("DELETE", route)
 
+    @staticmethod
+    def quote(reaction: str) -> str:
+        """URL encodes a reaction, E.g ``"name:id"`` or an unicode emoji.
+
+        Parameters
+        ----------
+        reaction: :class:`str`
+            The reaction to encode.
+
+        Returns
+        -------
+        :class:`str`
+            The encoded reaction, safe to use in a route.
+        """
+        # Custom emojis may be passed in their mention form, E.g ``<a:name:id>``.
+        reaction = reaction.strip("<>").removeprefix("a:").lstrip(":")
+        return quote(reaction, safe=":")
+
+    async def react_many(self, *reactions: str) -> None:
+        """Adds many reactions to the message, in order.
+
+        The reactions are paced through the client's reaction pacer,
+        instead of being sent at once and running into the reaction ratelimit.
+
+        Parameters
+        ----------
+        reactions: :class:`str`
+            The reactions to react with.
+
+        Raises
+        ------
+        :exc:`.HTTPException`
+            Something went wrong, the remaining reactions are cancelled.
+        """
+        template = "channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
+        await self._paced("PUT", template, reactions, "@me")
+
+    async def remove_reactions(
+        self, *reactions: str, user: None | User | Snowflake | int = None
+    ) -> None:
+        """Deletes many reactions from the message, in order.
+
+        Parameters
+        ----------
+        reactions: :class:`str`
+            The reactions to delete from the message.
+
+        user: None | :class:`.User` | :class:`.Snowflake` | :class:`int`
+            The user to remove the reactions from.
+            If no user is passed the user will be defaulted to the current authorised user.
+
+        Raises
+        ------
+        :exc:`.HTTPException`
+            Something went wrong, the remaining deletions are cancelled.
+        """
+        path = "@me" if user is None else user
+        if isinstance(path, User):
+            path = path.snowflake
+
+        template = (
+            "channels/{channel_id}/messages/{message_id}/reactions/{emoji}/{user_id}"
+        )
+        await self._paced("DELETE", template, reactions, path)
+
+    async def _paced(
+        self, method: str, template: str, reactions: tuple[str, ...], user_id: Any
+    ) -> None:
+        rest = self.client.rest
+        loop = self.client.loop
+
+        async def request(emoji: str) -> None:
+            await rest.reactions.wait(self.channel_id, loop)
+
+            route = Route(
+                template,
+                channel_id=self.channel_id,
+                message_id=self.snowflake,
+                emoji=emoji,
+                user_id=user_id,
+            )
+            await rest.request(method, route)
+
+        # Each emoji is encoded once, duplicates would only be ratelimited.
+        emojis = dict.fromkeys(Message.quote(reaction) for reaction in reactions)
+        tasks = [loop.create_task(request(emoji)) for emoji in emojis]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def pin(self) -> None:
         """Pins the message.
 
@@ -288,8 +399,9 @@ class Message(BaseModel, Cacheable, max=1000):
             Something went wrong while making the request.
         """
         route = Route(
-            f"channels/{self.channel_id}/pins/{self.snowflake}",
+            "channels/{channel_id}/pins/{message_id}",
             channel_id=self.channel_id,
+            message_id=self.snowflake,
         )
 
         await self.client.rest.request("PUT", route)
@@ -303,8 +415,9 @@ class Message(BaseModel, Cacheable, max=1000):
             Something went wrong while making the request.
         """
         route = Route(
-            f"channels/{self.channel_id}/pins/{self.snowflake}",
+            "channels/{channel_id}/pins/{message_id}",
             channel_id=self.channel_id,
+            message_id=self.snowflake,
         )
 
         await self.client.rest.request("DELETE", route)
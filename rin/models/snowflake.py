@@ -1,18 +1,266 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+from array import array
+from datetime import datetime, timezone
+from typing import Any, ClassVar, Iterable, Union
 
-__all__ = ("Snowflake",)
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore
+
+__all__ = (
+    "Snowflake",
+    "snowflake_array",
+    "snowflake_timestamps",
+    "deconstruct_snowflakes",
+    "snowflake_range",
+    "bucket_snowflakes",
+)
+
+# A numpy.ndarray if NumPy is installed, otherwise an array.array.
+SnowflakeArray = Union["array[int]", Any]
 
 
 class Snowflake(int):
     """Represents a snowflake."""
 
+    EPOCH: ClassVar[int] = 1420070400000
+
     def __new__(cls, *args: Any, **kwargs: Any) -> Snowflake:
         return super().__new__(cls, *args, **kwargs)
 
+    @property
+    def timestamp(self) -> int:
+        """The time at which the snowflake was created, in milliseconds since the epoch."""
+        return (self >> 22) + Snowflake.EPOCH
+
     @property
     def created_at(self) -> datetime:
-        """The time at which the snowflake was created."""
-        return datetime.fromtimestamp(((self >> 22) + 1420070400000) / 1000)
+        """The time at which the snowflake was created, in UTC."""
+        return datetime.fromtimestamp(self.timestamp / 1000, tz=timezone.utc)
+
+    @property
+    def worker_id(self) -> int:
+        """The internal worker ID of the snowflake."""
+        return (self >> 17) & 0x1F
+
+    @property
+    def process_id(self) -> int:
+        """The internal process ID of the snowflake."""
+        return (self >> 12) & 0x1F
+
+    @property
+    def increment(self) -> int:
+        """The increment of the snowflake, for every ID generated on its process."""
+        return self & 0xFFF
+
+    @classmethod
+    def from_timestamp(cls, timestamp: float) -> Snowflake:
+        """Creates the lowest snowflake of a time.
+
+        Snowflakes created at or after the time compare greater than or equal to it.
+
+        Parameters
+        ----------
+        timestamp: :class:`float`
+            The time, in seconds since the epoch.
+
+        Returns
+        -------
+        :class:`.Snowflake`
+            The created snowflake.
+        """
+        return cls(max(int(timestamp * 1000) - Snowflake.EPOCH, 0) << 22)
+
+    @classmethod
+    def from_datetime(cls, time: datetime) -> Snowflake:
+        """Creates the lowest snowflake of a datetime, E.g for ``before`` and ``after``.
+
+        Naive datetimes are assumed to be in UTC.
+
+        Parameters
+        ----------
+        time: :class:`datetime.datetime`
+            The time to create the snowflake of.
+
+        Returns
+        -------
+        :class:`.Snowflake`
+            The created snowflake.
+        """
+        if time.tzinfo is None:
+            time = time.replace(tzinfo=timezone.utc)
+
+        return cls.from_timestamp(time.timestamp())
+
+    @classmethod
+    def coerce(cls, value: None | Snowflake | int | datetime) -> None | Snowflake:
+        """Converts an int or datetime into a snowflake, keeping None."""
+        if value is None or isinstance(value, Snowflake):
+            return value
+
+        if isinstance(value, datetime):
+            return cls.from_datetime(value)
+
+        return cls(value)
+
+
+def snowflake_array(snowflakes: Iterable[int]) -> SnowflakeArray:
+    """Packs snowflakes into an unsigned 64 bit array.
+
+    Parameters
+    ----------
+    snowflakes: Iterable[:class:`int`]
+        The snowflakes to pack. Arrays are used as is.
+
+    Returns
+    -------
+    :class:`numpy.ndarray` | :class:`array.array`
+        The packed snowflakes.
+    """
+    if numpy is not None:
+        if isinstance(snowflakes, numpy.ndarray):
+            return snowflakes.astype(numpy.uint64, copy=False)
+
+        return numpy.fromiter(snowflakes, dtype=numpy.uint64)
+
+    if isinstance(snowflakes, array) and snowflakes.typecode == "Q":
+        return snowflakes
+
+    return array("Q", snowflakes)
+
+
+def _shift(
+    snowflakes: SnowflakeArray, shift: int, mask: int, typecode: str
+) -> SnowflakeArray:
+    if numpy is not None:
+        return ((snowflakes >> numpy.uint64(shift)) & numpy.uint64(mask)).astype(
+            numpy.int64
+        )
+
+    return array(typecode, [(s >> shift) & mask for s in snowflakes])
+
+
+def snowflake_timestamps(snowflakes: Iterable[int]) -> SnowflakeArray:
+    """Gets the creation times of many snowflakes at once.
+
+    Parameters
+    ----------
+    snowflakes: Iterable[:class:`int`]
+        The snowflakes to get the creation times of.
+
+    Returns
+    -------
+    :class:`numpy.ndarray` | :class:`array.array`
+        The creation times, in milliseconds since the epoch.
+    """
+    packed = snowflake_array(snowflakes)
+
+    if numpy is not None:
+        return (packed >> numpy.uint64(22)).astype(numpy.int64) + Snowflake.EPOCH
+
+    return array("q", [(s >> 22) + Snowflake.EPOCH for s in packed])
+
+
+def deconstruct_snowflakes(
+    snowflakes: Iterable[int],
+) -> tuple[SnowflakeArray, SnowflakeArray, SnowflakeArray, SnowflakeArray]:
+    """Splits many snowflakes into their parts at once.
+
+    Parameters
+    ----------
+    snowflakes: Iterable[:class:`int`]
+        The snowflakes to split.
+
+    Returns
+    -------
+    tuple[:class:`numpy.ndarray` | :class:`array.array`, ...]
+        The creation times in milliseconds since the epoch, the worker IDs,
+        the process IDs and the increments of the snowflakes.
+    """
+    packed = snowflake_array(snowflakes)
+
+    return (
+        snowflake_timestamps(packed),
+        _shift(packed, 17, 0x1F, "B"),
+        _shift(packed, 12, 0x1F, "B"),
+        _shift(packed, 0, 0xFFF, "H"),
+    )
+
+
+def snowflake_range(
+    start: float | datetime, end: float | datetime
+) -> tuple[Snowflake, Snowflake]:
+    """Creates the snowflakes bounding a time window, E.g for ``after`` and ``before``.
+
+    Parameters
+    ----------
+    start: :class:`float` | :class:`datetime.datetime`
+        The start of the window, in seconds since the epoch or as a datetime.
+
+    end: :class:`float` | :class:`datetime.datetime`
+        The end of the window, in seconds since the epoch or as a datetime.
+
+    Returns
+    -------
+    tuple[:class:`.Snowflake`, :class:`.Snowflake`]
+        The highest snowflake before the window and the lowest snowflake after it,
+        so every snowflake created inside the window is strictly between the two.
+    """
+    lower, upper = (
+        (
+            Snowflake.from_datetime(time)
+            if isinstance(time, datetime)
+            else Snowflake.from_timestamp(time)
+        )
+        for time in (start, end)
+    )
+
+    return Snowflake(max(lower - 1, 0)), upper
+
+
+def bucket_snowflakes(
+    snowflakes: Iterable[int], window: float
+) -> dict[int, SnowflakeArray]:
+    """Groups snowflakes by the time window they were created in.
+
+    .. code:: python
+
+        for start, messages in bucket_snowflakes(snowflakes, 60 * 60).items():
+            print(start, len(messages))
+
+    Parameters
+    ----------
+    snowflakes: Iterable[:class:`int`]
+        The snowflakes to group.
+
+    window: :class:`float`
+        The length of the windows, in seconds.
+
+    Returns
+    -------
+    dict[:class:`int`, :class:`numpy.ndarray` | :class:`array.array`]
+        The snowflakes of each window, keyed by the window's start in milliseconds
+        since the epoch, in ascending order. Empty windows are left out.
+    """
+    size = int(window * 1000)
+    if size <= 0:
+        raise ValueError("The window must be at least a millisecond.")
+
+    packed = snowflake_array(snowflakes)
+    starts = snowflake_timestamps(packed)
+
+    if numpy is not None:
+        starts -= starts % size
+        order = numpy.argsort(starts, kind="stable")
+        keys, indices = numpy.unique(starts[order], return_index=True)
+        groups = numpy.split(packed[order], indices[1:])
+
+        return {int(key): group for key, group in zip(keys.tolist(), groups)}
+
+    buckets: dict[int, array[int]] = {}
+    for snowflake, created in zip(packed, starts):
+        buckets.setdefault(created - created % size, array("Q")).append(snowflake)
+
+    return dict(sorted(buckets.items()))
@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import base64
-
 import attr
-import magic
 
 from ..rest import Route
+from ..utils import data_uri
 from .base import BaseModel
 from .cacheable import Cacheable
 from .snowflake import Snowflake
@@ -117,10 +115,7 @@ class User(BaseModel, Cacheable):
                 payload["username"] = username
 
             if avatar is not None:
-                mime = magic.from_buffer(avatar, mime=True)
-                payload[
-                    "avatar"
-                ] = f"data:{mime};base64,{base64.b64encode(avatar).decode('ascii')}"
+                payload["avatar"] = await self.client.run_blocking(data_uri, avatar)
 
             self.data = await self.client.rest.request(
                 "PATCH", Route("users/@me"), json=payload
@@ -1,3 +1,7 @@
+from .cache import *
 from .errors import *
 from .handler import *
+from .options import *
+from .pacer import *
+from .priority import *
 from .ratelimiter import *
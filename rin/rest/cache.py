@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Mapping
+
+import attr
+
+if TYPE_CHECKING:
+    from .handler import Route
+
+__all__ = ("CachedResponse", "ResponseCache")
+
+
+@attr.s(slots=True)
+class CachedResponse:
+    """A cached response of a GET request.
+
+    Attributes
+    ----------
+    path: :class:`str`
+        The path of the route requested.
+
+    data: Any
+        The data of the response.
+
+    etag: None | :class:`str`
+        The ``ETag`` header of the response, used to revalidate it.
+
+    expires_at: :class:`float`
+        When the response goes stale, in seconds since the epoch.
+    """
+
+    path: str = attr.field()
+    data: Any = attr.field(repr=False)
+    etag: None | str = attr.field()
+    expires_at: float = attr.field()
+
+    def fresh(self, now: float) -> bool:
+        """If the response can be used without revalidating it."""
+        return now < self.expires_at
+
+
+@attr.s(slots=True)
+class ResponseCache:
+    """A read-through cache of GET responses, used by the RESTClient.
+
+    Responses are kept for the TTL of their route template, or the ``max-age``
+    of their ``Cache-Control`` header. Stale responses with an ``ETag`` are
+    revalidated with ``If-None-Match``. A PATCH, PUT, POST or DELETE to a route
+    drops the cached responses of the route and the collection it belongs to.
+
+    .. code:: python
+
+        cache = rin.ResponseCache(ttl=10, ttls={"guilds/{guild_id}/roles": 60})
+        client = rin.GatewayClient(token, cache=cache)
+
+    Parameters
+    ----------
+    ttl: :class:`float`
+        The seconds responses are kept for by default.
+
+    maxsize: :class:`int`
+        The max amount of responses before the least recently used is dropped.
+
+    ttls: dict[:class:`str`, :class:`float`]
+        The TTLs of route templates, overriding the default. 0 disables caching,
+        even if the responses allow it with ``Cache-Control``.
+
+    Attributes
+    ----------
+    entries: :class:`collections.OrderedDict`
+        The cached responses, least recently used first.
+
+    hits: :class:`int`
+        The lookups which found a fresh response.
+
+    misses: :class:`int`
+        The lookups which found nothing or a stale response.
+    """
+
+    ttl: float = attr.field(default=5.0)
+    maxsize: int = attr.field(default=1024)
+    ttls: dict[str, float] = attr.field(factory=lambda: {"gateway/bot": 60.0})
+
+    entries: OrderedDict[str, CachedResponse] = attr.field(
+        init=False, factory=OrderedDict, repr=False
+    )
+    hits: int = attr.field(init=False, default=0)
+    misses: int = attr.field(init=False, default=0)
+
+    def get(self, key: str) -> None | CachedResponse:
+        """Gets a cached response, fresh or stale.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the request.
+
+        Returns
+        -------
+        None | :class:`.CachedResponse`
+            The cached response if found.
+        """
+        if (entry := self.entries.get(key)) is None:
+            self.misses += 1
+            return None
+
+        if entry.fresh(time.time()):
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(
+        self, key: str, route: Route, data: Any, headers: Mapping[str, str]
+    ) -> None | CachedResponse:
+        """Caches a response, following its ``Cache-Control`` header.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the request.
+
+        route: :class:`.Route`
+            The route requested.
+
+        data: Any
+            The data of the response.
+
+        headers: Mapping[:class:`str`, :class:`str`]
+            The headers of the response.
+
+        Returns
+        -------
+        None | :class:`.CachedResponse`
+            The cached response, None if it should not be cached.
+        """
+        ttl = self.ttl_of(route, headers)
+
+        if ttl == 0:
+            self.entries.pop(key, None)
+            return None
+
+        entry = CachedResponse(route.path, data, headers.get("ETag"), time.time() + ttl)
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+        return entry
+
+    def refresh(
+        self, entry: CachedResponse, route: Route, headers: Mapping[str, str]
+    ) -> None:
+        """Extends a stale response after the API reported it unchanged.
+
+        Parameters
+        ----------
+        entry: :class:`.CachedResponse`
+            The revalidated response.
+
+        route: :class:`.Route`
+            The route requested.
+
+        headers: Mapping[:class:`str`, :class:`str`]
+            The headers of the ``304`` response.
+        """
+        entry.expires_at = time.time() + self.ttl_of(route, headers)
+        entry.etag = headers.get("ETag", entry.etag)
+
+    def ttl_of(self, route: Route, headers: Mapping[str, str]) -> float:
+        """Gets the TTL of a response.
+
+        Parameters
+        ----------
+        route: :class:`.Route`
+            The route requested.
+
+        headers: Mapping[:class:`str`, :class:`str`]
+            The headers of the response.
+
+        Returns
+        -------
+        :class:`float`
+            The seconds the response is fresh for. 0 if it should not be cached,
+            negative if it should be cached but revalidated on every request.
+        """
+        ttl = self.ttls.get(route.template, self.ttl)
+        if ttl == 0:
+            return 0
+
+        directives = [
+            d.strip().lower() for d in headers.get("Cache-Control", "").split(",")
+        ]
+
+        for directive in directives:
+            if directive.startswith("max-age=") and directive[8:].isdigit():
+                ttl = int(directive[8:])
+
+        if "no-store" in directives:
+            return 0
+
+        if "no-cache" in directives:
+            return -1 if "ETag" in headers else 0
+
+        return ttl
+
+    def invalidate(self, route: Route) -> int:
+        """Drops the cached responses a write to a route affects.
+
+        Parameters
+        ----------
+        route: :class:`.Route`
+            The route written to.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of responses dropped.
+        """
+        parent = route.path.rsplit("/", 1)[0]
+        keys = [
+            key
+            for key, entry in self.entries.items()
+            if entry.path in (route.path, parent)
+            or entry.path.startswith(route.path + "/")
+        ]
+
+        for key in keys:
+            del self.entries[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drops every cached response."""
+        self.entries.clear()
@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from typing import Any
 
-__all__ = ("HTTPException", "Unauthorized", "BadRequest", "Forbidden", "NotFound")
+__all__ = (
+    "HTTPException",
+    "Unauthorized",
+    "BadRequest",
+    "Forbidden",
+    "NotFound",
+    "TooManyRequests",
+)
 
 
 class HTTPException(Exception):
@@ -59,3 +66,9 @@ class NotFound(HTTPException):
     """Represents a 404 HTTP error."""
 
     pass
+
+
+class TooManyRequests(HTTPException):
+    """Represents a 429 HTTP error, raised once a request runs out of attempts."""
+
+    pass
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import aiohttp
 import attr
 
-from .errors import BadRequest, Forbidden, NotFound, Unauthorized
-from .ratelimiter import RatelimitedClientResponse, Ratelimiter
+from ..telemetry import Counter
+from .cache import ResponseCache
+from .errors import BadRequest, Forbidden, NotFound, TooManyRequests, Unauthorized
+from .options import HTTPOptions
+from .pacer import Pacer
+from .priority import Priority
+from .ratelimiter import Bucket, GlobalRatelimit, RatelimitedClientResponse, Ratelimiter
 
 if TYPE_CHECKING:
     from ..client import GatewayClient
@@ -16,9 +22,15 @@ if TYPE_CHECKING:
 __all__ = ("RESTClient", "Route")
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, init=False)
 class Route:
     BASE = "https://discord.com/api/v{0}/"
+    MAJOR: ClassVar[tuple[str, ...]] = (
+        "channel_id",
+        "guild_id",
+        "webhook_id",
+        "webhook_token",
+    )
 
     """Route used for RESTful requests.
 
@@ -27,68 +39,86 @@ class Route:
     RESTful calls. The wrapper will instead utilize Routes in class depedent
     methods to make their respective requests.
 
+    .. code:: python
+
+        route = Route(
+            "channels/{channel_id}/messages/{message_id}",
+            channel_id=channel_id,
+            message_id=message_id,
+        )
+
     Parameters
     ----------
-    endpoint: :class:`str`
-        The endpoint of the Route.
+    template: :class:`str`
+        The path template of the Route, formatted with the parameters.
 
     version: :class:`str`
         The version of the RESTful API to use.
 
-    channel_id: None | :class:`int`
-        The channel ID being used. This is used for bucket specificity.
+    params: Any
+        The parameters of the template. ``channel_id``, ``guild_id``,
+        ``webhook_id`` and ``webhook_token`` are major parameters,
+        which are used for bucket specificity.
 
-    guild_id: None | :class:`int`
-        The guild ID being used. This is used for bucket specificity.
+    Attributes
+    ----------
+    template: :class:`str`
+        The path template of the route.
 
-    webhook_id: None | :class:`int`
-        The webhook ID being used. This is used for bucket specificity.
+    params: dict[:class:`str`, Any]
+        The parameters of the template.
 
-    webhook_token: None | :class:`str`
-        The webhook token being used. This is used for bucket specificity.
+    path: :class:`str`
+        The endpoint of the route, relative to the API's base url.
 
-    Attributes
-    ----------
     endpoint: :class:`str`
         The fully formed endpoint of the route.
+    """
 
-    event: :class:`asyncio.Event`
-        The event used for the bucket once depleted. Used in
-        tandem with the concurrent request ratelimit system. Allowing safe
-        concurrent requests.
+    template: str = attr.field()
+    version: int = attr.field()
+    params: dict[str, Any] = attr.field()
 
-    channel_id: None | :class:`int`
-        The channel ID being used. This is used for bucket specificity.
+    path: str = attr.field()
+    endpoint: str = attr.field()
 
-    guild_id: None | :class:`int`
-        The guild ID being used. This is used for bucket specificity.
+    def __init__(self, template: str, *, version: int = 10, **params: Any) -> None:
+        self.template = template.lstrip("/")
+        self.version = version
+        self.params = params
 
-    webhook_id: None | :class:`int`
-        The webhook ID being used. This is used for bucket specificity.
+        self.path = self.template.format_map(params)
+        self.endpoint = Route.BASE.format(self.version) + self.path
 
-    webhook_token: None | :class:`str`
-        The webhook token being used. This is used for bucket specificity.
-    """
+    @property
+    def channel_id(self) -> None | int:
+        """The channel ID being used, if any."""
+        return self.params.get("channel_id")
 
-    endpoint: str = attr.field()
-    version: int = attr.field(kw_only=True, default=10)
+    @property
+    def guild_id(self) -> None | int:
+        """The guild ID being used, if any."""
+        return self.params.get("guild_id")
 
-    channel_id: None | int = attr.field(kw_only=True, default=None)
-    guild_id: None | int = attr.field(kw_only=True, default=None)
-    webhook_id: None | int = attr.field(kw_only=True, default=None)
-    webhook_token: None | str = attr.field(kw_only=True, default=None)
+    @property
+    def webhook_id(self) -> None | int:
+        """The webhook ID being used, if any."""
+        return self.params.get("webhook_id")
 
-    event: asyncio.Event = attr.field(init=False)
+    @property
+    def webhook_token(self) -> None | str:
+        """The webhook token being used, if any."""
+        return self.params.get("webhook_token")
 
-    def __attrs_post_init__(self) -> None:
-        self.endpoint = Route.BASE.format(self.version) + self.endpoint
-        self.event = asyncio.Event()
-        self.event.set()
+    @property
+    def major(self) -> str:
+        """The major parameters of the Route, which split a bucket hash."""
+        return "/".join(str(self.params.get(name)) for name in Route.MAJOR)
 
     @property
     def bucket(self) -> str:
-        """The bucket of the Route."""
-        return f"{self.channel_id}/{self.guild_id}/{self.webhook_id}/{self.endpoint}"
+        """The bucket of the Route. Made from the template and major parameters."""
+        return f"{self.major}:{self.template}"
 
 
 @attr.s(slots=True)
@@ -102,6 +132,7 @@ class RESTClient:
     .. note::
 
         The `session` attribute is only set after at least 1 request.
+        The session is reused by every request until the client is closed.
 
     Parameters
     ----------
@@ -111,20 +142,60 @@ class RESTClient:
     client: :class:`.GatewayClient`
         The client being used.
 
+    base: :class:`str`
+        The base url of the API, formatted with the version of each route.
+        Defaults to :attr:`.Route.BASE`.
+
+    max_attempts: :class:`int`
+        The times a request is attempted before giving up on ratelimits.
+
+    http: :class:`.HTTPOptions`
+        The connection pool and timeout options of the sessions.
+
+    cache: None | :class:`.ResponseCache`
+        The cache of GET responses. Disabled by default.
+
+    max_buckets: :class:`int`
+        The amount of buckets kept before the idle ones are dropped.
+
     Attributes
     ----------
     session: :class:`aiohttp.ClientSession`
         The session assiocated with the RESTClient.
 
+    gateway_session: None | :class:`aiohttp.ClientSession`
+        The session used for the gateway connection,
+        if :attr:`.HTTPOptions.separate_gateway` is enabled.
+
     token: :class:`str`
         The token used for authorization.
 
     client: :class:`.GatewayClient`
         The client being used.
 
-    semaphores: dict[str, :class:`asyncio.Semaphore`]
-        The semaphores used for each bucket. This is used to
-        ensure safety and allowing concurrent requests.
+    ratelimit: :class:`.GlobalRatelimit`
+        The client-wide ratelimit, shared by every request.
+
+    buckets: dict[str, :class:`.Bucket`]
+        The ratelimit state of each bucket, kept across requests.
+
+    hashes: dict[str, :class:`str`]
+        The ``X-RateLimit-Bucket`` hashes discovered for each route template.
+
+    inflight: dict[:class:`str`, :class:`asyncio.Task`]
+        The GET requests currently being made, keyed by their route and parameters.
+
+    reactions: :class:`.Pacer`
+        The pacer of reaction requests, keyed by channel.
+
+    requests: :class:`.Counter`
+        The requests made, labelled by bucket, method and status.
+
+    coalesced: :class:`.Counter`
+        The GET requests which shared an in-flight request, labelled by bucket.
+
+    sleeps: :class:`.Counter`
+        The seconds spent sleeping on ratelimits, labelled by bucket.
     """
 
     GATEWAY_TYPE: ClassVar[type[Gateway]]
@@ -133,26 +204,84 @@ class RESTClient:
         401: Unauthorized,
         403: Forbidden,
         404: NotFound,
+        429: TooManyRequests,
     }
 
     token: str = attr.field()
     client: GatewayClient = attr.field()
-
-    semaphores: dict[str, asyncio.Semaphore] = attr.field(init=False)
+    base: str = attr.field(kw_only=True, default=Route.BASE)
+    max_attempts: int = attr.field(kw_only=True, default=5)
+    http: HTTPOptions = attr.field(kw_only=True, factory=HTTPOptions)
+    cache: None | ResponseCache = attr.field(kw_only=True, default=None)
+    max_buckets: int = attr.field(kw_only=True, default=4096)
+
+    ratelimit: GlobalRatelimit = attr.field(init=False, factory=GlobalRatelimit)
+    buckets: dict[str, Bucket] = attr.field(init=False, factory=dict)
+    hashes: dict[str, str] = attr.field(init=False, factory=dict)
+    inflight: dict[str, asyncio.Task[Any]] = attr.field(
+        init=False, factory=dict, repr=False
+    )
+    reactions: Pacer = attr.field(init=False, factory=Pacer, repr=False)
     session: aiohttp.ClientSession = attr.field(init=False)
+    gateway_session: None | aiohttp.ClientSession = attr.field(init=False, default=None)
+
+    requests: Counter = attr.field(init=False, repr=False)
+    sleeps: Counter = attr.field(init=False, repr=False)
+    coalesced: Counter = attr.field(init=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
-        self.semaphores: dict[str, asyncio.Semaphore] = {"global": asyncio.Semaphore(50)}
+        metrics = self.client.metrics
+        self.requests = metrics.counter(
+            "rin_rest_requests_total",
+            "REST requests made.",
+            ("bucket", "method", "status"),
+        )
+        self.sleeps = metrics.counter(
+            "rin_rest_ratelimit_sleep_seconds_total",
+            "Seconds slept on ratelimits.",
+            ("bucket",),
+        )
+        self.coalesced = metrics.counter(
+            "rin_rest_coalesced_total",
+            "GET requests which shared an in-flight request.",
+            ("bucket",),
+        )
 
     async def _create_session(self) -> aiohttp.ClientSession:
         if hasattr(self, "session"):
             return self.session
 
         return aiohttp.ClientSession(
+            connector=self.http.connector(),
+            timeout=self.http.client_timeout(),
             response_class=RatelimitedClientResponse,
             loop=self.client.loop,
         )
 
+    async def close(self) -> None:
+        """Closes the sessions of the RESTClient."""
+        if hasattr(self, "session"):
+            await self.session.close()
+
+        if self.gateway_session is not None:
+            await self.gateway_session.close()
+            self.gateway_session = None
+
+    def url(self, route: Route) -> str:
+        """Creates the url of a route using the client's base url.
+
+        Parameters
+        ----------
+        route: :class:`.Route`
+            The route to create the url of.
+
+        Returns
+        -------
+        :class:`str`
+            The fully formed url of the route.
+        """
+        return self.base.format(route.version) + route.path
+
     async def connect(self, url: str) -> aiohttp.ClientWebSocketResponse:
         """Makes a connection to the gateway.
 
@@ -166,6 +295,14 @@ class RESTClient:
         :class:`.Gateway`
             The gateway after connection is made.
         """
+        if self.http.separate_gateway:
+            if self.gateway_session is None:
+                self.gateway_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=1), loop=self.client.loop
+                )
+
+            return await self.gateway_session.ws_connect(url)
+
         if not hasattr(self, "session"):
             self.session = await self._create_session()
 
@@ -174,7 +311,8 @@ class RESTClient:
     async def _request(
         self, method: str, endpoint: str, **kwargs: Any
     ) -> RatelimitedClientResponse:
-        self.session = await self._create_session()
+        if not hasattr(self, "session"):
+            self.session = await self._create_session()
 
         return await self.session.request(  # type: ignore
             method,
@@ -183,12 +321,25 @@ class RESTClient:
             **kwargs,
         )
 
-    async def request(self, method: str, route: Route, **kwargs: Any) -> Any:
+    async def request(
+        self,
+        method: str,
+        route: Route,
+        *,
+        coalesce: bool = True,
+        priority: Priority = Priority.NORMAL,
+        **kwargs: Any,
+    ) -> Any:
         """Makes a request to the Route.
 
         A safe request method of the client. Ensures bucket depletion is safe
         along with global ratelimits.
 
+        Concurrent GET requests to the same route with the same parameters are
+        coalesced, only one request is made and every caller receives its data.
+        The data is shared, so it should not be mutated. The same goes for
+        data served from the :attr:`cache`, if one is set.
+
         Parameters
         ----------
         method: :class:`str`
@@ -197,6 +348,14 @@ class RESTClient:
         route: :class:`.Route`
             The route to use for the request
 
+        coalesce: :class:`bool`
+            If a GET request may share an identical in-flight request.
+
+        priority: :class:`.Priority`
+            The priority of the request. More urgent requests are let through
+            the ratelimit queues first, while requests waiting for long enough
+            get ahead of more urgent ones.
+
         kwargs: Any
             Extra things to pass to the request, E.g `json=payload`.
 
@@ -210,5 +369,69 @@ class RESTClient:
         Any:
             The return data from the request.
         """
-        async with Ratelimiter(self, route) as handler:
-            return await handler.request(method, **kwargs)
+        if method != "GET":
+            data, _ = await self._send(method, route, priority, **kwargs)
+
+            if self.cache is not None:
+                self.cache.invalidate(route)
+
+            return data
+
+        key = f"{route.version}:{route.path}:{sorted(kwargs.items())!r}"
+
+        if self.cache is not None:
+            entry = self.cache.get(key)
+
+            if entry is not None and entry.fresh(time.time()):
+                return entry.data
+
+        if not coalesce:
+            return await self._fetch(route, key, priority, **kwargs)
+
+        if (task := self.inflight.get(key)) is not None:
+            self.coalesced.inc(bucket=route.bucket)
+            return await asyncio.shield(task)
+
+        task = self.inflight[key] = asyncio.ensure_future(
+            self._fetch(route, key, priority, **kwargs)
+        )
+        task.add_done_callback(lambda _: self.inflight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self, route: Route, key: str, priority: Priority, **kwargs: Any
+    ) -> Any:
+        if self.cache is None:
+            data, _ = await self._send("GET", route, priority, **kwargs)
+            return data
+
+        entry = self.cache.entries.get(key)
+        if entry is not None and entry.etag is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": entry.etag}
+
+        data, resp = await self._send("GET", route, priority, **kwargs)
+
+        if resp is None:
+            return data
+
+        if resp.status == 304 and entry is not None:
+            self.cache.refresh(entry, route, resp.headers)
+            return entry.data
+
+        self.cache.put(key, route, data, resp.headers)
+        return data
+
+    async def _send(
+        self, method: str, route: Route, priority: Priority, **kwargs: Any
+    ) -> tuple[Any, None | RatelimitedClientResponse]:
+        span = self.client.tracer.span(
+            "rest.request", method=method, route=route.endpoint
+        )
+
+        with span:
+            span.set("priority", priority.name)
+
+            async with Ratelimiter(self, route) as handler:
+                data = await handler.request(method, priority=priority, **kwargs)
+                return data, handler.response
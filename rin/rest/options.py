@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import aiohttp
+import attr
+
+__all__ = ("HTTPOptions",)
+
+
+@attr.s(slots=True)
+class HTTPOptions:
+    """The connection options of the RESTClient's sessions.
+
+    .. code:: python
+
+        options = rin.HTTPOptions(limit=200, limit_per_host=100, timeout=30)
+        client = rin.GatewayClient(token, http=options)
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        The total amount of simultaneous connections. 0 is unlimited.
+
+    limit_per_host: :class:`int`
+        The amount of simultaneous connections to the same host. 0 is unlimited.
+
+    ttl_dns_cache: None | :class:`int`
+        The seconds to cache resolved DNS entries for. None caches forever.
+
+    keepalive_timeout: :class:`float`
+        The seconds idle connections are kept alive for reuse.
+
+    timeout: None | :class:`float`
+        The total timeout of a request in seconds. None disables it.
+
+    connect_timeout: None | :class:`float`
+        The timeout of acquiring a connection in seconds, including
+        waiting for a free connection from the pool.
+
+    read_timeout: None | :class:`float`
+        The timeout of reading a chunk of a response in seconds.
+
+    separate_gateway: :class:`bool`
+        If the gateway connection should use its own session, so it
+        never competes with RESTful requests for a connection.
+    """
+
+    limit: int = attr.field(default=100, kw_only=True)
+    limit_per_host: int = attr.field(default=0, kw_only=True)
+    ttl_dns_cache: None | int = attr.field(default=300, kw_only=True)
+    keepalive_timeout: float = attr.field(default=30.0, kw_only=True)
+
+    timeout: None | float = attr.field(default=None, kw_only=True)
+    connect_timeout: None | float = attr.field(default=None, kw_only=True)
+    read_timeout: None | float = attr.field(default=None, kw_only=True)
+
+    separate_gateway: bool = attr.field(default=False, kw_only=True)
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """Creates a connector with the pool options. Must be called inside of the loop.
+
+        Returns
+        -------
+        :class:`aiohttp.TCPConnector`
+            The created connector.
+        """
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+    def client_timeout(self) -> aiohttp.ClientTimeout:
+        """Creates the timeout of requests.
+
+        Returns
+        -------
+        :class:`aiohttp.ClientTimeout`
+            The created timeout.
+        """
+        return aiohttp.ClientTimeout(
+            total=self.timeout,
+            connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
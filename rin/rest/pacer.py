@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Hashable
+
+import attr
+
+__all__ = ("Pacer",)
+
+
+@attr.s(slots=True)
+class Pacer:
+    """Spaces out requests sharing a key, E.g the reactions of a channel.
+
+    Some routes, like reactions, allow a single request every so often.
+    Instead of sending many at once and waiting out the 429s, each request
+    is given the next free slot of its key, ``interval`` seconds after the last one.
+
+    Parameters
+    ----------
+    interval: :class:`float`
+        The seconds between the requests of a key.
+
+    Attributes
+    ----------
+    slots: dict[Hashable, :class:`float`]
+        The next free slot of each key, in the loop's time.
+    """
+
+    interval: float = attr.field(default=0.25)
+    slots: dict[Hashable, float] = attr.field(init=False, factory=dict, repr=False)
+
+    async def wait(self, key: Hashable, loop: asyncio.AbstractEventLoop) -> float:
+        """Waits for the next slot of a key.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key of the request, E.g the snowflake of a channel.
+
+        loop: :class:`asyncio.AbstractEventLoop`
+            The loop whose time is used.
+
+        Returns
+        -------
+        :class:`float`
+            The seconds waited.
+        """
+        now = loop.time()
+        slot = max(now, self.slots.get(key, now))
+        self.slots[key] = slot + self.interval
+
+        if len(self.slots) > 1024:
+            self.slots = {k: at for k, at in self.slots.items() if at > now}
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+        return slot - now
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import enum
+import heapq
+import itertools
+from typing import Iterator
+
+import attr
+
+__all__ = ("Priority", "PriorityLock")
+
+
+class Priority(enum.IntEnum):
+    """The priority of a request. Lower values are served first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+@attr.s(slots=True)
+class PriorityLock:
+    """A lock which is handed to waiters by priority instead of arrival order.
+
+    Waiters are ordered by the time they started waiting plus ``aging``
+    seconds for each priority level below :attr:`.Priority.HIGH`. A low priority
+    waiter therefore goes first once it has waited ``aging`` seconds longer than
+    a higher priority one, so low priorities can't be starved.
+
+    Parameters
+    ----------
+    aging: :class:`float`
+        The seconds of waiting which make up for one priority level.
+
+    Attributes
+    ----------
+    locked: :class:`bool`
+        If the lock is currently held.
+    """
+
+    aging: float = attr.field(default=1.0)
+
+    locked: bool = attr.field(init=False, default=False)
+    waiters: list[tuple[float, int, asyncio.Future[None]]] = attr.field(
+        init=False, factory=list, repr=False
+    )
+    counter: Iterator[int] = attr.field(init=False, factory=itertools.count, repr=False)
+
+    async def acquire(self, priority: Priority = Priority.NORMAL) -> None:
+        """Acquires the lock, waiting behind more urgent waiters.
+
+        Parameters
+        ----------
+        priority: :class:`.Priority`
+            The priority of the waiter.
+        """
+        if not self.locked:
+            self.locked = True
+            return None
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+
+        score = loop.time() + int(priority) * self.aging
+        heapq.heappush(self.waiters, (score, next(self.counter), future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The lock was handed over right as the waiter got cancelled.
+            if future.done() and not future.cancelled():
+                self.release()
+
+            raise
+
+    def release(self) -> None:
+        """Releases the lock, handing it to the most urgent waiter if any."""
+        while self.waiters:
+            _, _, future = heapq.heappop(self.waiters)
+
+            if not future.done():
+                future.set_result(None)
+                return None
+
+        self.locked = False
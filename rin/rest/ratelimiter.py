@@ -9,20 +9,288 @@ import aiohttp
 import attr
 from multidict import istr
 
-from .errors import HTTPException
+from .errors import HTTPException, TooManyRequests
+from .priority import Priority, PriorityLock
 
 if TYPE_CHECKING:
     from .handler import RESTClient, Route
 
 
-__all__ = ("Ratelimiter", "RatelimitedClientResponse")
+__all__ = ("Bucket", "GlobalRatelimit", "Ratelimiter", "RatelimitedClientResponse")
 _log = logging.getLogger(__name__)
 
 
+@attr.s(slots=True)
+class Bucket:
+    """The ratelimit state of a bucket, shared across requests.
+
+    The limits of a bucket are learned from the headers of the responses
+    made through it. Until the first response arrives only one request
+    is let through at a time.
+
+    Attributes
+    ----------
+    limit: :class:`int`
+        The total amount of requests of the bucket.
+
+    remaining: :class:`int`
+        The requests left before the bucket is depleted. This is decremented
+        locally before each request.
+
+    reset_at: :class:`float`
+        When the bucket resets, in loop time.
+
+    known: :class:`bool`
+        If the limits of the bucket have been learned.
+
+    unlimited: :class:`bool`
+        If the bucket's responses had no ratelimit headers.
+
+    retired: :class:`bool`
+        If the bucket was replaced by the state of a shared bucket hash.
+        Requests waiting on it are woken up to look up their bucket again.
+    """
+
+    limit: int = attr.field(init=False, default=1)
+    remaining: int = attr.field(init=False, default=1)
+    reset_at: float = attr.field(init=False, default=0.0)
+
+    known: bool = attr.field(init=False, default=False)
+    unlimited: bool = attr.field(init=False, default=False)
+    retired: bool = attr.field(init=False, default=False)
+
+    lock: PriorityLock = attr.field(init=False, factory=PriorityLock, repr=False)
+    updated: asyncio.Event = attr.field(init=False, factory=asyncio.Event, repr=False)
+
+    async def acquire(
+        self, loop: asyncio.AbstractEventLoop, priority: Priority = Priority.NORMAL
+    ) -> float:
+        """Takes a request from the bucket, waiting for it to reset if depleted.
+
+        Parameters
+        ----------
+        loop: :class:`asyncio.AbstractEventLoop`
+            The loop used for timing.
+
+        priority: :class:`.Priority`
+            The priority of the request, more urgent requests are let through first.
+
+        Returns
+        -------
+        :class:`float`
+            The seconds slept waiting for the bucket to reset.
+            Nothing is taken if the bucket was :attr:`retired` meanwhile.
+        """
+        slept = 0.0
+        await self.lock.acquire(priority)
+
+        try:
+            while self.remaining <= 0 and not self.unlimited and not self.retired:
+                if not self.known:
+                    self.updated.clear()
+                    await self.updated.wait()
+
+                    continue
+
+                if (delay := self.reset_at - loop.time()) > 0:
+                    await asyncio.sleep(delay)
+                    slept += delay
+
+                self.remaining = self.limit
+
+            if not self.retired:
+                self.remaining -= 1
+        finally:
+            self.lock.release()
+
+        return slept
+
+    def restore(self) -> None:
+        """Gives back a request which never got a response."""
+        self.remaining += 1
+        self.updated.set()
+
+    def update(self, resp: RatelimitedClientResponse, now: float) -> None:
+        """Learns the state of the bucket from a response.
+
+        Parameters
+        ----------
+        resp: :class:`.RatelimitedClientResponse`
+            The response of a request made through the bucket.
+
+        now: :class:`float`
+            The current loop time.
+        """
+        if resp.has_limit:
+            self.limit = resp.limit
+            self.remaining = min(self.remaining, resp.uses) if self.known else resp.uses
+            self.reset_at = now + resp.reset_after
+            self.unlimited = False
+
+        elif not resp.is_ratelimited:
+            self.unlimited = True
+
+        self.known = True
+        self.updated.set()
+
+    def deplete(self, retry_after: float, now: float) -> None:
+        """Marks the bucket as depleted after a ratelimited response.
+
+        Parameters
+        ----------
+        retry_after: :class:`float`
+            The seconds to wait before retrying.
+
+        now: :class:`float`
+            The current loop time.
+        """
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, now + retry_after)
+        self.known = True
+        self.unlimited = False
+        self.updated.set()
+
+    def idle(self, now: float) -> bool:
+        """If the bucket reset and no request is waiting on it.
+
+        Parameters
+        ----------
+        now: :class:`float`
+            The current loop time.
+        """
+        return self.known and self.reset_at <= now and not self.lock.locked
+
+    def retire(self) -> None:
+        """Wakes up the requests waiting on the bucket, to use another bucket."""
+        self.retired = True
+        self.updated.set()
+
+
+@attr.s(slots=True)
+class GlobalRatelimit:
+    """The client-wide ratelimit, shared by every request.
+
+    Requests take a token from a bucket refilled at ``rate`` tokens per second,
+    so bursts are spread out before Discord's global limit is reached.
+    A global 429 closes the gate, pausing every request until it resets.
+
+    Parameters
+    ----------
+    rate: :class:`float`
+        The requests allowed per second.
+
+    Attributes
+    ----------
+    tokens: :class:`float`
+        The requests which can be made right now.
+
+    gate: :class:`asyncio.Event`
+        Set while requests are allowed, cleared during a global ratelimit.
+
+    paused_until: :class:`float`
+        When the current global ratelimit resets, in loop time.
+    """
+
+    rate: float = attr.field(default=50)
+
+    tokens: float = attr.field(init=False)
+    updated_at: None | float = attr.field(init=False, default=None, repr=False)
+    paused_until: float = attr.field(init=False, default=0.0)
+
+    lock: PriorityLock = attr.field(init=False, factory=PriorityLock, repr=False)
+    gate: asyncio.Event = attr.field(init=False, factory=asyncio.Event, repr=False)
+    handle: None | asyncio.TimerHandle = attr.field(init=False, default=None, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.tokens = self.rate
+        self.gate.set()
+
+    @property
+    def paused(self) -> bool:
+        """If requests are paused by a global ratelimit."""
+        return not self.gate.is_set()
+
+    async def acquire(
+        self, loop: asyncio.AbstractEventLoop, priority: Priority = Priority.NORMAL
+    ) -> float:
+        """Waits for the gate to open and takes a token.
+
+        Parameters
+        ----------
+        loop: :class:`asyncio.AbstractEventLoop`
+            The loop used for timing.
+
+        priority: :class:`.Priority`
+            The priority of the request, more urgent requests are let through first.
+
+        Returns
+        -------
+        :class:`float`
+            The seconds spent waiting.
+        """
+        started = loop.time()
+
+        await self.lock.acquire(priority)
+
+        try:
+            await self.gate.wait()
+
+            now = loop.time()
+            if self.updated_at is not None:
+                self.tokens = min(
+                    self.rate, self.tokens + (now - self.updated_at) * self.rate
+                )
+
+            self.updated_at = now
+
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+                self.tokens = 1.0
+                self.updated_at = loop.time()
+
+            self.tokens -= 1
+        finally:
+            self.lock.release()
+
+        return loop.time() - started
+
+    def pause(self, retry_after: float, loop: asyncio.AbstractEventLoop) -> None:
+        """Pauses every request until a global ratelimit resets.
+
+        Parameters
+        ----------
+        retry_after: :class:`float`
+            The seconds until the ratelimit resets.
+
+        loop: :class:`asyncio.AbstractEventLoop`
+            The loop used to schedule the reset.
+        """
+        until = loop.time() + retry_after
+
+        if until <= self.paused_until and self.paused:
+            return
+
+        if self.handle is not None:
+            self.handle.cancel()
+
+        self.paused_until = until
+        self.gate.clear()
+        self.handle = loop.call_at(until, self.resume)
+
+    def resume(self) -> None:
+        """Opens the gate, letting requests through again."""
+        self.handle = None
+        self.gate.set()
+
+
 @attr.s(slots=True)
 class Ratelimiter:
     """A class used for ratelimit handling.
 
+    Buckets are discovered from the ``X-RateLimit-Bucket`` header of responses,
+    routes sharing a bucket hash and major parameters share their state.
+
     Parameters
     ----------
     rest: :class:`.RESTClient`
@@ -50,6 +318,9 @@ class Ratelimiter:
 
     auth: dict[str, str]
         The authorization header dict.
+
+    response: None | :class:`.RatelimitedClientResponse`
+        The last response received.
     """
 
     rest: RESTClient = attr.field()
@@ -60,43 +331,154 @@ class Ratelimiter:
 
     endpoint: str = attr.field(init=False)
     bucket: str = attr.field(init=False)
+    response: None | RatelimitedClientResponse = attr.field(
+        init=False, default=None, repr=False
+    )
 
     def __attrs_post_init__(self) -> None:
         assert self.rest.client.loop is not None
 
         self.loop = self.rest.client.loop
         self.auth = {"Authorization": f"Bot {self.rest.token}"}
-        self.endpoint = self.route.endpoint
+        self.endpoint = self.rest.url(self.route)
         self.bucket = self.route.bucket
 
-    async def ensure(self) -> asyncio.Semaphore:
-        """Ensures there is a :class:`asyncio.Semaphore`."""
-        if semaphore := self.get(self.bucket):
-            return semaphore
+    def key(self, method: str) -> str:
+        """The key of the route's bucket state for a method.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The method of the request.
+
+        Returns
+        -------
+        :class:`str`
+            The bucket hash and major parameters once the hash is known,
+            otherwise the method and bucket of the route.
+        """
+        if (hash := self.rest.hashes.get(f"{method} {self.route.template}")) is not None:
+            return f"{hash}:{self.route.major}"
+
+        return f"{method} {self.bucket}"
+
+    def ensure(self, method: str) -> Bucket:
+        """Ensures there is a :class:`.Bucket` for the route.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The method of the request.
+
+        Returns
+        -------
+        :class:`.Bucket`
+            The bucket state of the route.
+        """
+        key = self.key(method)
 
-        resp: RatelimitedClientResponse = await self.rest._request("HEAD", self.endpoint)
+        if (bucket := self.get(key)) is None:
+            if len(self.rest.buckets) >= self.rest.max_buckets:
+                self.prune()
 
-        semaphore = asyncio.Semaphore(resp.limit)
-        self.rest.semaphores[self.bucket] = semaphore
+            bucket = self.rest.buckets[key] = Bucket()
 
-        return semaphore
+        return bucket
 
-    def get(self, bucket: str) -> None | asyncio.Semaphore:
-        """Gets the bucket's semaphore if one exists.
+    def get(self, key: str) -> None | Bucket:
+        """Gets the bucket state if one exists.
 
         Parameters
         ----------
-        bucket: :class:`str`
-            The bucket to search for.
+        key: :class:`str`
+            The key of the bucket. See :meth:`key`.
 
         Returns
         -------
-        Optional[:class:`asyncio.Semaphore`]
-            The semaphore if found.
+        None | :class:`.Bucket`
+            The bucket if found.
         """
-        return self.rest.semaphores.get(bucket)
+        return self.rest.buckets.get(key)
+
+    def discover(self, method: str, bucket: Bucket, hash: None | str) -> Bucket:
+        """Maps the route to the bucket hash Discord responded with.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The method of the request.
+
+        bucket: :class:`.Bucket`
+            The bucket state the request was made through.
+
+        hash: None | :class:`str`
+            The ``X-RateLimit-Bucket`` header of the response.
+
+        Returns
+        -------
+        :class:`.Bucket`
+            The bucket state to update. This is the state already shared by
+            other routes with the same hash if there is one.
+        """
+        route = f"{method} {self.route.template}"
+
+        if hash is None or self.rest.hashes.get(route) == hash:
+            return bucket
+
+        self.rest.hashes[route] = hash
+        shared = self.rest.buckets.setdefault(self.key(method), bucket)
+
+        if bucket is not shared:
+            bucket.retire()
+
+        # Every major of the template moves to the hash, not only this route's.
+        # Requests parked on a replaced bucket would otherwise wait forever.
+        prefix = f"{method} "
+        temporary = [
+            key
+            for key in self.rest.buckets
+            if key.startswith(prefix) and key.partition(":")[2] == self.route.template
+        ]
+
+        for key in temporary:
+            orphan = self.rest.buckets.pop(key)
+            major = key[len(prefix) :].partition(":")[0]
 
-    async def request(self, method: str, **kwargs: Any) -> None | dict[Any, Any] | str:
+            if self.rest.buckets.setdefault(f"{hash}:{major}", orphan) is not orphan:
+                orphan.retire()
+
+        return shared
+
+    def prune(self) -> int:
+        """Drops the buckets which reset and have no requests waiting on them.
+
+        Called once :attr:`.RESTClient.max_buckets` is reached, their limits
+        are learned again from the next response.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of buckets dropped.
+        """
+        now = self.loop.time()
+        idle = [key for key, bucket in self.rest.buckets.items() if bucket.idle(now)]
+
+        for key in idle:
+            del self.rest.buckets[key]
+
+        return len(idle)
+
+    def headers(self, reason: None | str) -> dict[str, str]:
+        headers = self.auth.copy()
+
+        if reason is not None:
+            headers["X-Audit-Log-Reason"] = reason
+
+        return headers
+
+    async def request(
+        self, method: str, *, priority: Priority = Priority.NORMAL, **kwargs: Any
+    ) -> None | dict[Any, Any] | str:
         """Makes the request with ratelimit handling.
 
         Parameters
@@ -104,8 +486,12 @@ class Ratelimiter:
         method: :class:`str`
             The method to make the request with, E.g `"GET"`.
 
+        priority: :class:`.Priority`
+            The priority of the request in the ratelimit queues.
+
         kwargs: Any
             The options to pass when requesting, E.g `json=payload`.
+            Payloads already encoded into JSON can be passed as :class:`bytes`.
 
         Raises
         ------
@@ -117,73 +503,118 @@ class Ratelimiter:
         Union[:class:`dict`, :class:`str`]:
             The return of the request.
         """
-        semaphore = await self.ensure()
-        route = self.route
-
-        assert self.loop is not None
-        async with self.rest.semaphores["global"]:
-            await semaphore.acquire()
-            await route.event.wait()
+        tracer = self.rest.client.tracer
+        headers = {
+            **self.headers(kwargs.pop("reason", None)),
+            **kwargs.pop("headers", {}),
+        }
+        form = kwargs.pop("form", [])
+        payload = kwargs.pop("json", None)
+
+        for attempt in range(1, self.rest.max_attempts + 1):
+            bucket = self.ensure(method)
+
+            with tracer.span("rest.ratelimit", bucket=self.bucket, attempt=attempt):
+                slept = await self.rest.ratelimit.acquire(self.loop, priority)
+                slept += await bucket.acquire(self.loop, priority)
+
+                while bucket.retired:
+                    bucket = self.ensure(method)
+                    slept += await bucket.acquire(self.loop, priority)
+
+                if slept:
+                    _log.debug(f"BUCKET DEPLETED: {self.bucket} SLEPT: {slept}s")
+                    self.rest.sleeps.inc(slept, bucket=self.bucket)
+
+            if form:
+                kwargs["data"] = self.formdata(payload, form)
+            elif isinstance(payload, bytes):
+                kwargs["data"] = payload
+                headers.setdefault("Content-Type", "application/json")
+            else:
+                kwargs["json"] = payload
+
+            try:
+                with tracer.span("rest.http", method=method, route=self.endpoint) as span:
+                    resp = await self.rest._request(
+                        method, self.endpoint, headers=headers, **kwargs
+                    )
+                    data: dict[Any, Any] | str = await resp.data()
+                    self.response = resp
+                    span.set("status", resp.status)
+            except BaseException:
+                bucket.restore()
+                raise
+
+            bucket = self.discover(method, bucket, resp.bucket)
+            bucket.update(resp, self.loop.time())
+
+            self.rest.requests.inc(bucket=self.bucket, method=method, status=resp.status)
 
-            headers = {"Authorization": f"Bot {self.rest.token}"}
-
-            if reason := kwargs.get("reason"):
-                headers["X-Audit-Log-Reason"] = reason
+            if resp.ok:
+                _log.debug(
+                    f"{resp.status}: {method} ROUTE: {self.endpoint} REMAINING: {resp.uses}"
+                )
 
-            if form := kwargs.pop("form", []):
-                formdata = aiohttp.FormData()
-                payload = kwargs.pop("json", None)
+                return data
 
-                if payload:
-                    formdata.add_field("payload_json", value=json.dumps(payload))
+            if not resp.is_ratelimited:
+                raise self.rest.ERRORS.get(resp.status, HTTPException)(data) from None
 
-                for params in form:
-                    formdata.add_field(**params)
+            retry_after = await resp.retry_after() or 0
+            _log.debug(
+                f"RATELIMITED: {method} ROUTE: {self.endpoint} SCOPE: {resp.scope} "
+                f"RETRY AFTER: {retry_after}"
+            )
 
-                kwargs["data"] = formdata
+            if resp.is_global:
+                self.rest.ratelimit.pause(retry_after, self.loop)
 
-            resp = await self.rest._request(method, self.endpoint, **kwargs)
-            data: dict[Any, Any] | str = await resp.data()
+                if not resp.has_limit:
+                    bucket.restore()
+            else:
+                bucket.deplete(retry_after, self.loop.time())
 
-            if resp.is_depleted:
-                _log.debug(f"BUCKET DEPLETED: {self.bucket} RETRY: {resp.reset_after}s")
-                route.event.clear()
+        raise TooManyRequests(data) from None
 
-                self.loop.call_later(resp.reset_after, route.event.set)
-                self.loop.call_later(resp.reset_after, semaphore.release)
+    def formdata(self, payload: Any, form: list[dict[str, Any]]) -> aiohttp.FormData:
+        """Creates the multipart body of a request. A new one is needed for each attempt.
 
-                await asyncio.sleep(resp.reset_after)
-                return await self.request(method, **kwargs)
+        Parameters
+        ----------
+        payload: Any
+            The JSON payload of the request, or its encoded JSON.
 
-            if resp.ok:
-                _log.debug(
-                    f"{resp.status}: {method} ROUTE: {self.endpoint} REMAINING: {resp.uses}"
-                )
+        form: list[dict[:class:`str`, Any]]
+            The fields of the form. Callable values are called to get the value,
+            so sources like files can be opened again for each attempt.
 
-                route.event.set()
-                return data
+        Returns
+        -------
+        :class:`aiohttp.FormData`
+            The multipart body.
+        """
+        formdata = aiohttp.FormData()
 
-            if resp.is_ratelimited:
-                retry_after = await resp.retry_after()
-                _log.debug(
-                    f"RATELIMITED: {method} ROUTE: {self.endpoint} RETRY AFTER: {retry_after}"
-                )
+        if isinstance(payload, bytes):
+            formdata.add_field("payload_json", value=payload.decode("utf-8"))
 
-                if retry_after is not None:
-                    await asyncio.sleep(retry_after)
+        elif payload:
+            formdata.add_field("payload_json", value=json.dumps(payload))
 
-                return await self.request(method, **kwargs)
+        for params in form:
+            if callable(value := params["value"]):
+                params = {**params, "value": value()}
 
-            if not resp.ok:
-                raise self.rest.ERRORS.get(resp.status, HTTPException)(data) from None
+            formdata.add_field(**params)
 
-        return None
+        return formdata
 
     async def __aenter__(self) -> Ratelimiter:
         return self
 
     async def __aexit__(self, *_: Any) -> None:
-        self.rest.semaphores.pop(self.bucket, None)
+        pass
 
 
 class RatelimitedClientResponse(aiohttp.ClientResponse):
@@ -192,6 +623,10 @@ class RatelimitedClientResponse(aiohttp.ClientResponse):
     REMAINING: ClassVar[istr] = istr("X-Ratelimit-Remaining")
     RESET_AT: ClassVar[istr] = istr("X-Ratelimit-Reset-After")
     TOTAL: ClassVar[istr] = istr("X-Ratelimit-Limit")
+    BUCKET: ClassVar[istr] = istr("X-Ratelimit-Bucket")
+    RETRY_AFTER: ClassVar[istr] = istr("Retry-After")
+    GLOBAL: ClassVar[istr] = istr("X-Ratelimit-Global")
+    SCOPE: ClassVar[istr] = istr("X-Ratelimit-Scope")
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -212,6 +647,16 @@ class RatelimitedClientResponse(aiohttp.ClientResponse):
         """The total amount of requests of the bucket."""
         return int(self.headers.get(RatelimitedClientResponse.TOTAL, 1))
 
+    @property
+    def has_limit(self) -> bool:
+        """If the response has ratelimit headers."""
+        return RatelimitedClientResponse.TOTAL in self.headers
+
+    @property
+    def bucket(self) -> None | str:
+        """The hash of the bucket the route belongs to, if given."""
+        return self.headers.get(RatelimitedClientResponse.BUCKET)
+
     @property
     def reset_after(self) -> float:
         """How long until the ratelimit of a bucket resets."""
@@ -219,7 +664,26 @@ class RatelimitedClientResponse(aiohttp.ClientResponse):
 
     async def retry_after(self) -> None | float:
         """The time to wait before making another request."""
-        return (await self.json())["retry_after"] if self.is_ratelimited else None
+        if not self.is_ratelimited:
+            return None
+
+        data = await self.data()
+        if isinstance(data, dict) and "retry_after" in data:
+            return float(data["retry_after"])  # type: ignore
+
+        return float(self.headers.get(RatelimitedClientResponse.RETRY_AFTER, 0))
+
+    @property
+    def is_global(self) -> bool:
+        """If the response is a global ratelimit."""
+        return self.scope == "global" or (
+            self.headers.get(RatelimitedClientResponse.GLOBAL, "").lower() == "true"
+        )
+
+    @property
+    def scope(self) -> None | str:
+        """The scope of a ratelimit, E.g ``"user"``, ``"global"`` or ``"shared"``."""
+        return self.headers.get(RatelimitedClientResponse.SCOPE)
 
     @property
     def is_depleted(self) -> bool:
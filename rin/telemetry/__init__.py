@@ -0,0 +1,3 @@
+from .exporter import *
+from .metrics import *
+from .tracing import *
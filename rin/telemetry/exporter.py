@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import attr
+from aiohttp import web
+
+from .metrics import Registry
+
+__all__ = ("MetricsServer",)
+
+
+@attr.s(slots=True)
+class MetricsServer:
+    """A local HTTP server exposing a registry at ``/metrics``.
+
+    The metrics are served in the Prometheus text exposition format.
+
+    .. code:: python
+
+        server = await client.serve_metrics(port=9000)
+        ...
+        await server.close()
+
+    Parameters
+    ----------
+    registry: :class:`.Registry`
+        The registry to serve.
+
+    host: :class:`str`
+        The host to bind to. Defaults to ``127.0.0.1``.
+
+    port: :class:`int`
+        The port to bind to. ``0`` binds to a random free port.
+
+    Attributes
+    ----------
+    runner: :class:`aiohttp.web.AppRunner`
+        The runner of the server. Only set after :meth:`start`.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    registry: Registry = attr.field()
+    host: str = attr.field(default="127.0.0.1")
+    port: int = attr.field(default=9090)
+
+    runner: web.AppRunner = attr.field(init=False, repr=False)
+
+    async def handle(self, _: web.Request) -> web.Response:
+        return web.Response(
+            body=self.registry.render().encode("utf-8"),
+            headers={"Content-Type": MetricsServer.CONTENT_TYPE},
+        )
+
+    async def start(self) -> None:
+        """Starts serving the registry."""
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle)
+
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+
+        if self.port == 0 and site._server is not None:  # type: ignore
+            self.port = site._server.sockets[0].getsockname()[1]  # type: ignore
+
+    async def close(self) -> None:
+        """Stops serving the registry."""
+        await self.runner.cleanup()
+
+    @property
+    def url(self) -> str:
+        """The url of the metrics endpoint."""
+        return f"http://{self.host}:{self.port}/metrics"
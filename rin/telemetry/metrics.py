@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, ClassVar, Generic, Iterable, Iterator, TypeVar
+
+import attr
+
+from ..utils import Histogram as Buckets
+
+__all__ = ("Metric", "Counter", "Gauge", "Histogram", "Registry")
+V = TypeVar("V")
+
+Labels = tuple[str, ...]
+MetricCollector = Callable[[], Iterable["Metric[Any]"]]
+
+
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    if float(value).is_integer():
+        return str(int(value))
+
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+@attr.s(slots=True)
+class Metric(Generic[V]):
+    """The base class of metrics.
+
+    Parameters
+    ----------
+    name: :class:`str`
+        The name of the metric, E.g ``rin_gateway_events_total``.
+
+    documentation: :class:`str`
+        The help text of the metric.
+
+    labelnames: tuple[:class:`str`, ...]
+        The names of the labels of the metric.
+
+    Attributes
+    ----------
+    values: dict[tuple[:class:`str`, ...], Any]
+        The values of the metric, keyed by their label values.
+    """
+
+    TYPE: ClassVar[str] = "untyped"
+
+    name: str = attr.field()
+    documentation: str = attr.field(default="")
+    labelnames: Labels = attr.field(default=(), converter=tuple)
+
+    values: dict[Labels, V] = attr.field(init=False, factory=dict, repr=False)
+
+    def key(self, labels: dict[str, Any]) -> Labels:
+        """Creates the key of a label set.
+
+        Parameters
+        ----------
+        labels: :class:`dict`
+            The label values, keyed by the label names.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            The labels given did not match the metric's label names.
+
+        Returns
+        -------
+        tuple[:class:`str`, ...]
+            The label values in the order of :attr:`labelnames`.
+        """
+        try:
+            if len(labels) == len(self.labelnames):
+                return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            pass
+
+        raise ValueError(f"Expected labels {self.labelnames}, got {tuple(labels)}")
+
+    def labelset(self, key: Labels, **extra: str) -> str:
+        pairs = [*zip(self.labelnames, key), *extra.items()]
+
+        if not pairs:
+            return ""
+
+        return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in pairs) + "}"
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        """Yields the samples of the metric.
+
+        Returns
+        -------
+        Iterator[tuple[:class:`str`, :class:`str`, :class:`float`]]
+            The sample name, the rendered label set and the value.
+        """
+        for key, value in self.values.items():
+            yield self.name, self.labelset(key), float(value)  # type: ignore
+
+    def render(self) -> str:
+        """Renders the metric in the Prometheus text exposition format.
+
+        Returns
+        -------
+        :class:`str`
+            The rendered metric.
+        """
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+
+        for name, labels, value in self.samples():
+            lines.append(f"{name}{labels} {_format(value)}")
+
+        return "\n".join(lines)
+
+
+@attr.s(slots=True)
+class Counter(Metric[float]):
+    """A metric which only goes up."""
+
+    TYPE: ClassVar[str] = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Increments the counter.
+
+        Parameters
+        ----------
+        amount: :class:`float`
+            The amount to increment by.
+
+        labels: Any
+            The label values of the sample to increment.
+        """
+        key = self.key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+
+@attr.s(slots=True)
+class Gauge(Metric[float]):
+    """A metric which can go up and down."""
+
+    TYPE: ClassVar[str] = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Sets the gauge to a value.
+
+        Parameters
+        ----------
+        value: :class:`float`
+            The value to set.
+
+        labels: Any
+            The label values of the sample to set.
+        """
+        self.values[self.key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Increments the gauge.
+
+        Parameters
+        ----------
+        amount: :class:`float`
+            The amount to increment by, may be negative.
+
+        labels: Any
+            The label values of the sample to increment.
+        """
+        key = self.key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+
+@attr.s(slots=True)
+class Histogram(Metric[Buckets]):
+    """A metric which counts observations into buckets.
+
+    Parameters
+    ----------
+    bounds: tuple[:class:`float`, ...]
+        The upper bounds of the buckets.
+    """
+
+    TYPE: ClassVar[str] = "histogram"
+
+    bounds: tuple[float, ...] = attr.field(default=Buckets.BOUNDS, kw_only=True)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Records an observation.
+
+        Parameters
+        ----------
+        value: :class:`float`
+            The value to record.
+
+        labels: Any
+            The label values of the sample to record into.
+        """
+        key = self.key(labels)
+
+        if (buckets := self.values.get(key)) is None:
+            buckets = self.values[key] = Buckets(self.bounds)
+
+        buckets.observe(value)
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        for key, buckets in self.values.items():
+            for bound, count in buckets.cumulative():
+                yield f"{self.name}_bucket", self.labelset(key, le=_format(bound)), count
+
+            yield f"{self.name}_sum", self.labelset(key), buckets.sum
+            yield f"{self.name}_count", self.labelset(key), buckets.count
+
+
+@attr.s(slots=True)
+class Registry:
+    """A registry of metrics.
+
+    Metrics are either registered and updated as things happen,
+    or created by collectors each time the registry is rendered.
+
+    .. code:: python
+
+        requests = registry.counter("requests_total", "Requests made.", ("status",))
+        requests.inc(status=200)
+
+        print(registry.render())
+
+    Attributes
+    ----------
+    metrics: dict[:class:`str`, :class:`.Metric`]
+        The registered metrics, keyed by their name.
+
+    collectors: list[Callable[[], Iterable[:class:`.Metric`]]]
+        The callbacks creating metrics at render time.
+    """
+
+    metrics: dict[str, Metric[Any]] = attr.field(init=False, factory=dict)
+    collectors: list[MetricCollector] = attr.field(init=False, factory=list)
+
+    def register(self, metric: Metric[Any]) -> Metric[Any]:
+        """Registers a metric, or returns the one registered with its name.
+
+        Parameters
+        ----------
+        metric: :class:`.Metric`
+            The metric to register.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            A different type of metric is registered with the same name.
+
+        Returns
+        -------
+        :class:`.Metric`
+            The registered metric.
+        """
+        if (existing := self.metrics.get(metric.name)) is None:
+            self.metrics[metric.name] = metric
+            return metric
+
+        if type(existing) is not type(metric):
+            raise ValueError(f"{metric.name} is already registered as a {existing.TYPE}")
+
+        return existing
+
+    def counter(self, name: str, documentation: str, labels: Labels = ()) -> Counter:
+        """Registers a :class:`.Counter`. See :meth:`register`."""
+        metric = self.register(Counter(name, documentation, labels))
+        assert isinstance(metric, Counter)
+
+        return metric
+
+    def gauge(self, name: str, documentation: str, labels: Labels = ()) -> Gauge:
+        """Registers a :class:`.Gauge`. See :meth:`register`."""
+        metric = self.register(Gauge(name, documentation, labels))
+        assert isinstance(metric, Gauge)
+
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Labels = (),
+        bounds: tuple[float, ...] = Buckets.BOUNDS,
+    ) -> Histogram:
+        """Registers a :class:`.Histogram`. See :meth:`register`."""
+        metric = self.register(Histogram(name, documentation, labels, bounds=bounds))
+        assert isinstance(metric, Histogram)
+
+        return metric
+
+    def collector(self, func: MetricCollector) -> MetricCollector:
+        """Registers a collector. Can be used as a decorator.
+
+        Parameters
+        ----------
+        func: Callable[[], Iterable[:class:`.Metric`]]
+            The callback creating the metrics.
+
+        Returns
+        -------
+        Callable[[], Iterable[:class:`.Metric`]]
+            The registered callback.
+        """
+        self.collectors.append(func)
+        return func
+
+    def collect(self) -> Iterator[Metric[Any]]:
+        """Yields every registered and collected metric.
+
+        Returns
+        -------
+        Iterator[:class:`.Metric`]
+            The metrics of the registry.
+        """
+        yield from self.metrics.values()
+
+        for collector in self.collectors:
+            yield from collector()
+
+    def render(self) -> str:
+        """Renders the registry in the Prometheus text exposition format.
+
+        Returns
+        -------
+        :class:`str`
+            The rendered metrics.
+        """
+        return "".join(metric.render() + "\n" for metric in self.collect())
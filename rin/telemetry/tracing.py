@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import random
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Protocol
+
+import attr
+
+__all__ = ("Span", "Tracer", "SpanExporter", "InMemoryExporter")
+_current: ContextVar[None | Span] = ContextVar("rin_current_span", default=None)
+
+
+class SpanExporter(Protocol):
+    """A protocol class for span exporters."""
+
+    def export(self, span: Span) -> None:
+        """Called with every finished span.
+
+        Parameters
+        ----------
+        span: :class:`.Span`
+            The finished span.
+        """
+        ...
+
+
+@attr.s(slots=True)
+class Span:
+    """Represents a timed operation.
+
+    Spans are used as context managers. A span opened while another
+    one is active, including inside tasks created by it, becomes its child.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the span, E.g ``rest.request``.
+
+    attributes: :class:`dict`
+        The attributes of the span.
+
+    parent: None | :class:`.Span`
+        The parent of the span.
+
+    trace_id: :class:`int`
+        The ID of the trace the span belongs to.
+
+    span_id: :class:`int`
+        The ID of the span.
+
+    start: :class:`int`
+        When the span was started, in nanoseconds since the epoch.
+
+    end: None | :class:`int`
+        When the span was finished, in nanoseconds since the epoch.
+
+    error: None | :class:`BaseException`
+        The exception raised inside of the span, if any.
+    """
+
+    name: str = attr.field()
+    exporter: None | SpanExporter = attr.field(repr=False)
+    attributes: dict[str, Any] = attr.field(factory=dict)
+
+    parent: None | Span = attr.field(init=False, default=None, repr=False)
+    trace_id: int = attr.field(init=False, default=0, repr=False)
+    span_id: int = attr.field(init=False, default=0, repr=False)
+
+    start: int = attr.field(init=False, default=0, repr=False)
+    end: None | int = attr.field(init=False, default=None, repr=False)
+    error: None | BaseException = attr.field(init=False, default=None)
+
+    token: None | Token[None | Span] = attr.field(init=False, default=None, repr=False)
+
+    @property
+    def duration(self) -> float:
+        """The duration of the span in seconds. 0 if the span is not finished."""
+        return 0.0 if self.end is None else (self.end - self.start) / 1e9
+
+    def set(self, key: str, value: Any) -> None:
+        """Sets an attribute of the span.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The name of the attribute.
+
+        value: Any
+            The value of the attribute.
+        """
+        self.attributes[key] = value
+
+    def __enter__(self) -> Span:
+        self.parent = _current.get()
+        self.trace_id = (
+            random.getrandbits(128) if self.parent is None else self.parent.trace_id
+        )
+
+        self.span_id = random.getrandbits(64)
+        self.token = _current.set(self)
+        self.start = time.time_ns()
+
+        return self
+
+    def __exit__(self, _: Any, error: None | BaseException, __: Any) -> None:
+        self.end = time.time_ns()
+        self.error = error
+
+        if self.token is not None:
+            _current.reset(self.token)
+
+        if self.exporter is not None:
+            self.exporter.export(self)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+@attr.s(slots=True)
+class Tracer:
+    """Creates spans and hands them to an exporter once finished.
+
+    A tracer without an exporter is disabled, every span it opens is
+    a shared no-op object.
+
+    .. code:: python
+
+        exporter = rin.InMemoryExporter()
+        client = rin.GatewayClient(token, tracer=rin.Tracer(exporter))
+
+    Parameters
+    ----------
+    exporter: None | :class:`.SpanExporter`
+        The exporter of finished spans.
+    """
+
+    exporter: None | SpanExporter = attr.field(default=None)
+
+    @property
+    def enabled(self) -> bool:
+        """If the tracer records spans."""
+        return self.exporter is not None
+
+    @staticmethod
+    def current() -> None | Span:
+        """The span active in the current context, if any."""
+        return _current.get()
+
+    def span(self, name: str, **attributes: Any) -> Span | _NoopSpan:
+        """Creates a span. Should be used as a context manager.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the span.
+
+        attributes: Any
+            The attributes of the span.
+
+        Returns
+        -------
+        :class:`.Span`
+            The created span, a no-op span if the tracer is disabled.
+        """
+        if self.exporter is None:
+            return NOOP_SPAN
+
+        return Span(name, self.exporter, attributes)
+
+
+@attr.s(slots=True)
+class InMemoryExporter:
+    """An exporter keeping finished spans in a list. Intended for tests.
+
+    Attributes
+    ----------
+    spans: list[:class:`.Span`]
+        The finished spans, in the order they finished.
+    """
+
+    spans: list[Span] = attr.field(init=False, factory=list)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def named(self, name: str) -> list[Span]:
+        """Gets the finished spans with a name.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the spans.
+
+        Returns
+        -------
+        list[:class:`.Span`]
+            The spans with the name.
+        """
+        return [span for span in self.spans if span.name == name]
+
+    def clear(self) -> None:
+        """Removes every finished span."""
+        self.spans.clear()
@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from typing import Any
+
+import attr
+from aiohttp import WSMsgType, web
+
+__all__ = ("FakeBucket", "FakeDiscord")
+
+Key = tuple[str, str]
+
+
+@attr.s(slots=True)
+class FakeBucket:
+    """A ratelimit bucket of the fake REST API.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        The amount of requests allowed per reset.
+
+    reset_after: :class:`float`
+        The seconds it takes for the bucket to reset.
+
+    hash: :class:`str`
+        The hash sent in the ``X-RateLimit-Bucket`` header.
+
+    Attributes
+    ----------
+    remaining: :class:`int`
+        The requests left before the bucket is depleted.
+
+    resets_at: :class:`float`
+        When the bucket resets, in seconds since the epoch.
+    """
+
+    limit: int = attr.field()
+    reset_after: float = attr.field()
+    hash: str = attr.field(factory=lambda: uuid.uuid4().hex)
+
+    remaining: int = attr.field(init=False)
+    resets_at: float = attr.field(init=False, default=0.0)
+
+    def __attrs_post_init__(self) -> None:
+        self.remaining = self.limit
+
+    def take(self, now: float) -> bool:
+        """Takes a request from the bucket.
+
+        Parameters
+        ----------
+        now: :class:`float`
+            The current time, in seconds since the epoch.
+
+        Returns
+        -------
+        :class:`bool`
+            If the request is allowed.
+        """
+        if now >= self.resets_at:
+            self.remaining = self.limit
+            self.resets_at = now + self.reset_after
+
+        if self.remaining == 0:
+            return False
+
+        self.remaining -= 1
+        return True
+
+    def headers(self, now: float) -> dict[str, str]:
+        """The ratelimit headers of the bucket."""
+        return {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": f"{self.resets_at:.3f}",
+            "X-RateLimit-Reset-After": f"{max(self.resets_at - now, 0):.3f}",
+            "X-RateLimit-Bucket": self.hash,
+        }
+
+
+@attr.s(slots=True)
+class FakeDiscord:
+    """A local fake of Discord's gateway and RESTful API. Intended for tests.
+
+    The gateway sends ``HELLO``, answers ``IDENTIFY`` with ``READY``,
+    ``RESUME`` with ``RESUMED`` and acknowledges heartbeats. The RESTful API
+    answers every route with a configurable response, ratelimit headers and 429s.
+
+    .. code:: python
+
+        async with rin.testing.FakeDiscord() as server:
+            client = rin.GatewayClient("TOKEN", api=server.api)
+            server.ratelimit("GET", "users/@me", limit=5, reset_after=1)
+
+    Parameters
+    ----------
+    host: :class:`str`
+        The host to bind to.
+
+    port: :class:`int`
+        The port to bind to. ``0`` binds to a random free port.
+
+    heartbeat_interval: :class:`int`
+        The heartbeat interval sent in ``HELLO``, in milliseconds.
+
+    user: :class:`dict`
+        The user sent in ``READY``.
+
+    Attributes
+    ----------
+    sockets: list[:class:`aiohttp.web.WebSocketResponse`]
+        The connected gateway sockets.
+
+    received: list[:class:`dict`]
+        Every payload received on the gateway.
+
+    requests: list[tuple[:class:`str`, :class:`str`]]
+        The method and path of every RESTful request received.
+
+    bodies: list[:class:`bytes`]
+        The body of every RESTful request received.
+
+    types: list[:class:`str`]
+        The ``Content-Type`` header of every RESTful request received.
+
+    headers: list[dict[:class:`str`, :class:`str`]]
+        The headers of every RESTful request received.
+    """
+
+    host: str = attr.field(default="127.0.0.1")
+    port: int = attr.field(default=0)
+    heartbeat_interval: int = attr.field(default=41250, kw_only=True)
+    user: dict[str, Any] = attr.field(
+        kw_only=True,
+        factory=lambda: {
+            "id": "1",
+            "username": "Rin",
+            "discriminator": "0001",
+            "bot": True,
+        },
+    )
+
+    sockets: list[web.WebSocketResponse] = attr.field(init=False, factory=list)
+    received: list[dict[str, Any]] = attr.field(init=False, factory=list)
+    requests: list[Key] = attr.field(init=False, factory=list)
+    bodies: list[bytes] = attr.field(init=False, factory=list, repr=False)
+    types: list[str] = attr.field(init=False, factory=list, repr=False)
+    headers: list[dict[str, str]] = attr.field(init=False, factory=list, repr=False)
+
+    sequence: int = attr.field(init=False, default=0)
+    session: str = attr.field(init=False, factory=lambda: uuid.uuid4().hex)
+
+    buckets: dict[Key, FakeBucket] = attr.field(init=False, factory=dict)
+    responses: dict[Key, tuple[int, Any, dict[str, str]]] = attr.field(
+        init=False, factory=dict
+    )
+    failures: dict[Key, list[tuple[float, bool]]] = attr.field(init=False, factory=dict)
+    global_until: float = attr.field(init=False, default=0.0)
+
+    runner: web.AppRunner = attr.field(init=False, repr=False)
+
+    @property
+    def api(self) -> str:
+        """The base url of the RESTful API. Pass this as ``api`` to the client."""
+        return f"http://{self.host}:{self.port}/api/v{{0}}/"
+
+    @property
+    def gateway(self) -> str:
+        """The url of the gateway."""
+        return f"ws://{self.host}:{self.port}/gateway"
+
+    async def start(self) -> None:
+        """Starts the server."""
+        app = web.Application()
+        app.router.add_get("/gateway", self.connect)
+        app.router.add_route("*", "/api/v{version}/{path:.*}", self.handle)
+
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+
+        if self.port == 0 and site._server is not None:  # type: ignore
+            self.port = site._server.sockets[0].getsockname()[1]  # type: ignore
+
+    async def close(self) -> None:
+        """Closes every gateway socket and stops the server."""
+        for sock in self.sockets[:]:
+            await sock.close()
+
+        await self.runner.cleanup()
+
+    async def __aenter__(self) -> FakeDiscord:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        body: Any,
+        status: int = 200,
+        headers: None | dict[str, str] = None,
+    ) -> None:
+        """Sets the response of a route.
+
+        Routes without a response answer with an empty JSON object.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The method of the route, E.g ``"GET"``.
+
+        path: :class:`str`
+            The path of the route relative to the API, E.g ``"users/@me"``.
+
+        body: Any
+            The JSON body to respond with. Callables are called with the
+            query of each request, returning the body.
+
+        status: :class:`int`
+            The status to respond with.
+
+        headers: None | dict[:class:`str`, :class:`str`]
+            The headers to respond with. A request whose ``If-None-Match``
+            matches the ``ETag`` header is answered with a ``304``.
+        """
+        self.responses[(method, path)] = (status, body, headers or {})
+
+    def ratelimit(
+        self,
+        method: str,
+        path: str,
+        *,
+        limit: int,
+        reset_after: float,
+        bucket: None | str = None,
+    ) -> FakeBucket:
+        """Ratelimits a route. Routes given the same bucket hash share their limit.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The method of the route, E.g ``"GET"``.
+
+        path: :class:`str`
+            The path of the route relative to the API.
+
+        limit: :class:`int`
+            The amount of requests allowed per reset.
+
+        reset_after: :class:`float`
+            The seconds it takes for the bucket to reset.
+
+        bucket: None | :class:`str`
+            The hash of the bucket. A random hash is used if not given.
+
+        Returns
+        -------
+        :class:`.FakeBucket`
+            The bucket of the route.
+        """
+        if bucket is None:
+            created = FakeBucket(limit, reset_after)
+
+        elif shared := [b for b in self.buckets.values() if b.hash == bucket]:
+            created = shared[0]
+
+        else:
+            created = FakeBucket(limit, reset_after, bucket)
+
+        self.buckets[(method, path)] = created
+        return created
+
+    def fail(
+        self,
+        method: str,
+        path: str,
+        *,
+        count: int = 1,
+        retry_after: float = 0.1,
+        is_global: bool = False,
+    ) -> None:
+        """Makes the next requests of a route respond with a 429.
+
+        Parameters
+        ----------
+        method: :class:`str`
+            The method of the route, E.g ``"GET"``.
+
+        path: :class:`str`
+            The path of the route relative to the API.
+
+        count: :class:`int`
+            The amount of requests to fail.
+
+        retry_after: :class:`float`
+            The ``retry_after`` to respond with.
+
+        is_global: :class:`bool`
+            If the 429s are global ratelimits. Every route is then
+            ratelimited until ``retry_after`` passes.
+        """
+        failures = self.failures.setdefault((method, path), [])
+        failures.extend((retry_after, is_global) for _ in range(count))
+
+    async def handle(self, request: web.Request) -> web.Response:
+        method, path = request.method, request.match_info["path"]
+        key = (method, path)
+        now = time.time()
+
+        self.requests.append(key)
+        self.bodies.append(await request.read())
+        self.types.append(request.headers.get("Content-Type", ""))
+        self.headers.append(dict(request.headers))
+
+        if path == "gateway/bot":
+            return web.json_response(
+                {
+                    "url": self.gateway,
+                    "shards": 1,
+                    "session_start_limit": {
+                        "total": 1000,
+                        "remaining": 1000,
+                        "reset_after": 0,
+                        "max_concurrency": 1,
+                    },
+                }
+            )
+
+        if now < self.global_until:
+            return self.ratelimited(self.global_until - now, True, "global")
+
+        if failures := self.failures.get(key):
+            retry_after, is_global = failures.pop(0)
+
+            if is_global:
+                self.global_until = now + retry_after
+
+            return self.ratelimited(
+                retry_after, is_global, "global" if is_global else "user"
+            )
+
+        headers: dict[str, str] = {}
+        if bucket := self.buckets.get(key):
+            if not bucket.take(now):
+                return self.ratelimited(
+                    bucket.resets_at - now, False, "user", bucket.headers(now)
+                )
+
+            headers = bucket.headers(now)
+
+        status, body, extra = self.responses.get(key, (200, {}, {}))
+        headers.update(extra)
+
+        if callable(body):
+            body = body(dict(request.query))
+
+        if "ETag" in extra and request.headers.get("If-None-Match") == extra["ETag"]:
+            return web.Response(status=304, headers=headers)
+
+        if status == 204:
+            return web.Response(status=204, headers=headers)
+
+        return web.json_response(body, status=status, headers=headers)
+
+    def ratelimited(
+        self,
+        retry_after: float,
+        is_global: bool,
+        scope: str,
+        headers: None | dict[str, str] = None,
+    ) -> web.Response:
+        headers = {
+            **(headers or {}),
+            "Retry-After": f"{retry_after:.3f}",
+            "X-RateLimit-Scope": scope,
+        }
+
+        if is_global:
+            headers["X-RateLimit-Global"] = "true"
+
+        body = {
+            "message": "You are being rate limited.",
+            "retry_after": retry_after,
+            "global": is_global,
+        }
+
+        return web.json_response(body, status=429, headers=headers)
+
+    async def connect(self, request: web.Request) -> web.WebSocketResponse:
+        sock = web.WebSocketResponse()
+        await sock.prepare(request)
+
+        self.sockets.append(sock)
+        await sock.send_json(
+            {"op": 10, "d": {"heartbeat_interval": self.heartbeat_interval}}
+        )
+
+        try:
+            async for message in sock:
+                if message.type is not WSMsgType.TEXT:
+                    continue
+
+                payload = json.loads(message.data)
+                self.received.append(payload)
+
+                await self.receive(sock, payload)
+        finally:
+            self.sockets.remove(sock)
+
+        return sock
+
+    async def receive(self, sock: web.WebSocketResponse, payload: dict[str, Any]) -> None:
+        op = payload["op"]
+
+        if op == 1:
+            await sock.send_json({"op": 11})
+
+        elif op == 2:
+            ready = {"v": 10, "user": self.user, "guilds": [], "session_id": self.session}
+            await self.send(sock, "READY", ready)
+
+        elif op == 6:
+            await self.send(sock, "RESUMED", {})
+
+    async def send(self, sock: web.WebSocketResponse, event: str, data: Any) -> None:
+        self.sequence += 1
+        await sock.send_json({"op": 0, "s": self.sequence, "t": event, "d": data})
+
+    async def dispatch(self, event: str, data: Any) -> None:
+        """Dispatches an event to every connected socket.
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event, E.g ``"MESSAGE_CREATE"``.
+
+        data: Any
+            The data of the event.
+        """
+        for sock in self.sockets[:]:
+            await self.send(sock, event, data)
+
+    async def storm(
+        self, event: str, data: Any, count: int, rate: None | float = None
+    ) -> None:
+        """Dispatches an event many times.
+
+        Parameters
+        ----------
+        event: :class:`str`
+            The name of the event.
+
+        data: Any
+            The data of the event.
+
+        count: :class:`int`
+            The amount of times to dispatch the event.
+
+        rate: None | :class:`float`
+            The dispatches per second. None dispatches as fast as possible.
+        """
+        for _ in range(count):
+            await self.dispatch(event, data)
+
+            if rate is not None:
+                await asyncio.sleep(1 / rate)
+
+    async def reconnect(self) -> None:
+        """Asks every connected socket to reconnect."""
+        for sock in self.sockets[:]:
+            await sock.send_json({"op": 7, "d": None})
@@ -1 +1,4 @@
+from .histogram import *
 from .loop import *
+from .media import *
+from .payload import *
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, ClassVar
+
+import attr
+
+__all__ = ("Histogram",)
+
+
+@attr.s(slots=True)
+class Histogram:
+    """A fixed bucket histogram.
+
+    Observations are counted into the first bucket whose upper bound
+    is greater than or equal to the observed value.
+
+    Parameters
+    ----------
+    bounds: tuple[:class:`float`, ...]
+        The upper bounds of the buckets, in ascending order.
+
+    Attributes
+    ----------
+    counts: list[:class:`int`]
+        The non-cumulative count of each bucket. The last item
+        holds observations above every bound.
+
+    sum: :class:`float`
+        The sum of all observed values.
+
+    count: :class:`int`
+        The amount of observed values.
+    """
+
+    BOUNDS: ClassVar[tuple[float, ...]] = (
+        0.001,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    bounds: tuple[float, ...] = attr.field(default=BOUNDS)
+
+    counts: list[int] = attr.field(init=False)
+    sum: float = attr.field(init=False, default=0.0)
+    count: int = attr.field(init=False, default=0)
+
+    def __attrs_post_init__(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Records a value.
+
+        Parameters
+        ----------
+        value: :class:`float`
+            The value to record.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """The cumulative counts of each bucket, including ``+Inf``.
+
+        Returns
+        -------
+        list[tuple[:class:`float`, :class:`int`]]
+            A list of ``(upper bound, count)`` pairs.
+        """
+        total = 0
+        buckets: list[tuple[float, int]] = []
+
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            total += count
+            buckets.append((bound, total))
+
+        return buckets
+
+    def to_dict(self) -> dict[str, Any]:
+        """Turns the histogram into a dict.
+
+        Returns
+        -------
+        :class:`dict`
+            The dict representing the histogram.
+        """
+        return {
+            "buckets": dict(self.cumulative()),
+            "sum": self.sum,
+            "count": self.count,
+        }
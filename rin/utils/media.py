@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+__all__ = ("mime_type", "data_uri")
+
+SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+_magic: Any = None
+
+
+def mime_type(data: bytes) -> str:
+    """Detects the MIME type of some data.
+
+    Common image formats are detected from their signature, anything else
+    goes through libmagic, which is only imported the first time it's needed.
+    This is blocking, see :meth:`.GatewayClient.run_blocking`.
+
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The data to detect the type of.
+
+    Returns
+    -------
+    :class:`str`
+        The MIME type of the data, E.g ``"image/png"``.
+    """
+    global _magic
+
+    for signature, mime in SIGNATURES:
+        if data.startswith(signature):
+            return mime
+
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+
+    if _magic is None:
+        import magic
+
+        _magic = magic
+
+    return str(_magic.from_buffer(data[:2048], mime=True))
+
+
+def data_uri(data: bytes, mime: None | str = None) -> str:
+    """Encodes data into a base64 data URI, E.g for avatars.
+
+    This is blocking, see :meth:`.GatewayClient.run_blocking`.
+
+    Parameters
+    ----------
+    data: :class:`bytes`
+        The data to encode.
+
+    mime: None | :class:`str`
+        The MIME type of the data. Detected with :func:`mime_type` if not given.
+
+    Returns
+    -------
+    :class:`str`
+        The data URI.
+    """
+    mime = mime or mime_type(data)
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import attr
+
+__all__ = ("Serialized", "dumps")
+
+
+def dumps(payload: Any) -> bytes:
+    """Encodes a payload into compact JSON.
+
+    Parameters
+    ----------
+    payload: Any
+        The payload to encode.
+
+    Returns
+    -------
+    :class:`bytes`
+        The UTF-8 encoded JSON.
+    """
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+@attr.s(slots=True)
+class Serialized:
+    """The memoized serialized form of a builder.
+
+    Builders keep their last :meth:`to_dict` return here and clear it when mutated.
+    The dict is shared between every call, it should not be mutated.
+
+    Attributes
+    ----------
+    payload: None | :class:`dict`
+        The memoized dict, None if it has to be rebuilt.
+
+    encoded: None | tuple[:class:`dict`, :class:`bytes`]
+        The last dict encoded and its JSON.
+    """
+
+    payload: None | dict[str, Any] = attr.field(default=None)
+    encoded: None | tuple[dict[str, Any], bytes] = attr.field(default=None, repr=False)
+
+    def clear(self) -> None:
+        """Clears the memoized forms."""
+        self.payload = None
+        self.encoded = None
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        """Encodes a dict into JSON, reusing the last encoding if it's the same dict.
+
+        Parameters
+        ----------
+        payload: :class:`dict`
+            The dict to encode.
+
+        Returns
+        -------
+        :class:`bytes`
+            The JSON of the dict.
+        """
+        if self.encoded is None or self.encoded[0] is not payload:
+            self.encoded = (payload, dumps(payload))
+
+        return self.encoded[1]
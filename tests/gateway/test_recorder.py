@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import rin
+
+
+class TestRecorder:
+    @pytest.fixture()
+    def path(self, tmp_path: Path) -> Path:
+        return tmp_path / "traffic.gz"
+
+    def test_write(self, path: Path) -> None:
+        with rin.Recorder(path) as recorder:
+            recorder.write(0, '{"op": 0,\n"t": "TYPING_START"}')
+
+        with rin.Recorder(path) as recorder:
+            recorder.write(11, '{"op": 11}')
+
+        client = rin.GatewayClient("DISCORD_TOKEN")
+        frames = list(rin.Replayer(client, path).frames())
+
+        assert [(op, raw) for _, op, raw in frames] == [
+            (0, '{"op": 0, "t": "TYPING_START"}'),
+            (11, '{"op": 11}'),
+        ]
+
+    def test_batch(self, path: Path) -> None:
+        with rin.Recorder(path, batch=2) as recorder:
+            for op in range(3):
+                recorder.write(op, "{}")
+
+            assert len(recorder.buffer) == 1 and recorder.frames == 3
+
+        client = rin.GatewayClient("DISCORD_TOKEN")
+        assert [op for _, op, _ in rin.Replayer(client, path).frames()] == [0, 1, 2]
+
+    @pytest.mark.asyncio()
+    async def test_replay(self, path: Path) -> None:
+        received: list[dict[Any, Any]] = []
+
+        with rin.Recorder(path) as recorder:
+            recorder.write(11, json.dumps({"op": 11}))
+
+            for index in range(5):
+                frame = {"op": 0, "s": index + 1, "t": "TYPING_START", "d": {"i": index}}
+                recorder.write(0, json.dumps(frame))
+
+        client = rin.GatewayClient("DISCORD_TOKEN")
+
+        @rin.Events.TYPING_START.on()
+        async def listener(data: dict[Any, Any]) -> None:
+            await asyncio.sleep(0.01)
+            received.append({**data, "no_chunk": client.no_chunk})
+
+        try:
+            count = await rin.Replayer(client, path, speed=None).run()
+        finally:
+            rin.Events.TYPING_START.listeners.remove(listener)
+
+        assert count == 5
+        assert client.gateway.sequence == 5
+        assert client.no_chunk is False
+        assert [data["i"] for data in received] == [0, 1, 2, 3, 4]
+        assert all(data["no_chunk"] for data in received)
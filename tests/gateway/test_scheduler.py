@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import attr
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+MESSAGE: dict[str, Any] = {
+    "id": "6",
+    "type": 0,
+    "channel_id": "1",
+    "content": "late",
+    "timestamp": "2022-01-01T00:00:00+00:00",
+    "author": {"id": "2", "username": "Rin", "discriminator": "0001"},
+}
+
+
+@attr.s(slots=True)
+class Component:
+    started: asyncio.Event = attr.field(factory=asyncio.Event)
+    release: asyncio.Event = attr.field(factory=asyncio.Event)
+
+    async def callback(self, interaction: rin.Interaction, _: Any) -> None:
+        self.started.set()
+        await self.release.wait()
+
+
+class TestInteractionScheduler:
+    @pytest.mark.asyncio()
+    async def test_defer(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("PATCH", "webhooks/3/tok/messages/@original", MESSAGE)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api, defer_after=0.05)
+            client.loop = asyncio.get_running_loop()
+
+            data = {"id": "1", "application_id": "3", "token": "tok", "type": 2}
+            interaction = rin.Interaction(client, data)
+            client.interactions.track(interaction)
+            message: None | rin.Message = None
+
+            try:
+                await asyncio.sleep(0.15)
+                await client.interactions.wait()
+
+                assert interaction.deferred is True
+                message = await interaction.send("late")
+            finally:
+                await client.rest.close()
+
+                if message is not None:
+                    rin.Message.cache.pop(message.snowflake)
+
+            assert server.requests == [
+                ("POST", "interactions/1/tok/callback"),
+                ("PATCH", "webhooks/3/tok/messages/@original"),
+            ]
+            assert json.loads(server.bodies[0]) == {"type": 5}
+            assert interaction.deferred is False
+            assert client.interactions.deferred == 1
+
+            latency = client.interactions.latency.values[("COMMAND", "true")]
+            assert latency.count == 1
+
+    @pytest.mark.asyncio()
+    async def test_defer_component(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("POST", "webhooks/3/tok", MESSAGE)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api, defer_after=0.05)
+            client.loop = asyncio.get_running_loop()
+
+            data = {"id": "1", "application_id": "3", "token": "tok", "type": 3}
+            interaction = rin.Interaction(client, data)
+            client.interactions.track(interaction)
+            message: None | rin.Message = None
+
+            try:
+                await asyncio.sleep(0.15)
+                await client.interactions.wait()
+
+                message = await interaction.send("late", ephemeral=True)
+            finally:
+                await client.rest.close()
+
+                if message is not None:
+                    rin.Message.cache.pop(message.snowflake)
+
+            # The message holding the components is left untouched.
+            assert server.requests == [
+                ("POST", "interactions/1/tok/callback"),
+                ("POST", "webhooks/3/tok"),
+            ]
+            assert json.loads(server.bodies[0]) == {"type": 6}
+            assert json.loads(server.bodies[1])["flags"] == 64
+            assert interaction.deferred is False
+
+    @pytest.mark.asyncio()
+    async def test_defer_ephemeral(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("DELETE", "webhooks/3/tok/messages/@original", None, 204)
+            server.respond("POST", "webhooks/3/tok", MESSAGE)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api, defer_after=0.05)
+            client.loop = asyncio.get_running_loop()
+
+            data = {"id": "1", "application_id": "3", "token": "tok", "type": 2}
+            interaction = rin.Interaction(client, data)
+            client.interactions.track(interaction)
+            message: None | rin.Message = None
+
+            try:
+                await asyncio.sleep(0.15)
+                await client.interactions.wait()
+
+                message = await interaction.send("late", ephemeral=True)
+            finally:
+                await client.rest.close()
+
+                if message is not None:
+                    rin.Message.cache.pop(message.snowflake)
+
+            # The public loading state can't become ephemeral, so it's replaced.
+            assert server.requests == [
+                ("POST", "interactions/1/tok/callback"),
+                ("DELETE", "webhooks/3/tok/messages/@original"),
+                ("POST", "webhooks/3/tok"),
+            ]
+            assert json.loads(server.bodies[2])["flags"] == 64
+
+    @pytest.mark.asyncio()
+    async def test_responded(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("POST", "webhooks/3/tok", MESSAGE)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api, defer_after=0.05)
+            client.loop = asyncio.get_running_loop()
+
+            data = {"id": "1", "application_id": "3", "token": "tok", "type": 3}
+            interaction = rin.Interaction(client, data)
+            client.interactions.track(interaction)
+            message: None | rin.Message = None
+
+            try:
+                await interaction.modal(rin.Modal("Title"))
+                await asyncio.sleep(0.1)
+
+                message = await interaction.send("late")
+            finally:
+                await client.rest.close()
+
+                if message is not None:
+                    rin.Message.cache.pop(message.snowflake)
+
+            assert server.requests == [
+                ("POST", "interactions/1/tok/callback"),
+                ("POST", "webhooks/3/tok"),
+            ]
+            assert client.interactions.deferred == 0
+
+    @pytest.mark.asyncio()
+    async def test_autocomplete(self) -> None:
+        async with FakeDiscord() as server:
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api, defer_after=0.01)
+            client.loop = asyncio.get_running_loop()
+
+            data = {"id": "1", "application_id": "3", "token": "tok", "type": 4}
+            interaction = rin.Interaction(client, data)
+            client.interactions.track(interaction)
+
+            try:
+                await asyncio.sleep(0.05)
+                await client.interactions.wait()
+            finally:
+                await client.rest.close()
+
+            assert server.requests == []
+            assert interaction.responded is False
+
+    @pytest.mark.asyncio()
+    async def test_modal_after_defer(self) -> None:
+        async with FakeDiscord() as server:
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            data = {"id": "1", "application_id": "3", "token": "tok", "type": 3}
+            interaction = rin.Interaction(client, data)
+
+            try:
+                await interaction.defer()
+
+                with pytest.raises(ValueError):
+                    await interaction.modal(rin.Modal("Title"))
+            finally:
+                await client.rest.close()
+
+            assert server.requests == [("POST", "interactions/1/tok/callback")]
+
+    @pytest.mark.asyncio()
+    async def test_callback_task(self) -> None:
+        client = rin.GatewayClient("DISCORD_TOKEN", defer_after=None)
+        client.loop = asyncio.get_running_loop()
+
+        component = Component()
+        rin.ComponentCache.cache.set("slow", component)  # type: ignore
+
+        dispatched: list[rin.Interaction] = []
+
+        @rin.Events.INTERACTION_CREATE.on()
+        async def listener(interaction: rin.Interaction) -> None:
+            dispatched.append(interaction)
+
+        data = {"id": "1", "token": "tok", "type": 3, "data": {"custom_id": "slow"}}
+
+        try:
+            await client.gateway.parser.parse_interaction_create(data)
+            await component.started.wait()
+            await asyncio.sleep(0)
+
+            assert len(dispatched) == 1
+            assert len(client.interactions.tasks) == 1
+
+            component.release.set()
+            await client.interactions.wait()
+        finally:
+            rin.Events.INTERACTION_CREATE.listeners.remove(listener)
+            rin.ComponentCache.cache.pop("slow")
+
+        assert not client.interactions.tasks
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest import mock
+
+import pytest
+
+import rin
+
+
+class TestDispatchStats:
+    # pyright: reportUnknownMemberType=false
+
+    @pytest.fixture()
+    def client(self) -> rin.GatewayClient:
+        return rin.GatewayClient("DISCORD_TOKEN")
+
+    @pytest.mark.asyncio()
+    async def test_measure(self, client: rin.GatewayClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = rin.Event[Any]("TEST_MEASURE")
+
+        @event.on()
+        async def listener(value: int) -> int:
+            return value
+
+        (task,) = client.dispatch(event, 1)
+        assert await task == 1
+
+        snapshot = client.snapshot()
+        stats = snapshot["listeners"]["TEST_MEASURE"][listener.callback.__qualname__]
+
+        assert snapshot["events"]["TEST_MEASURE"]["calls"] == 1
+        assert stats["calls"] == 1
+        assert stats["errors"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["latency"]["count"] == 1
+
+    @pytest.mark.asyncio()
+    async def test_in_flight(self, client: rin.GatewayClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = rin.Event[Any]("TEST_IN_FLIGHT")
+        release = asyncio.Event()
+
+        @event.on()
+        async def listener() -> None:
+            await release.wait()
+
+        (task,) = client.dispatch(event)
+        await asyncio.sleep(0)
+
+        assert client.stats.event("TEST_IN_FLIGHT").in_flight == 1
+
+        release.set()
+        await task
+
+        assert client.stats.event("TEST_IN_FLIGHT").in_flight == 0
+
+    @pytest.mark.asyncio()
+    async def test_on_error(self, client: rin.GatewayClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = rin.Event[Any]("TEST_ON_ERROR")
+        error = RuntimeError("foo")
+
+        @event.on()
+        async def listener() -> None:
+            raise error
+
+        with mock.patch.object(rin.GatewayClient, "on_error") as on_error_mock:
+            on_error_mock: mock.MagicMock
+
+            (task,) = client.dispatch(event)
+            assert await task is None
+
+            on_error_mock.assert_awaited_once_with(event, listener, error)
+
+        assert client.stats.event("TEST_ON_ERROR").errors == 1
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import pathlib
+
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+
+class TestFile:
+    def test_path(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "image.png"
+        path.write_bytes(b"x" * 100)
+
+        file = rin.File(path)
+        assert file.name == "image.png" and file.size == 100 and file.source is None
+
+        with file.open() as handle:
+            assert handle.read() == b"x" * 100
+
+        file.validate()
+        with pytest.raises(ValueError):
+            file.validate(50)
+
+    def test_stream(self) -> None:
+        stream = io.BytesIO(b"headerbody")
+        stream.seek(6)
+
+        file = rin.File(stream, "body.txt")
+        assert file.size == 4
+
+        for _ in range(2):
+            handle = file.open()
+            assert handle.read() == b"body"
+            handle.close()
+
+        assert not stream.closed
+
+    def test_invalid(self) -> None:
+        with pytest.raises(TypeError):
+            rin.File(123)  # type: ignore
+
+    @pytest.mark.asyncio()
+    async def test_retry(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"0123456789" * 1000)
+
+        async with FakeDiscord() as server:
+            server.fail("POST", "channels/1/messages", retry_after=0)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            files = [rin.File(path), rin.File(io.BytesIO(b"stream"), "stream.txt")]
+
+            try:
+                route = rin.Route("channels/{channel_id}/messages", channel_id=1)
+                form = [file.field(index) for index, file in enumerate(files)]
+
+                await client.rest.request(
+                    "POST", route, json={"content": "hi"}, form=form
+                )
+            finally:
+                await client.rest.close()
+
+            assert len(server.bodies) == 2
+            for body in server.bodies:
+                assert b"0123456789" * 1000 in body and b"stream" in body
+
+    def test_shared_stream(self) -> None:
+        file = rin.File(io.BytesIO(b"0123456789"), "digits.txt")
+        first, second = file.open(), file.open()
+
+        # Concurrent uploads of the stream don't move each other's position.
+        assert first.read(4) == b"0123"
+        assert second.read(6) == b"012345"
+        assert first.read() == b"456789" and second.read() == b"6789"
+
+    def test_buffer(self) -> None:
+        data = bytearray(b"buffer")
+        file = rin.File(data, "buffer.txt")
+
+        assert file.size == 6 and file.read(3) == b"buf"
+        assert file.open() is file.buffer and file.buffer.readonly
+
+    @pytest.mark.asyncio()
+    async def test_shared_buffer(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "banner.png"
+        path.write_bytes(b"banner" * 100)
+
+        file = rin.File.cached(path)
+        assert file.name == "banner.png" and file.size == 600
+        assert rin.File.cached(path).buffer is file.buffer
+
+        async with FakeDiscord() as server:
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            route = rin.Route("channels/{channel_id}/messages", channel_id=1)
+
+            try:
+                await asyncio.gather(
+                    *(
+                        client.rest.request("POST", route, form=[file.field(0)])
+                        for _ in range(5)
+                    )
+                )
+            finally:
+                await client.rest.close()
+                rin.File.attachments.clear()
+
+            assert all(b"banner" * 100 in body for body in server.bodies)
+
+
+class TestAttachmentCache:
+    def test_eviction(self, tmp_path: pathlib.Path) -> None:
+        cache = rin.AttachmentCache(max_bytes=150)
+        paths = [tmp_path / f"{index}.bin" for index in range(3)]
+
+        for path in paths:
+            path.write_bytes(b"x" * 100)
+            cache.get(path)
+
+        assert len(cache.entries) == 1 and cache.size == 100
+
+        cache.pop(paths[2])
+        assert not cache.entries and cache.size == 0
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+from typing import Any
+
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+
+def message(id: int, channel_id: int) -> dict[str, Any]:
+    return {
+        "id": str(id),
+        "type": 0,
+        "channel_id": str(channel_id),
+        "content": "Hello",
+        "timestamp": "2022-01-01T00:00:00+00:00",
+        "author": {"id": "2", "username": "Rin", "discriminator": "0001"},
+    }
+
+
+class TestBroadcast:
+    @pytest.mark.asyncio()
+    async def test_broadcast(self) -> None:
+        async with FakeDiscord() as server:
+            for channel in range(1, 6):
+                path = f"channels/{channel}/messages"
+                server.respond("POST", path, message(100 + channel, channel))
+
+            server.respond("POST", "channels/3/messages", {"message": "No"}, status=403)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            broadcast = client.broadcast(range(1, 6), "Hello", concurrency=2)
+
+            try:
+                results = [result async for result in broadcast]
+
+                assert sorted(r.channel_id for r in results) == [1, 2, 3, 4, 5]
+                (failed,) = [r for r in results if not r.ok]
+                assert failed.channel_id == 3
+                assert isinstance(failed.error, rin.Forbidden)
+                assert broadcast.completed == {1, 2, 4, 5}
+                assert broadcast.pending == [3]
+
+                server.respond("POST", "channels/3/messages", message(103, 3))
+                (result,) = await broadcast.run()
+
+                assert result.ok and result.channel_id == 3
+                assert broadcast.pending == []
+            finally:
+                await client.rest.close()
+
+                for channel in range(1, 6):
+                    rin.Message.cache.pop(100 + channel)
+
+            assert len(set(server.bodies)) == 1
+            assert json.loads(server.bodies[0])["content"] == "Hello"
+
+    @pytest.mark.asyncio()
+    async def test_resume(self) -> None:
+        async with FakeDiscord() as server:
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            try:
+                broadcast = client.broadcast([1, 2], "Hello", completed=[1, 2])
+                assert await broadcast.run() == []
+            finally:
+                await client.rest.close()
+
+            assert server.requests == []
+
+    @pytest.mark.asyncio()
+    async def test_files(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("POST", "channels/1/messages", message(101, 1))
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            broadcast = client.broadcast([1], "Hi", files=[rin.File(b"data", "data.txt")])
+
+            try:
+                (result,) = await broadcast.run()
+            finally:
+                await client.rest.close()
+                rin.Message.cache.pop(101)
+
+            assert result.ok
+            assert server.types[0].startswith("multipart/form-data; boundary=")
+            assert b'name="payload_json"' in server.bodies[0]
+
+    def test_stream(self) -> None:
+        client = rin.GatewayClient("DISCORD_TOKEN")
+        file = rin.File(io.BytesIO(b"data"), "data.txt")
+
+        with pytest.raises(ValueError):
+            client.broadcast([1], "Hello", files=[file])
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+
+import rin
+
+
+class TestEmbedBuilder:
+    def test_to_dict(self) -> None:
+        embed = rin.EmbedBuilder(title="Title")
+        embed.set_footer("Footer")
+        embed.add_field("Name", "Value")
+
+        payload = embed.to_dict()
+
+        assert payload == {
+            "title": "Title",
+            "footer": {"text": "Footer", "icon_url": None},
+            "fields": [{"name": "Name", "value": "Value", "inline": False}],
+        }
+        assert embed.to_dict() is payload
+
+    def test_invalidate(self) -> None:
+        embed = rin.EmbedBuilder(title="Title")
+        payload = embed.to_dict()
+
+        embed.description = "Description"
+        assert embed.to_dict() is not payload
+        assert embed.to_dict()["description"] == "Description"
+
+        payload = embed.to_dict()
+        embed.add_field("Name", "Value")
+        assert len(embed.to_dict()["fields"]) == 1
+
+    def test_to_json(self) -> None:
+        embed = rin.EmbedBuilder(title="Title")
+        encoded = embed.to_json()
+
+        assert json.loads(encoded) == {"title": "Title"}
+        assert embed.to_json() is encoded
+
+        embed.title = "Other"
+        assert json.loads(embed.to_json()) == {"title": "Other"}
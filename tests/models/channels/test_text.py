@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any
+
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+DAY = 24 * 60 * 60
+
+
+def message(id: int, bot: bool = False) -> dict[str, Any]:
+    return {
+        "id": str(id),
+        "type": 0,
+        "channel_id": "1",
+        "content": "Hello",
+        "timestamp": "2022-01-01T00:00:00+00:00",
+        "author": {"id": "2", "username": "Rin", "discriminator": "0001", "bot": bot},
+    }
+
+
+class TestTextChannel:
+    @pytest.mark.asyncio()
+    async def test_purge(self) -> None:
+        now = time.time()
+
+        # 150 recent messages and 3 older than 14 days, newest first.
+        recent = [int(rin.Snowflake.from_timestamp(now - i)) for i in range(1, 151)]
+        old = [int(rin.Snowflake.from_timestamp(now - 20 * DAY - i)) for i in range(3)]
+        snowflakes = recent + old
+
+        def history(query: dict[str, str]) -> list[dict[str, Any]]:
+            before = int(query.get("before", 2**63))
+            page = [s for s in snowflakes if s < before][: int(query["limit"])]
+            return [message(s) for s in page]
+
+        async with FakeDiscord() as server:
+            server.respond("GET", "channels/1/messages", history)
+            server.respond("POST", "channels/1/messages/bulk-delete", None, status=204)
+
+            for snowflake in old:
+                server.respond("DELETE", f"channels/1/messages/{snowflake}", None, 204)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            channel = rin.TextChannel(client, {"id": "1", "type": 0})
+            cached = rin.Message(client, message(recent[0]))
+
+            try:
+                deleted = await channel.purge(limit=None)
+            finally:
+                await client.rest.close()
+                rin.TextChannel.cache.pop(1)
+
+        assert sorted(deleted) == sorted(snowflakes)
+        assert rin.Message.cache.get(cached.snowflake) is None
+
+        bulk = [
+            json.loads(body)["messages"]
+            for (method, _), body in zip(server.requests, server.bodies)
+            if method == "POST"
+        ]
+        assert sorted(len(messages) for messages in bulk) == [50, 100]
+
+        singles = [path for method, path in server.requests if method == "DELETE"]
+        assert sorted(singles) == sorted(f"channels/1/messages/{s}" for s in old)
+
+    @pytest.mark.asyncio()
+    async def test_purge_check(self) -> None:
+        def history(query: dict[str, str]) -> list[dict[str, Any]]:
+            now = time.time()
+            return [
+                message(rin.Snowflake.from_timestamp(now - i), i % 2 == 0)
+                for i in range(4)
+            ]
+
+        async with FakeDiscord() as server:
+            server.respond("GET", "channels/1/messages", history)
+            server.respond("POST", "channels/1/messages/bulk-delete", None, status=204)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            channel = rin.TextChannel(client, {"id": "1", "type": 0})
+
+            try:
+                deleted = await channel.purge(limit=4, check=lambda m: m.user.bot)
+            finally:
+                await client.rest.close()
+                rin.TextChannel.cache.pop(1)
+
+        assert len(deleted) == 2
+        assert json.loads(server.bodies[-1])["messages"] == [str(s) for s in deleted]
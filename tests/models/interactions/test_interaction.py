@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+MESSAGE: dict[str, Any] = {
+    "id": "5",
+    "type": 0,
+    "channel_id": "1",
+    "content": "hi",
+    "timestamp": "2022-01-01T00:00:00+00:00",
+    "author": {"id": "2", "username": "Rin", "discriminator": "0001"},
+}
+
+
+class TestInteraction:
+    def interaction(self, client: rin.GatewayClient) -> rin.Interaction:
+        data = {"id": "1", "application_id": "3", "token": "tok", "type": 2, "version": 1}
+        return rin.Interaction(client, data)
+
+    @pytest.mark.asyncio()
+    async def test_send_with_response(self) -> None:
+        async with FakeDiscord() as server:
+            body = {
+                "interaction": {"id": "1"},
+                "resource": {"type": 4, "message": MESSAGE},
+            }
+            server.respond("POST", "interactions/1/tok/callback", body)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            try:
+                message = await self.interaction(client).send("hi")
+            finally:
+                await client.rest.close()
+                rin.Message.cache.pop(message.snowflake)
+
+            assert message.content == "hi"
+            assert server.requests == [("POST", "interactions/1/tok/callback")]
+
+    @pytest.mark.asyncio()
+    async def test_send_fallback(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("POST", "interactions/1/tok/callback", None, status=204)
+            server.respond("GET", "webhooks/3/tok/messages/@original", MESSAGE)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            try:
+                message = await self.interaction(client).send("hi")
+            finally:
+                await client.rest.close()
+                rin.Message.cache.pop(message.snowflake)
+
+            assert message.snowflake == 5
+            assert server.requests[-1] == ("GET", "webhooks/3/tok/messages/@original")
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import re
+import time
+from unittest import mock
+
+import rin
+
+
+class TestComponentRegistry:
+    def test_default_custom_id(self) -> None:
+        first = rin.Button("First")
+        second = rin.Button("Second")
+
+        try:
+            assert first.custom_id != second.custom_id
+            assert rin.ComponentCache.cache.get(first.custom_id) is first
+            assert rin.ComponentCache.cache.get(second.custom_id) is second
+        finally:
+            rin.ComponentCache.cache.unregister(first)
+            rin.ComponentCache.cache.unregister(second)
+
+    def test_lru(self) -> None:
+        registry = rin.ComponentRegistry(2)
+        first, second, third = (rin.Button(str(i)) for i in range(3))
+
+        for button in (first, second, third):
+            rin.ComponentCache.cache.unregister(button)
+
+        registry.register(first)
+        registry.register(second)
+        registry.get(first.custom_id)
+        registry.register(third)
+
+        assert list(registry.root) == [first.custom_id, third.custom_id]
+        assert registry.len == 2
+
+    def test_timeout(self) -> None:
+        registry = rin.ComponentRegistry(None, timeout=10)
+        button = rin.Button("Expiring", timeout=10)
+        rin.ComponentCache.cache.unregister(button)
+
+        registry.register(button)
+        assert registry.get(button.custom_id) is button
+
+        with mock.patch.object(time, "monotonic", return_value=time.monotonic() + 11):
+            assert registry.get(button.custom_id) is None
+
+        assert registry.len == 0
+
+    def test_sweep_on_register(self) -> None:
+        registry = rin.ComponentRegistry(None)
+        persistent, expiring, other = (rin.Button(str(i)) for i in range(3))
+
+        for button in (persistent, expiring, other):
+            rin.ComponentCache.cache.unregister(button)
+
+        registry.register(persistent)
+        registry.register(expiring, timeout=10)
+
+        with mock.patch.object(time, "monotonic", return_value=time.monotonic() + 11):
+            registry.register(other)
+
+        assert list(registry.root) == [persistent.custom_id, other.custom_id]
+        assert registry.expires == {} and registry.deadlines == []
+
+    def test_persistent(self) -> None:
+        persistent = rin.Button("Persistent")
+
+        try:
+            assert rin.ComponentCache.cache.max is None
+
+            for i in range(1001):
+                rin.ComponentCache.cache.unregister(rin.Button(str(i)))
+
+            assert rin.ComponentCache.cache.get(persistent.custom_id) is persistent
+        finally:
+            rin.ComponentCache.cache.unregister(persistent)
+
+    def test_unregister(self) -> None:
+        registry = rin.ComponentRegistry(None)
+        button = rin.Button("Removed")
+        rin.ComponentCache.cache.unregister(button)
+
+        registry.register(button)
+
+        assert registry.unregister(button.custom_id) is button
+        assert registry.unregister(button) is None
+        assert registry.get(button.custom_id) is None
+
+    def test_route(self) -> None:
+        registry = rin.ComponentRegistry(None)
+        vote, pick = rin.Button("Vote"), rin.Button("Pick")
+        per_message = rin.Button("Per message", custom_id="vote:456")
+
+        for button in (vote, pick, per_message):
+            rin.ComponentCache.cache.unregister(button)
+
+        registry.route("vote:", vote)
+        registry.route(re.compile(r"pick:\d+"), pick)
+
+        assert registry.get("vote:123") is vote
+        assert registry.get("pick:5") is pick
+        assert registry.get("pick:x") is None
+
+        registry.register(per_message)
+        assert len(registry.root) == 0
+
+        assert registry.unroute("vote:") is vote
+        assert registry.get("vote:123") is None
+
+
+class TestSerialization:
+    def test_button(self) -> None:
+        button = rin.Button("Button")
+        rin.ComponentCache.cache.unregister(button)
+
+        payload = button.to_dict()
+        assert button.to_dict() is payload
+        assert button.to_json() is button.to_json()
+
+        button.disabled = True
+        assert button.to_dict()["disabled"] is True
+
+    def test_action_row(self) -> None:
+        button = rin.Button("Button")
+        rin.ComponentCache.cache.unregister(button)
+
+        row = rin.ActionRow()
+        row.add(button)
+
+        payload = row.to_dict()
+        assert row.to_dict() is payload
+
+        button.label = "Changed"
+        assert row.to_dict()["components"][0]["label"] == "Changed"
+
+        row.add(rin.Button("Other", custom_id="other"))
+        rin.ComponentCache.cache.unregister("other")
+        assert len(row.to_dict()["components"]) == 2
+
+    def test_allowed_mentions(self) -> None:
+        mentions = rin.AllowedMentions()
+        payload = mentions.to_dict()
+
+        assert mentions.to_dict() is payload
+
+        mentions.users = False
+        assert mentions.to_dict()["parse"] == ["roles"]
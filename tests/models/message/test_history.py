@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+
+def message(id: int) -> dict[str, Any]:
+    return {
+        "id": str(id),
+        "type": 0,
+        "channel_id": "1",
+        "content": f"Message {id}",
+        "timestamp": "2022-01-01T00:00:00+00:00",
+        "author": {"id": "2", "username": "Rin", "discriminator": "0001"},
+    }
+
+
+def messages(query: dict[str, str]) -> list[dict[str, Any]]:
+    # 250 messages, returned newest first like Discord does.
+    ids = range(250, 0, -1)
+
+    if "before" in query:
+        ids = [id for id in ids if id < int(query["before"])]
+
+    elif "after" in query:
+        ids = [id for id in ids if id > int(query["after"])][-int(query["limit"]) :]
+
+    return [message(id) for id in list(ids)[: int(query["limit"])]]
+
+
+class TestHistory:
+    @pytest.mark.asyncio()
+    async def test_history(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("GET", "channels/1/messages", messages)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            try:
+                history = rin.History(client, 1, limit=None)
+                snowflakes = [m.snowflake async for m in history]
+            finally:
+                await client.rest.close()
+
+            assert snowflakes == list(range(250, 0, -1))
+            assert server.requests == [("GET", "channels/1/messages")] * 3
+            assert rin.Message.cache.get(250) is None
+
+    @pytest.mark.asyncio()
+    async def test_after(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("GET", "channels/1/messages", messages)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            try:
+                history = rin.History(client, 1, limit=150, after=20, raw=True)
+                ids = [int(data["id"]) async for data in history]
+            finally:
+                await client.rest.close()
+
+            assert ids == list(range(21, 171))
+
+    @pytest.mark.asyncio()
+    async def test_cache(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("GET", "channels/1/messages", messages)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            history = rin.History(client, 1, limit=5, cache=True, prefetch=False)
+            fetched: list[rin.Message] = []
+
+            try:
+                fetched = [m async for m in history]
+                assert rin.Message.cache.get(250) is fetched[0]
+            finally:
+                await client.rest.close()
+
+                for m in fetched:
+                    rin.Message.cache.pop(m.snowflake)
+
+            assert len(fetched) == 5 and len(server.requests) == 1
+
+    def test_before_and_after(self) -> None:
+        client = rin.GatewayClient("DISCORD_TOKEN")
+
+        with pytest.raises(ValueError):
+            rin.History(client, 1, before=1, after=2)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+MESSAGE: dict[str, Any] = {
+    "id": "5",
+    "type": 0,
+    "channel_id": "1",
+    "content": "Hello",
+    "timestamp": "2022-01-01T00:00:00+00:00",
+    "author": {"id": "2", "username": "Rin", "discriminator": "0001"},
+}
+
+
+class TestReactions:
+    def test_quote(self) -> None:
+        assert rin.Message.quote("\N{THUMBS UP SIGN}") == "%F0%9F%91%8D"
+        assert rin.Message.quote("rin:123") == "rin:123"
+        assert rin.Message.quote("<:rin:123>") == "rin:123"
+        assert rin.Message.quote("<a:rin:123>") == "rin:123"
+
+    @pytest.mark.asyncio()
+    async def test_react_many(self) -> None:
+        emojis = ["\N{THUMBS UP SIGN}", "rin:123", "\N{HEAVY BLACK HEART}"]
+
+        async with FakeDiscord() as server:
+            for emoji in emojis:
+                path = f"channels/1/messages/5/reactions/{emoji}/@me"
+                server.respond("PUT", path, None, status=204)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+            client.rest.reactions.interval = 0.01
+
+            message = rin.Message(client, MESSAGE, cached=False)
+
+            try:
+                await message.react_many(*emojis, emojis[0])
+            finally:
+                await client.rest.close()
+
+        paths = [f"channels/1/messages/5/reactions/{emoji}/@me" for emoji in emojis]
+        assert server.requests == [("PUT", path) for path in paths]
+
+    @pytest.mark.asyncio()
+    async def test_remove_reactions(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("DELETE", "channels/1/messages/5/reactions/a/2", None, 204)
+            server.respond("DELETE", "channels/1/messages/5/reactions/b/2", {}, 404)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+            client.rest.reactions.interval = 0.05
+
+            message = rin.Message(client, MESSAGE, cached=False)
+
+            try:
+                with pytest.raises(rin.NotFound):
+                    await message.remove_reactions("a", "b", "c", user=2)
+            finally:
+                await client.rest.close()
+
+            await asyncio.sleep(0.1)
+
+        # The third reaction is cancelled once the second one fails.
+        assert [path for _, path in server.requests] == [
+            "channels/1/messages/5/reactions/a/2",
+            "channels/1/messages/5/reactions/b/2",
+        ]
+
+
+class TestPacer:
+    @pytest.mark.asyncio()
+    async def test_wait(self) -> None:
+        loop = asyncio.get_running_loop()
+        pacer = rin.Pacer(0.05)
+
+        waited = await asyncio.gather(*(pacer.wait(1, loop) for _ in range(3)))
+        assert waited[0] == 0
+        assert waited[1] == pytest.approx(0.05, abs=0.01)
+        assert waited[2] == pytest.approx(0.1, abs=0.01)
+
+        assert await pacer.wait(2, loop) == 0
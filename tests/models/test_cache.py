@@ -41,3 +41,23 @@ class TestCache:
 
         assert cached is not None
         assert cached.id == 1
+
+    def test_cache_pop(self) -> None:
+        cache = rin.Cache[FakeMessage](None)
+
+        cache.set(1, FakeMessage(1))
+        cache.set(1, FakeMessage(1))
+        assert cache.len == 1
+
+        cache.pop(1)
+        assert cache.len == 0
+
+    def test_cache_evict(self) -> None:
+        cache = rin.Cache[FakeMessage](None)
+
+        for i in range(5):
+            cache.set(i, FakeMessage(i))
+
+        assert cache.evict([0, 2, 4, 6]) == 3
+        assert list(cache.root) == [1, 3]
+        assert cache.len == 2
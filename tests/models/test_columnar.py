@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+import pytest
+
+import rin
+from rin.models.cacheable import CacheableMeta
+
+AVATAR = "a_" + "0123456789abcdef" * 2
+
+
+def user(id: int) -> dict[str, Any]:
+    return {
+        "id": str(id),
+        "username": f"User {id}",
+        "discriminator": "0042",
+        "avatar": AVATAR,
+        "banner": None,
+        "bot": id % 2 == 0,
+        "public_flags": 64,
+        "locale": "en-US",
+    }
+
+
+@pytest.fixture()
+def columnar() -> Iterator[tuple[rin.ColumnarCache, rin.ColumnarCache]]:
+    previous = CacheableMeta.caches["User"], CacheableMeta.caches["Member"]
+
+    try:
+        yield rin.ColumnarCache.install(rin.User), rin.ColumnarCache.install(rin.Member)
+    finally:
+        rin.User.__cache__ = CacheableMeta.caches["User"] = previous[0]
+        rin.Member.__cache__ = CacheableMeta.caches["Member"] = previous[1]
+
+
+class TestColumnarCache:
+    def test_user(self, columnar: tuple[rin.ColumnarCache, ...]) -> None:
+        users, _ = columnar
+        client = rin.GatewayClient("DISCORD_TOKEN")
+
+        created = rin.User(client, user(9001))
+        assert rin.User.cache.get(9001) is created
+
+        del created
+        gc.collect()
+
+        restored = rin.User.cache.get(9001)
+        assert restored is not None and restored is rin.User.cache.get(9001)
+        assert restored.username == "User 9001" and restored.discriminator == "0042"
+        assert restored.avatar == AVATAR and restored.banner is None
+        assert restored.bot is False and restored.public_flags == 64
+
+        # Keys without a column aren't stored.
+        assert restored.locale is None
+        assert users.hits == 3
+
+    def test_discriminator(self, columnar: tuple[rin.ColumnarCache, ...]) -> None:
+        client = rin.GatewayClient("DISCORD_TOKEN")
+        rin.User(client, {**user(9002), "discriminator": "0"})
+        gc.collect()
+
+        restored = rin.User.cache.get(9002)
+        assert restored is not None and restored.discriminator == "0"
+
+    def test_rows(self, columnar: tuple[rin.ColumnarCache, ...]) -> None:
+        users = rin.ColumnarCache(
+            2, model=rin.User, columns=rin.ColumnarCache.COLUMNS["User"]
+        )
+        rin.User.__cache__ = users
+        client = rin.GatewayClient("DISCORD_TOKEN")
+
+        for id in range(1, 4):
+            rin.User(client, user(id))
+
+        assert list(users.root) == [2, 3] and users.free == [0]
+
+        assert users.pop(2).username == "User 2"
+        assert users.evict([3, 4]) == 1
+        assert users.len == 0 and users.get(3) is None
+
+        rin.User(client, user(5))
+        # The freed rows are reused instead of growing the columns.
+        assert users.root[5] == 2 and users.rows == 3
+
+    def test_member(self, columnar: tuple[rin.ColumnarCache, ...]) -> None:
+        client = rin.GatewayClient("DISCORD_TOKEN")
+        data = {
+            "user": user(9007),
+            "roles": [],
+            "joined_at": "2022-01-01T00:00:00+00:00",
+            "deaf": False,
+            "mute": True,
+        }
+
+        rin.Member(client, data)
+        gc.collect()
+
+        member = rin.Member.cache.get(9007)
+        assert member is not None and member.user.username == "User 9007"
+        assert member.joined_at == datetime(2022, 1, 1, tzinfo=timezone.utc)
+        assert member.premium_since is None
+        assert (member.deaf, member.mute, member.pending) == (False, True, None)
+
+    @pytest.mark.asyncio()
+    async def test_member_guild(self, columnar: tuple[rin.ColumnarCache, ...]) -> None:
+        client = rin.GatewayClient("DISCORD_TOKEN")
+        guild = rin.Guild(client, {"id": "9100", "name": "Rin"})
+        data = {"user": user(9008), "roles": [], "joined_at": "2022-01-01T00:00:00+00:00"}
+
+        try:
+            chunk = {"guild_id": "9100", "members": [data]}
+            await client.gateway.parser.parse_guild_members_chunk(chunk)
+
+            guild.members = []
+            gc.collect()
+            assert 9008 not in columnar[1].live
+
+            member = rin.Member.cache.get(9008)
+            assert member is not None and member.guild is guild
+        finally:
+            rin.Guild.cache.pop(9100)
+
+    def test_memory(self, columnar: tuple[rin.ColumnarCache, ...]) -> None:
+        users, _ = columnar
+        client = rin.GatewayClient("DISCORD_TOKEN")
+        payload = json.dumps(user(0))
+
+        def measure(cache: rin.Cache[Any]) -> int:
+            rin.User.__cache__ = cache
+
+            gc.collect()
+            tracemalloc.start()
+
+            for id in range(10_000, 15_000):
+                rin.User(client, {**json.loads(payload), "id": str(id)})
+
+            gc.collect()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            return size
+
+        assert measure(users) * 4 < measure(rin.Cache[Any](None))
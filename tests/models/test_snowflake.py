@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+import rin
+from rin.models import snowflake as module
+
+# Created 2016-04-30 11:18:25.796 UTC, worker 1, process 0, increment 7.
+SNOWFLAKE = rin.Snowflake(175928847299117063)
+TIMESTAMP = 1462015105796
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request: Any, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(module, "numpy", None)
+
+    return str(request.param)
+
+
+class TestSnowflake:
+    def test_parts(self) -> None:
+        assert SNOWFLAKE.timestamp == TIMESTAMP
+        assert SNOWFLAKE.created_at == datetime(
+            2016, 4, 30, 11, 18, 25, 796000, tzinfo=timezone.utc
+        )
+        assert (SNOWFLAKE.worker_id, SNOWFLAKE.process_id) == (1, 0)
+        assert SNOWFLAKE.increment == 7
+
+    def test_from_datetime(self) -> None:
+        naive = datetime(2016, 4, 30, 11, 18, 25, 796000)
+        created = rin.Snowflake.from_datetime(naive)
+
+        assert created == SNOWFLAKE >> 22 << 22
+        assert rin.Snowflake.coerce(naive) == created
+        assert rin.Snowflake.coerce(None) is None
+
+    def test_timestamps(self, backend: str) -> None:
+        snowflakes = [SNOWFLAKE, rin.Snowflake.from_timestamp(1_600_000_000)]
+        timestamps = rin.snowflake_timestamps(snowflakes)
+
+        assert [int(t) for t in timestamps] == [TIMESTAMP, 1_600_000_000_000]
+
+    def test_deconstruct(self, backend: str) -> None:
+        parts = rin.deconstruct_snowflakes([SNOWFLAKE, SNOWFLAKE + 1])
+
+        assert [[int(p) for p in part] for part in parts] == [
+            [TIMESTAMP, TIMESTAMP],
+            [1, 1],
+            [0, 0],
+            [7, 8],
+        ]
+
+    def test_range(self) -> None:
+        after, before = rin.snowflake_range(1_600_000_000, 1_600_000_060)
+        inside = rin.Snowflake.from_timestamp(1_600_000_030)
+
+        assert after < rin.Snowflake.from_timestamp(1_600_000_000) <= inside < before
+
+    def test_bucket(self, backend: str) -> None:
+        snowflakes = [
+            rin.Snowflake.from_timestamp(1_600_000_130),
+            rin.Snowflake.from_timestamp(1_600_000_010),
+            rin.Snowflake.from_timestamp(1_600_000_070),
+            rin.Snowflake.from_timestamp(1_600_000_015),
+        ]
+        buckets = rin.bucket_snowflakes(snowflakes, 60)
+
+        assert {k: [int(s) for s in v] for k, v in buckets.items()} == {
+            1_599_999_960_000: [snowflakes[1], snowflakes[3]],
+            1_600_000_020_000: [snowflakes[2]],
+            1_600_000_080_000: [snowflakes[0]],
+        }
+
+        with pytest.raises(ValueError):
+            rin.bucket_snowflakes(snowflakes, 0)
+
+    def test_backends(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("numpy")
+
+        generator = random.Random(0)
+        snowflakes = [0, 2**64 - 1] + [generator.getrandbits(63) for _ in range(500)]
+
+        def run() -> list[Any]:
+            parts = rin.deconstruct_snowflakes(snowflakes)
+            buckets = rin.bucket_snowflakes(snowflakes, 60 * 60 * 24 * 30)
+
+            return [
+                [int(t) for t in rin.snowflake_timestamps(snowflakes)],
+                [[int(p) for p in part] for part in parts],
+                {k: [int(s) for s in v] for k, v in buckets.items()},
+            ]
+
+        vectorized = run()
+        monkeypatch.setattr(module, "numpy", None)
+
+        assert run() == vectorized
@@ -7,6 +7,7 @@ import aiohttp
 import pytest
 
 import rin
+from rin.testing import FakeDiscord
 
 
 class TestRESTClient:
@@ -20,14 +21,15 @@ class TestRESTClient:
             401: rin.Unauthorized,
             403: rin.Forbidden,
             404: rin.NotFound,
+            429: rin.TooManyRequests,
         }
 
         assert rest.token is not None and isinstance(rest.token, str)
         assert rest.client is not None and isinstance(rest.client, rin.GatewayClient)
 
-        assert rest.semaphores.get("global") is not None
-        assert isinstance(rest.semaphores["global"], asyncio.Semaphore)
-        assert rest.semaphores["global"]._value == 50
+        assert isinstance(rest.ratelimit, rin.GlobalRatelimit)
+        assert rest.ratelimit.rate == 50 and not rest.ratelimit.paused
+        assert rest.max_attempts == 5
 
         assert not hasattr(rest, "session")
 
@@ -57,3 +59,67 @@ class TestRESTClient:
 
             await rest.request("GET", rin.Route("test"))
             request_mock.assert_awaited()
+
+
+class TestRoute:
+    def test_template(self) -> None:
+        route = rin.Route(
+            "/channels/{channel_id}/messages/{message_id}", channel_id=1, message_id=2
+        )
+
+        assert route.path == "channels/1/messages/2"
+        assert route.endpoint == rin.Route.BASE.format(10) + "channels/1/messages/2"
+        assert route.channel_id == 1 and route.guild_id is None
+
+    def test_bucket(self) -> None:
+        template = "channels/{channel_id}/messages/{message_id}"
+
+        first = rin.Route(template, channel_id=1, message_id=2)
+        second = rin.Route(template, channel_id=1, message_id=3)
+        other = rin.Route(template, channel_id=4, message_id=2)
+
+        assert first.bucket == second.bucket
+        assert first.bucket != other.bucket
+
+    @pytest.mark.asyncio()
+    async def test_shared_state(self) -> None:
+        rest = rin.RESTClient("DISCORD_TOKEN", rin.GatewayClient("DISCORD_TOKEN"))
+        rest.client.loop = asyncio.get_running_loop()
+
+        template = "channels/{channel_id}/messages/{message_id}"
+        routes = [rin.Route(template, channel_id=1, message_id=i) for i in range(2)]
+
+        handlers = [rin.Ratelimiter(rest, route) for route in routes]
+        assert handlers[0].ensure("GET") is handlers[1].ensure("GET")
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio()
+    async def test_coalesce(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("GET", "users/@me", {"id": "1"})
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+            route = rin.Route("users/@me")
+
+            try:
+                results = await asyncio.gather(
+                    *(client.rest.request("GET", route) for _ in range(10))
+                )
+                assert results == [{"id": "1"}] * 10
+                assert len(server.requests) == 1
+                assert not client.rest.inflight
+
+                await asyncio.gather(
+                    *(client.rest.request("GET", route, coalesce=False) for _ in range(3))
+                )
+                assert len(server.requests) == 4
+
+                await asyncio.gather(
+                    client.rest.request("GET", route, params={"a": 1}),
+                    client.rest.request("GET", route, params={"a": 2}),
+                )
+                assert len(server.requests) == 6
+            finally:
+                await client.rest.close()
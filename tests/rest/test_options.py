@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+
+class TestHTTPOptions:
+    @pytest.mark.asyncio()
+    async def test_connector(self) -> None:
+        options = rin.HTTPOptions(limit=10, limit_per_host=5, keepalive_timeout=5)
+        connector = options.connector()
+
+        try:
+            assert connector.limit == 10
+            assert connector.limit_per_host == 5
+        finally:
+            await connector.close()
+
+    def test_client_timeout(self) -> None:
+        timeout = rin.HTTPOptions(timeout=30, connect_timeout=5).client_timeout()
+
+        assert timeout == aiohttp.ClientTimeout(total=30, connect=5)
+
+    @pytest.mark.asyncio()
+    async def test_session_reused(self) -> None:
+        async with FakeDiscord() as server:
+            options = rin.HTTPOptions(separate_gateway=True, timeout=5)
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api, http=options)
+            client.loop = asyncio.get_running_loop()
+
+            try:
+                await client.rest.request("GET", rin.Route("users/@me"))
+                session = client.rest.session
+
+                await client.rest.request("GET", rin.Route("users/@me"))
+                assert client.rest.session is session
+                assert session.timeout.total == 5
+
+                sock = await client.rest.connect(server.gateway)
+                assert client.rest.gateway_session is not None
+                assert client.rest.gateway_session is not session
+
+                await sock.close()
+            finally:
+                await client.rest.close()
+
+            assert session.closed and client.rest.gateway_session is None
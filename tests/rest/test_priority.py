@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import rin
+
+
+class TestPriorityLock:
+    async def run(
+        self, lock: rin.PriorityLock, order: list[str], name: str, priority: rin.Priority
+    ) -> None:
+        await lock.acquire(priority)
+
+        try:
+            order.append(name)
+            await asyncio.sleep(0)
+        finally:
+            lock.release()
+
+    @pytest.mark.asyncio()
+    async def test_order(self) -> None:
+        lock = rin.PriorityLock()
+        order: list[str] = []
+
+        await lock.acquire()
+        tasks = [
+            asyncio.create_task(self.run(lock, order, "low", rin.Priority.LOW)),
+            asyncio.create_task(self.run(lock, order, "normal", rin.Priority.NORMAL)),
+            asyncio.create_task(self.run(lock, order, "high", rin.Priority.HIGH)),
+        ]
+
+        await asyncio.sleep(0)
+        lock.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["high", "normal", "low"]
+        assert not lock.locked
+
+    @pytest.mark.asyncio()
+    async def test_aging(self) -> None:
+        lock = rin.PriorityLock(aging=0.05)
+        order: list[str] = []
+
+        await lock.acquire()
+        low = asyncio.create_task(self.run(lock, order, "low", rin.Priority.LOW))
+        await asyncio.sleep(0.15)
+
+        high = asyncio.create_task(self.run(lock, order, "high", rin.Priority.HIGH))
+        await asyncio.sleep(0)
+
+        lock.release()
+        await asyncio.gather(low, high)
+
+        assert order == ["low", "high"]
+
+    @pytest.mark.asyncio()
+    async def test_cancel(self) -> None:
+        lock = rin.PriorityLock()
+        await lock.acquire()
+
+        waiter = asyncio.create_task(lock.acquire(rin.Priority.HIGH))
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        lock.release()
+        assert not lock.locked
@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 
 import rin
+from rin.testing import FakeDiscord
 
 
 class TestRatelimiter:
@@ -34,20 +35,171 @@ class TestRatelimiter:
         assert ratelimiter.endpoint == ratelimiter.route.endpoint
         assert ratelimiter.bucket == ratelimiter.route.bucket
 
-    @pytest.mark.asyncio
-    async def test_ensure(self, ratelimiter: rin.Ratelimiter) -> None:
-        resp_mock = mock.MagicMock()
-        resp_mock.limit = 1
+    def test_ensure(self, ratelimiter: rin.Ratelimiter) -> None:
+        key = ratelimiter.key("GET")
+        bucket = ratelimiter.ensure("GET")
 
-        with mock.patch.object(
-            rin.RESTClient, "_request", return_value=resp_mock
-        ) as request_mock:
-            ret = await ratelimiter.ensure()
-            request_mock.assert_awaited_once()
-
-        assert ratelimiter.rest.semaphores[ratelimiter.bucket] is ret
-        assert ret is not None and isinstance(ret, asyncio.Semaphore)
-        assert ret._value == 1
+        assert ratelimiter.rest.buckets[key] is bucket
+        assert ratelimiter.ensure("GET") is bucket
+        assert not bucket.known and bucket.remaining == 1
 
     def test_get(self, ratelimiter: rin.Ratelimiter) -> None:
-        assert ratelimiter.get(ratelimiter.bucket) is None
+        assert ratelimiter.get(ratelimiter.key("GET")) is None
+
+    def test_discover(self, rest: rin.RESTClient, ratelimiter: rin.Ratelimiter) -> None:
+        bucket = ratelimiter.ensure("GET")
+        assert ratelimiter.discover("GET", bucket, "abc") is bucket
+        assert ratelimiter.key("GET") == f"abc:{ratelimiter.route.major}"
+
+        other = rin.Ratelimiter(rest, rin.Route("test/other"))
+        assert other.discover("GET", other.ensure("GET"), "abc") is bucket
+        assert list(rest.buckets) == [ratelimiter.key("GET")]
+
+    def test_discover_majors(self, rest: rin.RESTClient) -> None:
+        rest.client.loop = mock.MagicMock()
+        first, second, third = (
+            rin.Ratelimiter(rest, rin.Route("channels/{channel_id}", channel_id=id))
+            for id in range(1, 4)
+        )
+        buckets = [ratelimiter.ensure("GET") for ratelimiter in (first, second, third)]
+        shared = rest.buckets[f"abc:{third.route.major}"] = rin.Bucket()
+
+        assert first.discover("GET", buckets[0], "abc") is buckets[0]
+
+        # The temporary buckets of the other majors move to the hash too.
+        assert second.ensure("GET") is buckets[1] and not buckets[1].retired
+        assert third.ensure("GET") is shared and buckets[2].retired
+        assert len(rest.buckets) == 3
+
+    def test_prune(self, rest: rin.RESTClient, ratelimiter: rin.Ratelimiter) -> None:
+        ratelimiter.loop.time.return_value = 100.0
+        rest.max_buckets = 2
+
+        reset = rest.buckets["reset"] = rin.Bucket()
+        active = rest.buckets["active"] = rin.Bucket()
+        reset.known = active.known = True
+        active.reset_at = 160.0
+
+        bucket = ratelimiter.ensure("GET")
+        assert list(rest.buckets) == ["active", ratelimiter.key("GET")]
+        assert ratelimiter.ensure("GET") is bucket
+
+    @pytest.mark.asyncio()
+    async def test_single_round_trip(self) -> None:
+        async with FakeDiscord() as server:
+            server.ratelimit("GET", "users/@me", limit=5, reset_after=60, bucket="abc")
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            try:
+                for _ in range(3):
+                    await client.rest.request("GET", rin.Route("users/@me"))
+
+                await client.rest.request("DELETE", rin.Route("users/@me"), reason="r")
+            finally:
+                await client.rest.session.close()
+
+            assert server.requests == [("GET", "users/@me")] * 3 + [
+                ("DELETE", "users/@me")
+            ]
+
+            bucket = client.rest.buckets[f"abc:{rin.Route('users/@me').major}"]
+            assert bucket.known and bucket.limit == 5 and bucket.remaining == 2
+
+    @pytest.mark.asyncio()
+    async def test_shared_hash(self) -> None:
+        async with FakeDiscord() as server:
+            server.ratelimit(
+                "GET", "channels/1/pins", limit=5, reset_after=60, bucket="abc"
+            )
+            server.ratelimit("GET", "channels/1", limit=5, reset_after=60, bucket="abc")
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            try:
+                await client.rest.request(
+                    "GET", rin.Route("channels/{channel_id}/pins", channel_id=1)
+                )
+
+                # The first requests of a route sharing a known hash wait on a temporary
+                # bucket, which is dropped once the first response reveals the hash.
+                route = rin.Route("channels/{channel_id}", channel_id=1)
+                requests = [
+                    client.rest.request("GET", route, params={"page": str(page)})
+                    for page in range(2)
+                ]
+                await asyncio.wait_for(asyncio.gather(*requests), 1)
+            finally:
+                await client.rest.close()
+
+            assert list(client.rest.buckets) == [f"abc:{route.major}"]
+            assert client.rest.buckets[f"abc:{route.major}"].remaining == 2
+
+    @pytest.mark.asyncio()
+    async def test_encoded(self) -> None:
+        async with FakeDiscord() as server:
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+
+            embed = rin.EmbedBuilder(title="Encoded")
+
+            try:
+                await client.rest.request(
+                    "POST", rin.Route("channels/1/messages"), json=embed.to_json()
+                )
+            finally:
+                await client.rest.close()
+
+            assert server.bodies == [b'{"title":"Encoded"}']
+            assert server.types == ["application/json"]
+
+    @pytest.mark.asyncio()
+    async def test_global(self) -> None:
+        async with FakeDiscord() as server:
+            server.fail("GET", "users/@me", is_global=True, retry_after=0.2)
+
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api)
+            client.loop = asyncio.get_running_loop()
+            started = client.loop.time()
+
+            try:
+                await client.rest.request("GET", rin.Route("users/@me"))
+                assert client.loop.time() - started >= 0.2
+                assert not client.rest.ratelimit.paused
+
+                server.fail("GET", "users/@me", count=2, retry_after=0)
+                client.rest.max_attempts = 2
+
+                with pytest.raises(rin.TooManyRequests):
+                    await client.rest.request("GET", rin.Route("users/@me"))
+            finally:
+                await client.rest.session.close()
+
+
+class TestGlobalRatelimit:
+    @pytest.mark.asyncio()
+    async def test_acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        ratelimit = rin.GlobalRatelimit(rate=20)
+
+        started = loop.time()
+        await asyncio.gather(*(ratelimit.acquire(loop) for _ in range(25)))
+
+        assert loop.time() - started >= 0.2
+
+    @pytest.mark.asyncio()
+    async def test_pause(self) -> None:
+        loop = asyncio.get_running_loop()
+        ratelimit = rin.GlobalRatelimit()
+
+        ratelimit.pause(0.1, loop)
+        ratelimit.pause(0.05, loop)
+        assert ratelimit.paused
+
+        started = loop.time()
+        await ratelimit.acquire(loop)
+
+        assert loop.time() - started >= 0.09
+        assert not ratelimit.paused
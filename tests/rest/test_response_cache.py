@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+
+class TestResponseCache:
+    def test_put(self) -> None:
+        cache = rin.ResponseCache(ttl=10, maxsize=2, ttls={"users/{user_id}": 0})
+        route = rin.Route("users/@me")
+
+        assert cache.put("a", route, {}, {}) is not None
+        assert cache.put("b", route, {}, {"Cache-Control": "no-store"}) is None
+        assert cache.put("c", rin.Route("users/{user_id}", user_id=1), {}, {}) is None
+
+        # A disabled route isn't cached, even if the response allows it.
+        user = rin.Route("users/{user_id}", user_id=2)
+        assert cache.put("c", user, {}, {"Cache-Control": "max-age=60"}) is None
+
+        entry = cache.put("d", route, {}, {"Cache-Control": "no-cache", "ETag": "x"})
+        assert entry is not None and entry.etag == "x"
+        assert cache.get("d") is entry and cache.misses == 1
+
+        cache.put("e", route, {}, {"Cache-Control": "max-age=60"})
+        assert list(cache.entries) == ["d", "e"]
+
+    def test_invalidate(self) -> None:
+        cache = rin.ResponseCache()
+        channel = rin.Route("channels/{channel_id}", channel_id=1)
+        pins = rin.Route("channels/{channel_id}/pins", channel_id=1)
+
+        cache.put("channel", channel, {}, {})
+        cache.put("pins", pins, {}, {})
+        cache.put("other", rin.Route("channels/{channel_id}", channel_id=2), {}, {})
+
+        pin = rin.Route(
+            "channels/{channel_id}/pins/{message_id}", channel_id=1, message_id=3
+        )
+        assert cache.invalidate(pin) == 1
+        assert cache.invalidate(channel) == 1
+        assert list(cache.entries) == ["other"]
+
+    @pytest.mark.asyncio()
+    async def test_read_through(self) -> None:
+        async with FakeDiscord() as server:
+            headers = {"ETag": '"v1"', "Cache-Control": "no-cache"}
+            server.respond("GET", "channels/1", {"id": "1"})
+            server.respond("GET", "channels/2", {"id": "2"}, headers=headers)
+
+            cache = rin.ResponseCache(ttl=60)
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api, cache=cache)
+            client.loop = asyncio.get_running_loop()
+
+            first = rin.Route("channels/{channel_id}", channel_id=1)
+            second = rin.Route("channels/{channel_id}", channel_id=2)
+
+            try:
+                for _ in range(3):
+                    assert await client.rest.request("GET", first) == {"id": "1"}
+                    assert await client.rest.request("GET", second) == {"id": "2"}
+
+                assert server.requests.count(("GET", "channels/1")) == 1
+                assert server.requests.count(("GET", "channels/2")) == 3
+
+                await client.rest.request("PATCH", first, json={"name": "foo"})
+                await client.rest.request("GET", first)
+                assert server.requests.count(("GET", "channels/1")) == 2
+            finally:
+                await client.rest.close()
+
+    @pytest.mark.asyncio()
+    async def test_revalidate_headers(self) -> None:
+        async with FakeDiscord() as server:
+            headers = {"ETag": '"v1"', "Cache-Control": "no-cache"}
+            server.respond("GET", "channels/1", {"id": "1"}, headers=headers)
+
+            client = rin.GatewayClient(
+                "DISCORD_TOKEN", api=server.api, cache=rin.ResponseCache()
+            )
+            client.loop = asyncio.get_running_loop()
+            route = rin.Route("channels/{channel_id}", channel_id=1)
+
+            try:
+                for _ in range(2):
+                    data = await client.rest.request(
+                        "GET", route, headers={"X-Test": "1"}
+                    )
+            finally:
+                await client.rest.close()
+
+        assert data == {"id": "1"}
+        assert server.headers[1]["X-Test"] == "1"
+        assert server.headers[1]["If-None-Match"] == '"v1"'
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import aiohttp
+import pytest
+
+import rin
+
+
+class TestMetricsServer:
+    @pytest.mark.asyncio()
+    async def test_scrape(self) -> None:
+        registry = rin.Registry()
+        registry.counter("foo_total", "Foo.").inc()
+
+        server = rin.MetricsServer(registry, port=0)
+        await server.start()
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(server.url) as resp:
+                    assert resp.status == 200
+                    assert resp.headers["Content-Type"].startswith("text/plain")
+                    assert "foo_total 1" in await resp.text()
+        finally:
+            await server.close()
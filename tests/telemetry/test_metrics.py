@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+import rin
+
+
+class TestRegistry:
+    @pytest.fixture()
+    def registry(self) -> rin.Registry:
+        return rin.Registry()
+
+    def test_counter(self, registry: rin.Registry) -> None:
+        counter = registry.counter("foo_total", "Foo.", ("status",))
+        counter.inc(status=200)
+        counter.inc(2, status=200)
+
+        assert registry.counter("foo_total", "Foo.", ("status",)) is counter
+        assert counter.values == {("200",): 3}
+
+        with pytest.raises(ValueError):
+            counter.inc(bucket="foo")
+
+        with pytest.raises(ValueError):
+            registry.gauge("foo_total", "Foo.")
+
+    def test_render(self, registry: rin.Registry) -> None:
+        registry.counter("foo_total", "Foo.", ("name",)).inc(name='a"b')
+        registry.gauge("bar", "Bar.").set(0.5)
+        registry.histogram("baz_seconds", "Baz.", bounds=(1.0,)).observe(0.25)
+
+        assert registry.render() == "\n".join(
+            [
+                "# HELP foo_total Foo.",
+                "# TYPE foo_total counter",
+                'foo_total{name="a\\"b"} 1',
+                "# HELP bar Bar.",
+                "# TYPE bar gauge",
+                "bar 0.5",
+                "# HELP baz_seconds Baz.",
+                "# TYPE baz_seconds histogram",
+                'baz_seconds_bucket{le="1"} 1',
+                'baz_seconds_bucket{le="+Inf"} 1',
+                "baz_seconds_sum 0.25",
+                "baz_seconds_count 1",
+                "",
+            ]
+        )
+
+    def test_collector(self, registry: rin.Registry) -> None:
+        @registry.collector
+        def collect() -> list[rin.Metric[float]]:
+            gauge = rin.Gauge("qux", "Qux.")
+            gauge.set(1)
+
+            return [gauge]
+
+        assert "qux 1" in registry.render()
+
+    def test_client(self) -> None:
+        client = rin.GatewayClient("DISCORD_TOKEN")
+        rendered = client.metrics.render()
+
+        assert "rin_gateway_latency_seconds +Inf" in rendered
+        assert 'rin_cache_size{cache="User"}' in rendered
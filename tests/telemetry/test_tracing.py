@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import rin
+
+
+class TestTracer:
+    @pytest.fixture()
+    def exporter(self) -> rin.InMemoryExporter:
+        return rin.InMemoryExporter()
+
+    def test_disabled(self) -> None:
+        tracer = rin.Tracer()
+
+        with tracer.span("foo") as span:
+            span.set("bar", 1)
+
+        assert tracer.enabled is False
+        assert not isinstance(span, rin.Span)
+        assert tracer.span("baz") is span
+
+    def test_nesting(self, exporter: rin.InMemoryExporter) -> None:
+        tracer = rin.Tracer(exporter)
+
+        with tracer.span("parent", foo="bar") as parent:
+            with tracer.span("child") as child:
+                assert rin.Tracer.current() is child
+
+        assert rin.Tracer.current() is None
+        assert exporter.spans == [child, parent]
+
+        assert isinstance(parent, rin.Span) and isinstance(child, rin.Span)
+        assert child.parent is parent
+        assert child.trace_id == parent.trace_id
+        assert parent.attributes == {"foo": "bar"}
+        assert parent.duration >= child.duration >= 0
+
+    def test_error(self, exporter: rin.InMemoryExporter) -> None:
+        tracer = rin.Tracer(exporter)
+
+        with pytest.raises(RuntimeError):
+            with tracer.span("foo"):
+                raise RuntimeError
+
+        assert isinstance(exporter.spans[0].error, RuntimeError)
+
+    @pytest.mark.asyncio()
+    async def test_dispatch(self, exporter: rin.InMemoryExporter) -> None:
+        client = rin.GatewayClient("DISCORD_TOKEN", tracer=rin.Tracer(exporter))
+        client.loop = client.gateway.loop = asyncio.get_running_loop()
+
+        @rin.Events.TYPING_START.on()
+        async def listener(_: dict[Any, Any]) -> None:
+            ...
+
+        try:
+            task = await client.gateway.dispatch({"t": "TYPING_START", "d": {}})
+            await task
+            await asyncio.sleep(0)
+        finally:
+            rin.Events.TYPING_START.listeners.remove(listener)
+
+        (dispatch,) = exporter.named("gateway.dispatch")
+        (span,) = exporter.named("listener")
+
+        assert dispatch.attributes == {"event": "TYPING_START"}
+        assert span.parent is dispatch
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Any
+
+import aiohttp
+import pytest
+
+import rin
+from rin.testing import FakeDiscord
+
+
+class TestFakeDiscord:
+    # pyright: reportUnknownMemberType=false
+
+    @pytest.mark.asyncio()
+    async def test_gateway(self) -> None:
+        received: list[dict[Any, Any]] = []
+
+        @rin.Events.TYPING_START.on()
+        async def listener(data: dict[Any, Any]) -> None:
+            received.append(data)
+
+        async with FakeDiscord(heartbeat_interval=50) as server:
+            client = rin.GatewayClient("DISCORD_TOKEN", api=server.api, no_chunk=True)
+            client.loop = client.gateway.loop = asyncio.get_running_loop()
+
+            task = client.loop.create_task(client.gateway.start())
+
+            try:
+                user = await asyncio.wait_for(rin.Events.READY.wait(), 5)
+                assert isinstance(user, rin.User)
+                assert client.gateway.session == server.session
+
+                await server.storm("TYPING_START", {"foo": "bar"}, 50)
+
+                while len(received) < 50 or math.isinf(client.gateway.latency):
+                    await asyncio.sleep(0.01)
+
+                assert server.received[0]["op"] == 2
+                assert any(payload["op"] == 1 for payload in server.received)
+            finally:
+                rin.Events.TYPING_START.listeners.remove(listener)
+
+                await client.gateway.close()
+                await client.rest.session.close()
+
+                client.gateway.pacemaker.cancel()
+                task.cancel()
+
+    @pytest.mark.asyncio()
+    async def test_rest(self) -> None:
+        async with FakeDiscord() as server:
+            server.respond("GET", "users/@me", {"id": "1"})
+            server.ratelimit("GET", "users/@me", limit=1, reset_after=60, bucket="abc")
+            server.fail("POST", "channels/1/messages", is_global=True, retry_after=60)
+
+            url = server.api.format(10)
+
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url + "users/@me") as resp:
+                    assert resp.status == 200
+                    assert await resp.json() == {"id": "1"}
+
+                    assert resp.headers["X-RateLimit-Remaining"] == "0"
+                    assert resp.headers["X-RateLimit-Bucket"] == "abc"
+
+                async with session.get(url + "users/@me") as resp:
+                    assert resp.status == 429
+                    assert resp.headers["X-RateLimit-Scope"] == "user"
+
+                async with session.post(url + "channels/1/messages") as resp:
+                    assert resp.status == 429
+                    assert resp.headers["X-RateLimit-Global"] == "true"
+
+                async with session.get(url + "channels/2") as resp:
+                    assert resp.status == 429
+                    assert (await resp.json())["global"] is True
+
+            assert server.requests[0] == ("GET", "users/@me")
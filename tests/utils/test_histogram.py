@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from rin.utils import Histogram
+
+
+class TestHistogram:
+    def test_observe(self) -> None:
+        histogram = Histogram((1.0, 2.0))
+
+        for value in (0.5, 1.0, 1.5, 3.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.sum == 6.0
+        assert histogram.cumulative() == [(1.0, 2), (2.0, 3), (float("inf"), 4)]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import rin
+from rin.utils import data_uri, mime_type
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+
+class TestMedia:
+    def test_mime_type(self) -> None:
+        assert mime_type(PNG) == "image/png"
+        assert mime_type(b"\xff\xd8\xff\xe0") == "image/jpeg"
+        assert mime_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+        assert mime_type(b"plain text") == "text/plain"
+
+    def test_data_uri(self) -> None:
+        uri = data_uri(PNG)
+
+        assert uri.startswith("data:image/png;base64,")
+        assert base64.b64decode(uri.split(",", 1)[1]) == PNG
+
+    @pytest.mark.asyncio()
+    async def test_run_blocking(self) -> None:
+        with ThreadPoolExecutor(1) as executor:
+            client = rin.GatewayClient("DISCORD_TOKEN", executor=executor)
+            client.loop = asyncio.get_running_loop()
+
+            assert await client.run_blocking(data_uri, PNG, mime="image/x") == (
+                "data:image/x;base64," + base64.b64encode(PNG).decode()
+            )